@@ -92,7 +92,8 @@ window.dash_clientside = Object.assign({}, window.dash_clientside, {
              * Helper function to compute visibility styles based on y_var.
              *
              * @param {string} yVar The selected y-axis variable.
-             *   Compared against Python enum YVar values: PRICE, ROLLING_RETURNS, CALENDAR_RETURNS.
+             *   Compared against Python enum YVar values: PRICE, DRAWDOWN, ROLLING_RETURNS,
+             *   CALENDAR_RETURNS.
              * @returns {Array} Array of style objects for containers.
              */
             function (yVar) {
@@ -100,6 +101,7 @@ window.dash_clientside = Object.assign({}, window.dash_clientside, {
                 var hide = { display: "none" };
 
                 var priceVisibility = yVar === "price" ? show : hide;
+                var drawdownSelectionStyle = yVar === "drawdown" ? show : hide;
                 var returnSelectionStyle =
                     yVar === "rolling_returns" || yVar === "calendar_returns"
                         ? show
@@ -114,6 +116,7 @@ window.dash_clientside = Object.assign({}, window.dash_clientside, {
                     returnSelectionStyle,
                     rollingReturnSelectionStyle,
                     calendarReturnSelectionStyle,
+                    drawdownSelectionStyle,
                 ];
             },
 
@@ -140,6 +143,18 @@ window.dash_clientside = Object.assign({}, window.dash_clientside, {
             function (presentation) {
                 return { display: presentation === "dist" ? "block" : "none" };
             },
+
+        updateRebalancingBandVisibility:
+            /**
+             * Shows rebalancing band input for threshold rebalancing.
+             *
+             * @param {string} rebalancing The selected rebalancing option.
+             *   Compared against Python enum Rebalancing.THRESHOLD.
+             * @returns {Object} Style object for the container.
+             */
+            function (rebalancing) {
+                return { display: rebalancing === "threshold" ? "block" : "none" };
+            },
     },
     options: {
         updateSecuritySelectionOptions:
@@ -0,0 +1,86 @@
+import statistics
+import sys
+import time
+from itertools import cycle
+
+import plotly.io as pio
+from plotly.colors import DEFAULT_PLOTLY_COLORS
+from pydantic import TypeAdapter
+
+from models import (
+    Currency,
+    DistributionChartType,
+    Interval,
+    MSCICountryIndex,
+    MSCIRegionalIndex,
+    MSCISize,
+    MSCIStyle,
+    ReturnAnnualisation,
+    ReturnDuration,
+    ReturnInterval,
+    RollingReturnsPresentation,
+    TaxTreatment,
+    YVar,
+)
+from schemas import MsciSecurity
+from update_graph import GraphParams
+
+BENCHMARK_INDICES = [
+    MSCIRegionalIndex.WORLD,
+    MSCIRegionalIndex.ACWI,
+    MSCIRegionalIndex.EMERGING_MARKETS,
+    MSCIRegionalIndex.WORLD_EX_USA,
+    MSCIRegionalIndex.EUROPE,
+    MSCICountryIndex.JAPAN,
+    MSCICountryIndex.SINGAPORE,
+    MSCICountryIndex.AUSTRALIA,
+    MSCICountryIndex.CANADA,
+    MSCICountryIndex.FRANCE,
+]
+
+
+def get_benchmark_holdings() -> list[str]:
+    return [
+        MsciSecurity(
+            msci_base_index=index,
+            msci_size=MSCISize.STANDARD,
+            msci_style=MSCIStyle.BLEND,
+            msci_tax_treatment=TaxTreatment.NET,
+        ).model_dump_json()
+        for index in BENCHMARK_INDICES
+    ]
+
+
+def time_figure(graph_params: GraphParams) -> tuple[float, float, int]:
+    start = time.perf_counter()
+    data, layout = graph_params.update_graph()
+    figure = {"data": data, "layout": layout.to_plotly_json()}
+    built = time.perf_counter()
+    figure_json = pio.to_json(figure, validate=False) or ""
+    return built - start, time.perf_counter() - built, len(figure_json)
+
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    holdings = get_benchmark_holdings()
+    graph_params = TypeAdapter(GraphParams).validate_python(
+        {
+            "holdings": holdings,
+            "trace_colourmap": dict(zip(holdings, cycle(DEFAULT_PLOTLY_COLORS))),
+            "currency": Currency.USD,
+            "adjust_for_inflation": False,
+            "y_var": YVar.ROLLING_RETURNS,
+            "interval": Interval.DAILY,
+            "return_duration": ReturnDuration.DURATION_1MO,
+            "return_interval": ReturnInterval.ANNUAL,
+            "return_annualisation": ReturnAnnualisation.CUMULATIVE,
+            "baseline_trace": "None",
+            "rolling_returns_presentation": RollingReturnsPresentation.TIMESERIES,
+            "rolling_returns_distribution_chart_type": DistributionChartType.HISTOGRAM,
+            "uirevision": "",
+        }
+    )
+    timings = [time_figure(graph_params) for _ in range(runs)]
+    print(f"10-series daily rolling returns, {timings[0][2] / 1e6:.1f}MB of JSON")
+    print(f"Build figure: median {statistics.median([t[0] for t in timings]):.3f}s")
+    print(f"Serialise figure: median {statistics.median([t[1] for t in timings]):.3f}s")
@@ -0,0 +1,36 @@
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+IMPORT_SNIPPET = (
+    "import time\n"
+    "start = time.perf_counter()\n"
+    "import returns_dashboard\n"
+    "print(time.perf_counter() - start)\n"
+)
+
+
+def time_import(env: dict[str, str]) -> float:
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SNIPPET],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout.splitlines()[-1])
+
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env = {**os.environ, "NUMBA_CACHE_DIR": cache_dir}
+        cold = time_import(env)
+        warm = [time_import(env) for _ in range(runs)]
+    print(f"Cold start (kernels compiled): {cold:.2f}s")
+    print(
+        f"Warm start (kernels loaded from cache): median {statistics.median(warm):.2f}s, "
+        f"min {min(warm):.2f}s over {runs} runs"
+    )
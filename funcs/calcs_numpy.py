@@ -1,9 +1,12 @@
 import numpy as np
-from numba import bool_, float64, int64, njit
+from numba import bool_, float64, int64, njit, prange, void
+from numba.core.types import UniTuple
 
 
 @njit(
-    float64[:, :](
+    void(
+        float64[:],
+        float64[:],
         float64[:],
         int64,
         int64,
@@ -13,11 +16,256 @@ from numba import bool_, float64, int64, njit
         bool_,
         float64,
         float64,
+        bool_,
+        float64[:],
+    ),
+    cache=True,
+)
+def _simulate_dca_path(
+    sample_monthly_returns: np.ndarray,
+    sample_cpi: np.ndarray,
+    sample_cash_returns: np.ndarray,
+    dca_duration: int,
+    dca_interval: int,
+    strategy_horizon: int,
+    initial_portfolio_value: float,
+    initial_monthly_amount: float,
+    adjust_monthly_investment_for_inflation: bool,
+    variable_transaction_fees: float,
+    fixed_transaction_fees: float,
+    adjust_portfolio_value_for_inflation: bool,
+    out: np.ndarray,
+):
+    sample_cpi_mom = sample_cpi / np.roll(sample_cpi, 1)
+    out[0] = initial_portfolio_value
+    share_value = initial_portfolio_value
+    funds_to_invest = 0.0
+
+    monthly_amount = initial_monthly_amount
+
+    for j in range(1, dca_duration + 1):
+        share_value *= sample_monthly_returns[j]
+        if (j > 1) and adjust_monthly_investment_for_inflation:
+            monthly_amount *= sample_cpi_mom[j]
+        funds_to_invest += monthly_amount
+        if (j % dca_interval == 0) or (j == dca_duration):
+            share_value += (
+                funds_to_invest * (1 - variable_transaction_fees)
+                - fixed_transaction_fees
+            )
+            funds_to_invest = 0.0
+        else:
+            funds_to_invest *= 1 + sample_cash_returns[j]
+        out[j] = share_value + funds_to_invest
+    for j in range(dca_duration + 1, strategy_horizon + 1):
+        share_value *= sample_monthly_returns[j]
+        out[j] = share_value
+    if adjust_portfolio_value_for_inflation:
+        out /= sample_cpi / sample_cpi[0]
+
+
+@njit(
+    void(
+        float64[:],
+        float64[:],
+        int64,
+        int64,
+        int64,
+        float64,
+        float64,
         float64,
+        float64,
+        bool_,
         bool_,
         float64[:],
+    ),
+    cache=True,
+)
+def _simulate_withdrawal_path(
+    sample_monthly_returns: np.ndarray,
+    sample_cpi: np.ndarray,
+    coast_duration: int,
+    strategy_horizon: int,
+    withdrawal_interval: int,
+    initial_portfolio_value: float,
+    initial_withdrawal_amount: float,
+    variable_transaction_fees: float,
+    fixed_transaction_fees: float,
+    adjust_withdrawals_for_inflation: bool,
+    adjust_portfolio_value_for_inflation: bool,
+    out: np.ndarray,
+):
+    sample_cpi_mom = sample_cpi / np.roll(sample_cpi, 1)
+    out[0] = initial_portfolio_value
+    share_value = initial_portfolio_value
+    withdrawal_amount = initial_withdrawal_amount
+    for j in range(1, coast_duration + 1):
+        share_value *= sample_monthly_returns[j]
+        if adjust_withdrawals_for_inflation:
+            withdrawal_amount *= sample_cpi_mom[j]
+        out[j] = share_value
+    for index, j in enumerate(range(coast_duration + 1, strategy_horizon + 1)):
+        share_value *= sample_monthly_returns[j]
+        if adjust_withdrawals_for_inflation:
+            withdrawal_amount *= sample_cpi_mom[j]
+        if index % withdrawal_interval == 0:
+            share_value -= (
+                withdrawal_amount * (1 + variable_transaction_fees)
+                + fixed_transaction_fees
+            )
+            if share_value <= 0:
+                out[j:] = 0
+                break
+        out[j] = share_value
+    if adjust_portfolio_value_for_inflation:
+        out /= sample_cpi / sample_cpi[0]
+
+
+@njit(UniTuple(float64, 2)(float64[:]), cache=True)
+def _max_drawdown(path: np.ndarray):
+    running_max = path[0]
+    max_percent_dd = 0.0
+    max_dollar_dd = 0.0
+    for t in range(1, len(path)):
+        value = path[t]
+        if np.isnan(value):
+            break
+        if value > running_max:
+            running_max = value
+        dollar_dd = value - running_max
+        if dollar_dd < max_dollar_dd:
+            max_dollar_dd = dollar_dd
+        if running_max > 0:
+            percent_dd = value / running_max - 1
+            if percent_dd < max_percent_dd:
+                max_percent_dd = percent_dd
+    return max_percent_dd, max_dollar_dd
+
+
+@njit(void(float64[:], float64[:]), cache=True)
+def _summarise_path(path: np.ndarray, out: np.ndarray):
+    out[0] = path[-1]
+    out[1], out[2] = _max_drawdown(path)
+    out[3] = np.nan
+    for t in range(1, len(path)):
+        if path[t] <= 0 < path[t - 1]:
+            out[3] = t
+            break
+    out[4] = path.min()
+
+
+@njit(
+    float64(
         float64[:],
+        float64[:],
+        int64,
+        int64,
+        int64,
+        float64,
+        float64,
+        float64,
+        bool_,
+        float64,
+        float64[:],
+    ),
+    cache=True,
+)
+def _solve_max_monthly_withdrawal(
+    sample_monthly_returns: np.ndarray,
+    sample_cpi: np.ndarray,
+    coast_duration: int,
+    strategy_horizon: int,
+    withdrawal_interval: int,
+    initial_portfolio_value: float,
+    variable_transaction_fees: float,
+    fixed_transaction_fees: float,
+    adjust_withdrawals_for_inflation: bool,
+    tolerance: float,
+    path: np.ndarray,
+):
+    # The ending value falls monotonically as the withdrawal grows, so the largest
+    # monthly withdrawal that never depletes the portfolio can be bisected
+    if strategy_horizon <= coast_duration:
+        return np.inf
+    lower = 0.0
+    upper = max(initial_portfolio_value, 1.0)
+    _simulate_withdrawal_path(
+        sample_monthly_returns,
+        sample_cpi,
+        coast_duration,
+        strategy_horizon,
+        withdrawal_interval,
+        initial_portfolio_value,
+        lower,
+        variable_transaction_fees,
+        fixed_transaction_fees,
+        adjust_withdrawals_for_inflation,
+        False,
+        path,
     )
+    if np.isnan(path[strategy_horizon]):
+        return np.nan
+    if path[strategy_horizon] <= 0:
+        return 0.0
+    while True:
+        _simulate_withdrawal_path(
+            sample_monthly_returns,
+            sample_cpi,
+            coast_duration,
+            strategy_horizon,
+            withdrawal_interval,
+            initial_portfolio_value,
+            upper * withdrawal_interval,
+            variable_transaction_fees,
+            fixed_transaction_fees,
+            adjust_withdrawals_for_inflation,
+            False,
+            path,
+        )
+        if not path[strategy_horizon] > 0:
+            break
+        lower = upper
+        upper *= 2
+    while upper - lower > tolerance:
+        mid = (lower + upper) / 2
+        _simulate_withdrawal_path(
+            sample_monthly_returns,
+            sample_cpi,
+            coast_duration,
+            strategy_horizon,
+            withdrawal_interval,
+            initial_portfolio_value,
+            mid * withdrawal_interval,
+            variable_transaction_fees,
+            fixed_transaction_fees,
+            adjust_withdrawals_for_inflation,
+            False,
+            path,
+        )
+        if path[strategy_horizon] > 0:
+            lower = mid
+        else:
+            upper = mid
+    return lower
+
+
+@njit(
+    float64[:, :](
+        float64[:],
+        int64,
+        int64,
+        int64,
+        float64,
+        float64,
+        bool_,
+        float64,
+        float64,
+        float64,
+        bool_,
+        float64[:],
+        float64[:],
+    ),
+    cache=True,
 )
 def calculate_dca_portfolio_value_with_fees_and_interest_vector(
     monthly_returns: np.ndarray,
@@ -35,40 +283,195 @@ def calculate_dca_portfolio_value_with_fees_and_interest_vector(
     cash_returns: np.ndarray,
 ):
     res = np.full((monthly_returns.shape[0], strategy_horizon + 1), np.nan)
-    res[strategy_horizon:, 0] = initial_portfolio_value
     monthly_returns_with_fees = (1 + monthly_returns) * (
         1 - annualised_holding_fees
     ) ** (1 / 12)
     for i in range(strategy_horizon, len(monthly_returns)):
         sample_slice = slice(i - strategy_horizon, i + 1)
-        sample_monthly_returns = monthly_returns_with_fees[sample_slice]
-        sample_cash_returns = cash_returns[sample_slice]
-        sample_cpi = cpi[sample_slice]
-        sample_cpi_mom = sample_cpi / np.roll(sample_cpi, 1)
-        share_value = initial_portfolio_value
-        funds_to_invest = 0
+        _simulate_dca_path(
+            monthly_returns_with_fees[sample_slice],
+            cpi[sample_slice],
+            cash_returns[sample_slice],
+            dca_duration,
+            dca_interval,
+            strategy_horizon,
+            initial_portfolio_value,
+            initial_monthly_amount,
+            adjust_monthly_investment_for_inflation,
+            variable_transaction_fees,
+            fixed_transaction_fees,
+            adjust_portfolio_value_for_inflation,
+            res[i],
+        )
+    return res
 
-        monthly_amount = initial_monthly_amount
 
-        for j in range(1, dca_duration + 1):
-            share_value *= sample_monthly_returns[j]
-            if (j > 1) and adjust_monthly_investment_for_inflation:
-                monthly_amount *= sample_cpi_mom[j]
-            funds_to_invest += monthly_amount
-            if (j % dca_interval == 0) or (j == dca_duration):
-                share_value += (
-                    funds_to_invest * (1 - variable_transaction_fees)
-                    - fixed_transaction_fees
-                )
-                funds_to_invest = 0
-            else:
-                funds_to_invest *= 1 + sample_cash_returns[j]
-            res[i, j] = share_value + funds_to_invest
-        for j in range(dca_duration + 1, strategy_horizon + 1):
-            share_value *= sample_monthly_returns[j]
-            res[i, j] = share_value
-        if adjust_portfolio_value_for_inflation:
-            res[i] /= sample_cpi / sample_cpi[0]
+@njit(
+    float64[:](
+        int64,
+        float64[:],
+        int64,
+        int64,
+        int64,
+        float64,
+        float64,
+        bool_,
+        float64,
+        float64,
+        float64,
+        bool_,
+        float64[:],
+        float64[:],
+    ),
+    cache=True,
+)
+def calculate_dca_portfolio_value_path(
+    start_index: int,
+    monthly_returns: np.ndarray,
+    dca_duration: int,
+    dca_interval: int,
+    strategy_horizon: int,
+    initial_portfolio_value: float,
+    initial_monthly_amount: float,
+    adjust_monthly_investment_for_inflation: bool,
+    variable_transaction_fees: float,
+    fixed_transaction_fees: float,
+    annualised_holding_fees: float,
+    adjust_portfolio_value_for_inflation: bool,
+    cpi: np.ndarray,
+    cash_returns: np.ndarray,
+):
+    sample_slice = slice(start_index, start_index + strategy_horizon + 1)
+    res = np.empty(strategy_horizon + 1)
+    _simulate_dca_path(
+        (1 + monthly_returns[sample_slice]) * (1 - annualised_holding_fees) ** (1 / 12),
+        cpi[sample_slice],
+        cash_returns[sample_slice],
+        dca_duration,
+        dca_interval,
+        strategy_horizon,
+        initial_portfolio_value,
+        initial_monthly_amount,
+        adjust_monthly_investment_for_inflation,
+        variable_transaction_fees,
+        fixed_transaction_fees,
+        adjust_portfolio_value_for_inflation,
+        res,
+    )
+    return res
+
+
+@njit(
+    float64[:, :](
+        float64[:],
+        int64,
+        int64,
+        int64,
+        float64,
+        float64,
+        bool_,
+        float64,
+        float64,
+        float64,
+        bool_,
+        float64[:],
+        float64[:],
+    ),
+    cache=True,
+)
+def summarise_dca_portfolio_value_with_fees_and_interest_vector(
+    monthly_returns: np.ndarray,
+    dca_duration: int,
+    dca_interval: int,
+    strategy_horizon: int,
+    initial_portfolio_value: float,
+    initial_monthly_amount: float,
+    adjust_monthly_investment_for_inflation: bool,
+    variable_transaction_fees: float,
+    fixed_transaction_fees: float,
+    annualised_holding_fees: float,
+    adjust_portfolio_value_for_inflation: bool,
+    cpi: np.ndarray,
+    cash_returns: np.ndarray,
+):
+    res = np.full((monthly_returns.shape[0], 5), np.nan)
+    path = np.empty(strategy_horizon + 1)
+    monthly_returns_with_fees = (1 + monthly_returns) * (
+        1 - annualised_holding_fees
+    ) ** (1 / 12)
+    for i in range(strategy_horizon, len(monthly_returns)):
+        sample_slice = slice(i - strategy_horizon, i + 1)
+        _simulate_dca_path(
+            monthly_returns_with_fees[sample_slice],
+            cpi[sample_slice],
+            cash_returns[sample_slice],
+            dca_duration,
+            dca_interval,
+            strategy_horizon,
+            initial_portfolio_value,
+            initial_monthly_amount,
+            adjust_monthly_investment_for_inflation,
+            variable_transaction_fees,
+            fixed_transaction_fees,
+            adjust_portfolio_value_for_inflation,
+            path,
+        )
+        _summarise_path(path, res[i])
+    return res
+
+
+@njit(
+    float64[:, :, :](
+        float64[:],
+        float64[:],
+        float64[:],
+        int64[:],
+        int64[:],
+        int64[:],
+        float64[:],
+        float64[:],
+        bool_[:],
+        float64[:],
+        float64[:],
+        float64[:],
+        bool_[:],
+    ),
+    parallel=True,
+    cache=True,
+)
+def summarise_dca_portfolio_value_batch(
+    monthly_returns: np.ndarray,
+    cpi: np.ndarray,
+    cash_returns: np.ndarray,
+    dca_durations: np.ndarray,
+    dca_intervals: np.ndarray,
+    strategy_horizons: np.ndarray,
+    initial_portfolio_values: np.ndarray,
+    initial_monthly_amounts: np.ndarray,
+    adjust_monthly_investment_for_inflation: np.ndarray,
+    variable_transaction_fees: np.ndarray,
+    fixed_transaction_fees: np.ndarray,
+    annualised_holding_fees: np.ndarray,
+    adjust_portfolio_value_for_inflation: np.ndarray,
+):
+    num_strategies = len(strategy_horizons)
+    res = np.empty((num_strategies, len(monthly_returns), 5))
+    for k in prange(num_strategies):
+        res[k] = summarise_dca_portfolio_value_with_fees_and_interest_vector(
+            monthly_returns,
+            dca_durations[k],
+            dca_intervals[k],
+            strategy_horizons[k],
+            initial_portfolio_values[k],
+            initial_monthly_amounts[k],
+            adjust_monthly_investment_for_inflation[k],
+            variable_transaction_fees[k],
+            fixed_transaction_fees[k],
+            annualised_holding_fees[k],
+            adjust_portfolio_value_for_inflation[k],
+            cpi,
+            cash_returns,
+        )
     return res
 
 
@@ -86,7 +489,8 @@ def calculate_dca_portfolio_value_with_fees_and_interest_vector(
         float64,
         bool_,
         bool_,
-    )
+    ),
+    cache=True,
 )
 def calculate_withdrawal_portfolio_value_with_fees_vector(
     monthly_returns: np.ndarray,
@@ -107,38 +511,239 @@ def calculate_withdrawal_portfolio_value_with_fees_vector(
         1 - annualised_holding_fees
     ) ** (1 / 12)
     res = np.full((monthly_returns.shape[0], strategy_horizon + 1), np.nan)
-    res[strategy_horizon:, 0] = initial_portfolio_value
     for i in range(strategy_horizon, len(monthly_returns)):
         sample_slice = slice(i - strategy_horizon, i + 1)
-        sample_monthly_returns = monthly_returns_with_fees[sample_slice]
-        sample_cpi = cpi[sample_slice]
-        sample_cpi_mom = sample_cpi / np.roll(sample_cpi, 1)
-        share_value = initial_portfolio_value
-        withdrawal_amount = initial_withdrawal_amount
-        for j in range(1, coast_duration + 1):
-            share_value *= sample_monthly_returns[j]
-            if adjust_withdrawals_for_inflation:
-                withdrawal_amount *= sample_cpi_mom[j]
-            res[i, j] = share_value
-        for index, j in enumerate(range(coast_duration + 1, strategy_horizon + 1)):
-            share_value *= sample_monthly_returns[j]
-            if adjust_withdrawals_for_inflation:
-                withdrawal_amount *= sample_cpi_mom[j]
-            if index % withdrawal_interval == 0:
-                share_value -= (
-                    withdrawal_amount * (1 + variable_transaction_fees)
-                    + fixed_transaction_fees
-                )
-                if share_value <= 0:
-                    res[i, j:] = 0
-                    break
-            res[i, j] = share_value
-        if adjust_portfolio_value_for_inflation:
-            res[i] /= sample_cpi / sample_cpi[0]
+        _simulate_withdrawal_path(
+            monthly_returns_with_fees[sample_slice],
+            cpi[sample_slice],
+            coast_duration,
+            strategy_horizon,
+            withdrawal_interval,
+            initial_portfolio_value,
+            initial_withdrawal_amount,
+            variable_transaction_fees,
+            fixed_transaction_fees,
+            adjust_withdrawals_for_inflation,
+            adjust_portfolio_value_for_inflation,
+            res[i],
+        )
+    return res
+
+
+@njit(
+    float64[:](
+        int64,
+        float64[:],
+        int64,
+        int64,
+        int64,
+        float64,
+        float64,
+        float64[:],
+        float64,
+        float64,
+        float64,
+        bool_,
+        bool_,
+    ),
+    cache=True,
+)
+def calculate_withdrawal_portfolio_value_path(
+    start_index: int,
+    monthly_returns: np.ndarray,
+    coast_duration: int,
+    strategy_horizon: int,
+    withdrawal_interval: int,
+    initial_portfolio_value: float,
+    initial_monthly_withdrawal: float,
+    cpi: np.ndarray,
+    variable_transaction_fees: float,
+    fixed_transaction_fees: float,
+    annualised_holding_fees: float,
+    adjust_withdrawals_for_inflation: bool,
+    adjust_portfolio_value_for_inflation: bool,
+):
+    sample_slice = slice(start_index, start_index + strategy_horizon + 1)
+    res = np.empty(strategy_horizon + 1)
+    _simulate_withdrawal_path(
+        (1 + monthly_returns[sample_slice]) * (1 - annualised_holding_fees) ** (1 / 12),
+        cpi[sample_slice],
+        coast_duration,
+        strategy_horizon,
+        withdrawal_interval,
+        initial_portfolio_value,
+        initial_monthly_withdrawal * withdrawal_interval,
+        variable_transaction_fees,
+        fixed_transaction_fees,
+        adjust_withdrawals_for_inflation,
+        adjust_portfolio_value_for_inflation,
+        res,
+    )
     return res
 
 
-@njit(int64[:, :](int64, int64, int64, float64))
+@njit(
+    float64[:, :](
+        float64[:],
+        int64,
+        int64,
+        int64,
+        float64,
+        float64,
+        float64[:],
+        float64,
+        float64,
+        float64,
+        bool_,
+        bool_,
+    ),
+    cache=True,
+)
+def summarise_withdrawal_portfolio_value_with_fees_vector(
+    monthly_returns: np.ndarray,
+    coast_duration: int,
+    strategy_horizon: int,
+    withdrawal_interval: int,
+    initial_portfolio_value: float,
+    initial_monthly_withdrawal: float,
+    cpi: np.ndarray,
+    variable_transaction_fees: float,
+    fixed_transaction_fees: float,
+    annualised_holding_fees: float,
+    adjust_withdrawals_for_inflation: bool,
+    adjust_portfolio_value_for_inflation: bool,
+):
+    initial_withdrawal_amount = initial_monthly_withdrawal * withdrawal_interval
+    monthly_returns_with_fees = (1 + monthly_returns) * (
+        1 - annualised_holding_fees
+    ) ** (1 / 12)
+    res = np.full((monthly_returns.shape[0], 5), np.nan)
+    path = np.empty(strategy_horizon + 1)
+    for i in range(strategy_horizon, len(monthly_returns)):
+        sample_slice = slice(i - strategy_horizon, i + 1)
+        _simulate_withdrawal_path(
+            monthly_returns_with_fees[sample_slice],
+            cpi[sample_slice],
+            coast_duration,
+            strategy_horizon,
+            withdrawal_interval,
+            initial_portfolio_value,
+            initial_withdrawal_amount,
+            variable_transaction_fees,
+            fixed_transaction_fees,
+            adjust_withdrawals_for_inflation,
+            adjust_portfolio_value_for_inflation,
+            path,
+        )
+        _summarise_path(path, res[i])
+    return res
+
+
+@njit(
+    float64[:, :, :](
+        float64[:],
+        float64[:],
+        int64[:],
+        int64[:],
+        int64[:],
+        float64[:],
+        float64[:],
+        float64[:],
+        float64[:],
+        float64[:],
+        bool_[:],
+        bool_[:],
+    ),
+    parallel=True,
+    cache=True,
+)
+def summarise_withdrawal_portfolio_value_batch(
+    monthly_returns: np.ndarray,
+    cpi: np.ndarray,
+    coast_durations: np.ndarray,
+    strategy_horizons: np.ndarray,
+    withdrawal_intervals: np.ndarray,
+    initial_portfolio_values: np.ndarray,
+    initial_monthly_withdrawals: np.ndarray,
+    variable_transaction_fees: np.ndarray,
+    fixed_transaction_fees: np.ndarray,
+    annualised_holding_fees: np.ndarray,
+    adjust_withdrawals_for_inflation: np.ndarray,
+    adjust_portfolio_value_for_inflation: np.ndarray,
+):
+    num_strategies = len(strategy_horizons)
+    res = np.empty((num_strategies, len(monthly_returns), 5))
+    for k in prange(num_strategies):
+        res[k] = summarise_withdrawal_portfolio_value_with_fees_vector(
+            monthly_returns,
+            coast_durations[k],
+            strategy_horizons[k],
+            withdrawal_intervals[k],
+            initial_portfolio_values[k],
+            initial_monthly_withdrawals[k],
+            cpi,
+            variable_transaction_fees[k],
+            fixed_transaction_fees[k],
+            annualised_holding_fees[k],
+            adjust_withdrawals_for_inflation[k],
+            adjust_portfolio_value_for_inflation[k],
+        )
+    return res
+
+
+@njit(
+    float64[:](
+        float64[:],
+        int64,
+        int64,
+        int64,
+        float64,
+        float64[:],
+        float64,
+        float64,
+        float64,
+        bool_,
+        float64,
+    ),
+    cache=True,
+)
+def solve_withdrawal_max_monthly_withdrawal_vector(
+    monthly_returns: np.ndarray,
+    coast_duration: int,
+    strategy_horizon: int,
+    withdrawal_interval: int,
+    initial_portfolio_value: float,
+    cpi: np.ndarray,
+    variable_transaction_fees: float,
+    fixed_transaction_fees: float,
+    annualised_holding_fees: float,
+    adjust_withdrawals_for_inflation: bool,
+    tolerance: float,
+):
+    monthly_returns_with_fees = (1 + monthly_returns) * (
+        1 - annualised_holding_fees
+    ) ** (1 / 12)
+    res = np.full(monthly_returns.shape[0], np.nan)
+    path = np.empty(strategy_horizon + 1)
+    for i in range(strategy_horizon, len(monthly_returns)):
+        sample_slice = slice(i - strategy_horizon, i + 1)
+        res[i] = _solve_max_monthly_withdrawal(
+            monthly_returns_with_fees[sample_slice],
+            cpi[sample_slice],
+            coast_duration,
+            strategy_horizon,
+            withdrawal_interval,
+            initial_portfolio_value,
+            variable_transaction_fees,
+            fixed_transaction_fees,
+            adjust_withdrawals_for_inflation,
+            tolerance,
+            path,
+        )
+    return res
+
+
+@njit(int64[:, :](int64, int64, int64, float64), cache=True)
 def generate_bootstrap_indices(
     num_samples: int,
     sample_length: int,
@@ -179,7 +784,8 @@ def generate_bootstrap_indices(
         float64,
         float64,
         bool_,
-    )
+    ),
+    cache=True,
 )
 def simulate_bootstrap_accumulation(
     monthly_returns: np.ndarray,
@@ -250,7 +856,8 @@ def simulate_bootstrap_accumulation(
         float64,
         bool_,
         bool_,
-    )
+    ),
+    cache=True,
 )
 def simulate_bootstrap_withdrawal(
     monthly_returns: np.ndarray,
@@ -305,7 +912,64 @@ def simulate_bootstrap_withdrawal(
     return res
 
 
-@njit(float64[:, :](float64[:, :]))
+@njit(
+    float64[:](
+        float64[:],
+        float64[:],
+        int64[:, :],
+        int64,
+        int64,
+        int64,
+        float64,
+        float64,
+        float64,
+        float64,
+        bool_,
+        float64,
+    ),
+    cache=True,
+)
+def solve_bootstrap_max_monthly_withdrawal(
+    monthly_returns: np.ndarray,
+    cpi: np.ndarray,
+    bootstrap_indices: np.ndarray,
+    coast_duration: int,
+    strategy_horizon: int,
+    withdrawal_interval: int,
+    initial_portfolio_value: float,
+    variable_transaction_fees: float,
+    fixed_transaction_fees: float,
+    annualised_holding_fees: float,
+    adjust_withdrawals_for_inflation: bool,
+    tolerance: float,
+) -> np.ndarray:
+    num_samples = bootstrap_indices.shape[0]
+    res = np.empty(num_samples)
+    monthly_returns_with_fees = (1.0 + monthly_returns) * (
+        1.0 - annualised_holding_fees
+    ) ** (1.0 / 12.0)
+    path = np.empty(strategy_horizon + 1)
+    for s in range(num_samples):
+        idx = bootstrap_indices[s]
+        boot_cpi = cpi[idx]
+        boot_cpi[0] = 0
+        res[s] = _solve_max_monthly_withdrawal(
+            monthly_returns_with_fees[idx],
+            (boot_cpi + 1).cumprod(),
+            coast_duration,
+            strategy_horizon,
+            withdrawal_interval,
+            initial_portfolio_value,
+            variable_transaction_fees,
+            fixed_transaction_fees,
+            adjust_withdrawals_for_inflation,
+            tolerance,
+            path,
+        )
+    return res
+
+
+@njit(float64[:, :](float64[:, :]), cache=True)
 def compute_bootstrap_max_drawdown(portfolio_values: np.ndarray) -> np.ndarray:
     num_samples = portfolio_values.shape[0]
     num_months = portfolio_values.shape[1]
@@ -322,3 +986,76 @@ def compute_bootstrap_max_drawdown(portfolio_values: np.ndarray) -> np.ndarray:
                 max_dd = dd
             res[s, t] = max_dd
     return res
+
+
+@njit(
+    void(float64[:, :], float64[:], bool_[:], float64, float64[:]),
+    cache=True,
+)
+def _simulate_rebalanced_portfolio_path(
+    asset_returns: np.ndarray,
+    weights: np.ndarray,
+    rebalance: np.ndarray,
+    rebalancing_band: float,
+    out: np.ndarray,
+):
+    num_periods, num_assets = asset_returns.shape
+    # Securities whose histories do not overlap leave no periods to simulate
+    if num_periods == 0:
+        return
+    holdings = weights.copy()
+    out[0] = 1.0
+    for t in range(1, num_periods):
+        value = 0.0
+        for i in range(num_assets):
+            holdings[i] *= 1 + asset_returns[t, i]
+            value += holdings[i]
+        out[t] = value
+        rebalance_now = rebalance[t]
+        # A portfolio that has lost everything has no weights left to drift
+        if not rebalance_now and rebalancing_band > 0 and value > 0:
+            for i in range(num_assets):
+                if abs(holdings[i] / value - weights[i]) > rebalancing_band:
+                    rebalance_now = True
+                    break
+        if rebalance_now:
+            for i in range(num_assets):
+                holdings[i] = value * weights[i]
+
+
+@njit(float64[:](float64[:, :], float64[:], bool_[:], float64), cache=True)
+def calculate_rebalanced_portfolio_value_path(
+    asset_returns: np.ndarray,
+    weights: np.ndarray,
+    rebalance: np.ndarray,
+    rebalancing_band: float,
+) -> np.ndarray:
+    """Value of a portfolio starting at 1, from the returns of each asset over each
+    period (row 0 is the start). The portfolio is rebalanced to its weights at the
+    end of the periods marked in rebalance, and whenever an asset's weight drifts
+    from its target by more than a positive rebalancing_band."""
+    out = np.empty(asset_returns.shape[0])
+    _simulate_rebalanced_portfolio_path(
+        asset_returns, weights, rebalance, rebalancing_band, out
+    )
+    return out
+
+
+@njit(
+    float64[:, :](float64[:, :], float64[:, :], bool_[:], float64),
+    parallel=True,
+    cache=True,
+)
+def calculate_rebalanced_portfolio_value_paths(
+    asset_returns: np.ndarray,
+    weights: np.ndarray,
+    rebalance: np.ndarray,
+    rebalancing_band: float,
+) -> np.ndarray:
+    num_portfolios = weights.shape[0]
+    res = np.empty((num_portfolios, asset_returns.shape[0]))
+    for k in prange(num_portfolios):
+        _simulate_rebalanced_portfolio_path(
+            asset_returns, weights[k], rebalance, rebalancing_band, res[k]
+        )
+    return res
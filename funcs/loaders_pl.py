@@ -8,10 +8,6 @@ from json import JSONDecodeError
 from typing import TypedDict
 
 import polars as pl
-import yfinance as yf
-from bs4 import BeautifulSoup
-from curl_cffi import requests
-from scipy.interpolate import pchip_interpolate
 
 
 def fast_bday_upsample(df: pl.DataFrame) -> pl.DataFrame:
@@ -28,6 +24,8 @@ def fast_bday_downsample(df: pl.DataFrame) -> pl.DataFrame:
 
 
 def pchip_daily_upsample(df: pl.DataFrame, value_col: str):
+    from scipy.interpolate import pchip_interpolate
+
     df = df.sort("date").upsample("date", every="1d", maintain_order=True)
     return df.with_columns(
         **{
@@ -109,6 +107,8 @@ def read_ft_data(filename: str):
 
 
 def get_fred_series(series_id: str):
+    from curl_cffi import requests
+
     res = requests.get(
         "https://api.stlouisfed.org/fred/series/observations",
         params={
@@ -193,6 +193,8 @@ def load_fed_funds_returns():
 
 
 async def download_us_treasury_rates_async():
+    from curl_cffi import requests
+
     durations = ["1MO", "3MO", "6MO", "1", "2", "3", "5", "7", "10", "20", "30"]
     async with requests.AsyncSession() as session:
         tasks = (
@@ -337,6 +339,8 @@ def read_shiller_sp500_data(tax_treatment: str):
 
 
 def download_mas_sgd_fx():
+    from curl_cffi import requests
+
     sgd_fx_response = requests.get(
         "https://eservices.mas.gov.sg/apimg-gw/server/monthly_statistical_bulletin_non610ora/exchange_rates_end_of_period_daily/views/exchange_rates_end_of_period_daily",
         headers={"keyid": os.environ["MAS_EXCHANGE_RATE_API_KEY"]},
@@ -423,6 +427,8 @@ def load_mas_sgd_fx():
 
 
 async def download_fred_usd_fx_async():
+    from curl_cffi import requests
+
     series = {
         "1_MXN": "DEXMXUS",
         "1_INR": "DEXINUS",
@@ -580,6 +586,8 @@ def load_mas_swap_points():
         .lt(datetime.date.today())
         .last()
     ):
+        from curl_cffi import requests
+
         try:
             res = requests.get(
                 "https://www.mas.gov.sg/api/v1/MAS/chart/rev/swappoint",
@@ -614,6 +622,8 @@ def load_sgd_neer():
         .lt(datetime.date.today())
         .last()
     ):
+        from curl_cffi import requests
+
         try:
             res = requests.get(
                 "https://www.mas.gov.sg/api/v1/MAS/chart/rev/sneer",
@@ -638,6 +648,8 @@ def load_sgd_neer():
 
 
 def download_sgd_interest_rates():
+    from curl_cffi import requests
+
     sgd_interest_rates_response = requests.get(
         "https://eservices.mas.gov.sg/apimg-gw/server/monthly_statistical_bulletin_non610mssql/domestic_interest_rates_daily/views/domestic_interest_rates_daily",
         params={"$select": "end_of_day,interbank_overnight,sora"},
@@ -829,6 +841,8 @@ def load_sgs_returns():
 
 
 def download_sg_cpi():
+    from curl_cffi import requests
+
     sg_cpi_response = requests.get(
         "https://tablebuilder.singstat.gov.sg/api/table/tabledata/M213751",
         params={"seriesNoORrowNo": 1},
@@ -922,6 +936,8 @@ class FtSymbolInfo(TypedDict):
 
 @lru_cache
 def get_ft_api_key():
+    from curl_cffi import requests
+
     res = requests.get("https://markets.ft.com/research/webservices/securities/v1/docs")
     source = re.search("source=([0-9a-f]*)", res.content.decode())
     if not source:
@@ -933,6 +949,8 @@ def get_ft_api_key():
 
 
 def get_ft_symbol_info(symbol: str) -> FtSymbolInfo | None:
+    from curl_cffi import requests
+
     api_key = get_ft_api_key()
     with requests.Session() as session:
         details_response = session.get(
@@ -985,6 +1003,9 @@ def get_ft_symbol_info(symbol: str) -> FtSymbolInfo | None:
 
 @lru_cache
 def download_ft_data(symbol: str, issue_type: str, inception_date: str) -> pl.DataFrame:
+    from bs4 import BeautifulSoup
+    from curl_cffi import requests
+
     api_key = get_ft_api_key()
     with requests.Session(timeout=120) as session:
         if issue_type == "OF":
@@ -1065,6 +1086,8 @@ def validate_yf_ticker(
     str | None,
     str | None,
 ]:
+    import yfinance as yf
+
     ticker = yf.Ticker(input_ticker)
     if len(ticker.info) < 10:
         return (None, None)
@@ -1082,6 +1105,8 @@ def validate_yf_ticker(
 
 @lru_cache
 def download_yf_data(ticker_str: str) -> pl.DataFrame:
+    import yfinance as yf
+
     ticker = yf.Ticker(ticker_str)
     df = (
         ticker.history(period="max", auto_adjust=False)
@@ -0,0 +1,45 @@
+import os
+
+bind = "0.0.0.0:8080"
+
+# Workers load the app themselves: importing polars starts its spill-file cleaner
+# thread, and a worker forked from a master that has imported polars hangs at exit and
+# deadlocks on its first parallel query. The master instead imports the polars-free
+# dependencies in on_starting, so those are shared copy-on-write by the workers
+preload_app = False
+
+cpu_count = os.cpu_count() or 1
+workers = int(os.environ.get("GUNICORN_WORKERS", max(1, cpu_count // 2)))
+
+# numba's workqueue threading layer is not thread safe, so each worker serves one
+# request at a time and the worker pools split the cores between them
+threads = 1
+os.environ.setdefault("NUMBA_THREADING_LAYER", "workqueue")
+os.environ.setdefault("NUMBA_NUM_THREADS", str(max(1, cpu_count // workers)))
+os.environ.setdefault("POLARS_MAX_THREADS", str(max(1, cpu_count // workers)))
+
+# Allow for compiling the kernels when the on-disk numba cache is cold
+timeout = 120
+
+
+def on_starting(server):
+    # The numba kernels are compiled, or loaded from the on-disk cache, at import
+    import dash  # noqa: F401
+    import dash_bootstrap_components  # noqa: F401
+    import plotly.graph_objects  # noqa: F401
+    import pydantic  # noqa: F401
+
+    import funcs.calcs_numpy  # noqa: F401
+
+
+def post_worker_init(worker):
+    from multiprocessing import forkserver
+
+    from warmup import warm_up
+
+    try:
+        worker.log.info("Warm-up finished in %.2fs", warm_up())
+    except Exception:
+        worker.log.exception("Warm-up failed, serving with cold caches")
+    # Start the server background callbacks fork from now rather than on the first job
+    forkserver.ensure_running()
@@ -0,0 +1,170 @@
+import hashlib
+import multiprocessing
+import os
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import date
+from functools import wraps
+from typing import ParamSpec, TypeVar, cast
+
+import diskcache
+import orjson
+from dash import DiskcacheManager
+from dash.background_callback.managers import BaseBackgroundCallbackManager
+
+JOB_CACHE_DIR = os.environ.get(
+    "DASHBOARD_JOB_CACHE_DIR", os.path.join(tempfile.gettempdir(), "dashboard-jobs")
+)
+JOB_RESULT_EXPIRY = 600
+
+# Shared results only need to outlive the requests that were waiting on them
+SINGLE_FLIGHT_RESULT_EXPIRY = 5
+# Lets waiters take over if the worker computing a result is killed mid-request
+SINGLE_FLIGHT_CLAIM_EXPIRY = 120
+SINGLE_FLIGHT_POLL_INTERVAL = 0.05
+
+job_cache = diskcache.Cache(JOB_CACHE_DIR)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+def single_flight(fn: Callable[P, R]) -> Callable[P, R]:
+    """Makes concurrent calls of a callback helper with the same arguments, from any
+    worker, share one computation of its result.
+
+    The helper's result must depend only on its arguments. The first caller claims
+    the computation, and the others count themselves on the claim and poll for its
+    result rather than queueing on a lock. The result is only stored when another
+    caller is waiting for it.
+    """
+
+    @wraps(fn)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        key = (
+            "single-flight-"
+            + hashlib.sha256(
+                orjson.dumps(
+                    [fn.__qualname__, args, kwargs],
+                    option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+                )
+            ).hexdigest()
+        )
+        claim_key = f"{key}-claim"
+        waiting = False
+        while True:
+            result = job_cache.get(key, default=diskcache.ENOVAL)
+            if result is not diskcache.ENOVAL:
+                return cast(R, result)
+            # add is atomic, so exactly one caller claims the computation
+            if job_cache.add(claim_key, 0, expire=SINGLE_FLIGHT_CLAIM_EXPIRY):
+                try:
+                    result = fn(*args, **kwargs)
+                finally:
+                    # pop is atomic too, so no caller counts itself after this
+                    num_waiters = job_cache.pop(claim_key, default=0)
+                if num_waiters:
+                    job_cache.set(key, result, expire=SINGLE_FLIGHT_RESULT_EXPIRY)
+                return result
+            if not waiting:
+                try:
+                    # Without a default, incr raises KeyError once the claim is gone
+                    job_cache.incr(claim_key, default=cast(int, None))
+                except KeyError:
+                    # The claim was released in between, so check for a result again
+                    continue
+                waiting = True
+            time.sleep(SINGLE_FLIGHT_POLL_INTERVAL)
+
+    return wrapper
+
+
+def run_job(
+    background_key: str,
+    cache_directory: str,
+    result_key: str,
+    progress_key: str,
+    args,
+    context,
+):
+    for function_key, fn, progress in BaseBackgroundCallbackManager.functions:
+        if function_key == background_key:
+            job_fn = DiskcacheManager(diskcache.Cache(cache_directory)).make_job_fn(
+                fn, progress
+            )
+            job_fn(result_key, progress_key, args, context)
+            return
+    raise KeyError(f"Background callback {background_key} is not registered")
+
+
+class LocalJobManager(DiskcacheManager):
+    """Runs background callbacks in processes started from a forkserver with the app
+    module preloaded, and lets identical requests share one in-flight job.
+
+    The stock manager forks the worker itself, which deadlocks once polars or numba
+    have started their thread pools in it. Jobs only receive the key of their
+    callback, which the forkserver has already registered by importing the app.
+    """
+
+    def __init__(self, cache: diskcache.Cache, app_module: str, expire: int):
+        # Results are cached for the day so every request sharing a job can read them,
+        # rather than the first poll clearing them
+        super().__init__(cache, cache_by=[lambda: date.today()], expire=expire)
+        self.mp_context = multiprocessing.get_context("forkserver")
+        self.mp_context.set_forkserver_preload([app_module])
+        self.background_keys = {}
+
+    def register(self, key, fn, progress):
+        super().register(key, fn, progress)
+        self.background_keys[self.func_registry[key]] = key
+
+    @staticmethod
+    def _make_job_key(key):
+        return f"{key}-job"
+
+    @staticmethod
+    def _make_waiters_key(job):
+        return f"{job}-waiters"
+
+    def call_job_fn(self, key, job_fn, args, context):
+        # Not a transaction: the forkserver opens the cache when it first imports the
+        # app, which would wait on the transaction's write lock
+        with diskcache.Lock(self.handle, f"{key}-lock", expire=self.expire):
+            # A job id of 0 tells the polling requests there is nothing to wait on
+            if self.result_ready(key):
+                return 0
+            job = self.handle.get(self._make_job_key(key))
+            if job is not None and self.job_running(job):
+                self.handle.incr(self._make_waiters_key(job))
+                return job
+
+            process = self.mp_context.Process(
+                target=run_job,
+                args=(
+                    self.background_keys[job_fn],
+                    self.handle.directory,
+                    key,
+                    self._make_progress_key(key),
+                    args,
+                    context,
+                ),
+            )
+            process.start()
+            self.handle.set(self._make_job_key(key), process.pid, expire=self.expire)
+            self.handle.set(self._make_waiters_key(process.pid), 1, expire=self.expire)
+        return process.pid
+
+    def terminate_job(self, job):
+        if not job or not int(job):
+            return
+        job = int(job)
+        # Only cancel a shared job once every request waiting on it has moved on
+        if self.handle.decr(self._make_waiters_key(job), default=1):
+            return
+        self.handle.delete(self._make_waiters_key(job))
+        super().terminate_job(job)
+
+
+def create_job_manager(app_module: str) -> LocalJobManager:
+    return LocalJobManager(job_cache, app_module, expire=JOB_RESULT_EXPIRY)
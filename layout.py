@@ -6,8 +6,10 @@ from models import (
     BootstrapYVar,
     Currency,
     DistributionChartType,
+    DrawdownPresentation,
     DrawdownType,
     FREDIndex,
+    FrontierRisk,
     FundCompany,
     IndexProvider,
     Interval,
@@ -17,12 +19,14 @@ from models import (
     MSCISize,
     MSCIStyle,
     OthersIndex,
+    Rebalancing,
     ReturnAnnualisation,
     ReturnDuration,
     ReturnInterval,
     RollingReturnsPresentation,
     SecurityType,
     SGSDuration,
+    SweepMetric,
     TaxTreatment,
     USTreasuryDuration,
     YVar,
@@ -368,6 +372,20 @@ app_layout = html.Div(
                                     ],
                                     id="price-selection-container",
                                 ),
+                                html.Div(
+                                    [
+                                        dbc.Label(
+                                            "Presentation",
+                                            html_for="drawdown-presentation-selection",
+                                        ),
+                                        dbc.Select(
+                                            DrawdownPresentation.to_dict(),
+                                            value=DrawdownPresentation.TIMESERIES,
+                                            id="drawdown-presentation-selection",
+                                        ),
+                                    ],
+                                    id="drawdown-selection-container",
+                                ),
                                 html.Div(
                                     [
                                         html.Div(
@@ -510,6 +528,31 @@ app_layout = html.Div(
                                     "Sum of Weights: ",
                                     id="portfolio-weights-sum",
                                 ),
+                                dbc.Label(
+                                    "Rebalancing", html_for="portfolio-rebalancing"
+                                ),
+                                dbc.Select(
+                                    Rebalancing.to_dict(),
+                                    value=Rebalancing.MONTHLY,
+                                    id="portfolio-rebalancing",
+                                ),
+                                html.Div(
+                                    [
+                                        dbc.Label(
+                                            "Rebalancing Band (%)",
+                                            html_for="portfolio-rebalancing-band",
+                                        ),
+                                        dbc.Input(
+                                            id="portfolio-rebalancing-band",
+                                            type="number",
+                                            value=5,
+                                            step=0.01,
+                                            min=0.01,
+                                            max=100,
+                                        ),
+                                    ],
+                                    id="portfolio-rebalancing-band-container",
+                                ),
                                 html.P(),
                                 dbc.Button("Add Portfolio", id="add-portfolio-button"),
                                 html.P(),
@@ -526,6 +569,14 @@ app_layout = html.Div(
                                     ],
                                     style={"display": "flex"},
                                 ),
+                                dbc.Label(
+                                    "Interval", html_for="portfolio-interval-selection"
+                                ),
+                                dbc.Select(
+                                    Interval.to_dict(),
+                                    value=Interval.MONTHLY,
+                                    id="portfolio-interval-selection",
+                                ),
                                 dbc.Label(
                                     "Currency", html_for="portfolio-currency-selection"
                                 ),
@@ -567,6 +618,20 @@ app_layout = html.Div(
                                     ],
                                     id="portfolio-price-selection-container",
                                 ),
+                                html.Div(
+                                    [
+                                        dbc.Label(
+                                            "Presentation",
+                                            html_for="portfolio-drawdown-presentation-selection",
+                                        ),
+                                        dbc.Select(
+                                            DrawdownPresentation.to_dict(),
+                                            value=DrawdownPresentation.TIMESERIES,
+                                            id="portfolio-drawdown-presentation-selection",
+                                        ),
+                                    ],
+                                    id="portfolio-drawdown-selection-container",
+                                ),
                                 html.Div(
                                     [
                                         html.Div(
@@ -663,6 +728,63 @@ app_layout = html.Div(
                     ],
                 ),
             ),
+            dbc.Tab(
+                label="Efficient Frontier",
+                children=html.Div(
+                    [
+                        html.Div(
+                            [
+                                dbc.Label("Securities", html_for="frontier-securities"),
+                                html.Div(
+                                    [
+                                        dcc.Dropdown(
+                                            {},
+                                            [],
+                                            id="frontier-securities",
+                                            multi=True,
+                                            searchable=False,
+                                            style={"width": 0, "flexGrow": 1},
+                                        )
+                                    ],
+                                    style={"display": "flex"},
+                                ),
+                                dbc.Label(
+                                    "Currency", html_for="frontier-currency-selection"
+                                ),
+                                dbc.Select(
+                                    Currency.to_dict(),
+                                    value=Currency.USD,
+                                    id="frontier-currency-selection",
+                                ),
+                                dbc.Label("Risk", html_for="frontier-risk-selection"),
+                                dbc.Select(
+                                    FrontierRisk.to_dict(),
+                                    value=FrontierRisk.VOLATILITY,
+                                    id="frontier-risk-selection",
+                                ),
+                            ],
+                            className="sidebar",
+                        ),
+                        html.Div(
+                            [
+                                dcc.Graph(
+                                    responsive=True,
+                                    figure={
+                                        "data": [],
+                                        "layout": {
+                                            "autosize": True,
+                                            "title": "Efficient Frontier",
+                                        },
+                                    },
+                                    id="frontier-graph",
+                                    config={"toImageButtonOptions": {"scale": 4}},
+                                ),
+                            ],
+                            className="graph-container",
+                        ),
+                    ],
+                ),
+            ),
             dbc.Tab(
                 label="Accumulation Strategy Backtester",
                 children=html.Div(
@@ -857,6 +979,14 @@ app_layout = html.Div(
                         ),
                         html.Div(
                             [
+                                dbc.Progress(
+                                    value=100,
+                                    striped=True,
+                                    animated=True,
+                                    id="backtest-accumulation-strategy-progress",
+                                    className="job-progress",
+                                    style={"visibility": "hidden"},
+                                ),
                                 dcc.Graph(
                                     responsive=True,
                                     figure={
@@ -1036,6 +1166,24 @@ app_layout = html.Div(
                                     label="Adjust Portfolio Value for Inflation",
                                     style={"marginTop": "0"},
                                 ),
+                                dbc.Label(
+                                    "Success Rate (%)",
+                                    html_for="backtest-withdrawal-success-rate-input",
+                                ),
+                                dbc.Input(
+                                    id="backtest-withdrawal-success-rate-input",
+                                    type="number",
+                                    min=0.01,
+                                    max=100,
+                                    step="0.01",
+                                    value=95,
+                                    required=True,
+                                ),
+                                html.P(),
+                                dbc.Button(
+                                    "Solve Monthly Withdrawal",
+                                    id="backtest-withdrawal-solve-withdrawal-button",
+                                ),
                                 html.P(),
                                 dbc.Button(
                                     "Add Strategy",
@@ -1094,6 +1242,14 @@ app_layout = html.Div(
                         ),
                         html.Div(
                             [
+                                dbc.Progress(
+                                    value=100,
+                                    striped=True,
+                                    animated=True,
+                                    id="backtest-withdrawal-strategy-progress",
+                                    className="job-progress",
+                                    style={"visibility": "hidden"},
+                                ),
                                 dcc.Graph(
                                     responsive=True,
                                     figure={
@@ -1338,6 +1494,12 @@ app_layout = html.Div(
                         ),
                         html.Div(
                             [
+                                dbc.Progress(
+                                    value=0,
+                                    id="bootstrap-accumulation-progress",
+                                    className="job-progress",
+                                    style={"visibility": "hidden"},
+                                ),
                                 dcc.Graph(
                                     responsive=True,
                                     figure={
@@ -1516,6 +1678,24 @@ app_layout = html.Div(
                                     value=120,
                                     required=True,
                                 ),
+                                dbc.Label(
+                                    "Success Rate (%)",
+                                    html_for="bootstrap-withdrawal-success-rate-input",
+                                ),
+                                dbc.Input(
+                                    id="bootstrap-withdrawal-success-rate-input",
+                                    type="number",
+                                    min=0.01,
+                                    max=100,
+                                    step="0.01",
+                                    value=95,
+                                    required=True,
+                                ),
+                                html.P(),
+                                dbc.Button(
+                                    "Solve Monthly Withdrawal",
+                                    id="bootstrap-withdrawal-solve-withdrawal-button",
+                                ),
                                 html.P(),
                                 dbc.Button(
                                     "Add Strategy",
@@ -1559,6 +1739,12 @@ app_layout = html.Div(
                         ),
                         html.Div(
                             [
+                                dbc.Progress(
+                                    value=0,
+                                    id="bootstrap-withdrawal-progress",
+                                    className="job-progress",
+                                    style={"visibility": "hidden"},
+                                ),
                                 dcc.Graph(
                                     responsive=True,
                                     figure={
@@ -1577,6 +1763,113 @@ app_layout = html.Div(
                     ],
                 ),
             ),
+            dbc.Tab(
+                label="Strategy Sweep",
+                children=html.Div(
+                    [
+                        html.Div(
+                            [
+                                dbc.Label(
+                                    "Base Strategy",
+                                    html_for="sweep-base-strategy",
+                                ),
+                                html.Div(
+                                    [
+                                        dbc.Select(
+                                            {},
+                                            id="sweep-base-strategy",
+                                            style={"width": 0, "flexGrow": 1},
+                                        ),
+                                    ],
+                                    style={"display": "flex"},
+                                ),
+                                dbc.Label(
+                                    "X Parameter",
+                                    html_for="sweep-x-parameter-selection",
+                                ),
+                                dbc.Select(
+                                    {},
+                                    id="sweep-x-parameter-selection",
+                                ),
+                                dbc.Label(
+                                    "X Values",
+                                    html_for="sweep-x-values-input",
+                                ),
+                                dbc.Input(
+                                    id="sweep-x-values-input",
+                                    type="text",
+                                    placeholder="e.g. 3000, 4000, 5000",
+                                    required=True,
+                                ),
+                                dbc.Label(
+                                    "Y Parameter",
+                                    html_for="sweep-y-parameter-selection",
+                                ),
+                                dbc.Select(
+                                    {},
+                                    id="sweep-y-parameter-selection",
+                                ),
+                                dbc.Label(
+                                    "Y Values",
+                                    html_for="sweep-y-values-input",
+                                ),
+                                dbc.Input(
+                                    id="sweep-y-values-input",
+                                    type="text",
+                                    placeholder="e.g. 240, 360, 480",
+                                    required=True,
+                                ),
+                                dbc.Label(
+                                    "Success Threshold (Ending Value)",
+                                    html_for="sweep-success-threshold-input",
+                                ),
+                                dbc.Input(
+                                    id="sweep-success-threshold-input",
+                                    type="number",
+                                    min=0,
+                                    step="0.01",
+                                    value=0,
+                                    required=True,
+                                ),
+                                html.P(),
+                                dbc.Button(
+                                    "Run Sweep",
+                                    id="sweep-run-button",
+                                ),
+                                html.P(),
+                                dbc.Label(
+                                    "Value",
+                                    html_for="sweep-metric-selection",
+                                ),
+                                dbc.Select(
+                                    SweepMetric.to_dict(),
+                                    value=SweepMetric.SUCCESS_RATE,
+                                    id="sweep-metric-selection",
+                                ),
+                            ],
+                            className="sidebar",
+                        ),
+                        html.Div(
+                            [
+                                dcc.Graph(
+                                    responsive=True,
+                                    figure={
+                                        "data": [],
+                                        "layout": {
+                                            "autosize": True,
+                                            "title": "Strategy Sweep",
+                                        },
+                                    },
+                                    id="sweep-graph",
+                                    config={"toImageButtonOptions": {"scale": 4}},
+                                ),
+                                dcc.Store(id="sweep-results-store"),
+                            ],
+                            className="graph-container",
+                        ),
+                    ],
+                ),
+            ),
         ],
         active_tab="tab-0",
         style={
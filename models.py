@@ -293,6 +293,14 @@ class YVar(Option):
     CALENDAR_RETURNS = ("calendar_returns", "Calendar Returns")
 
 
+class Rebalancing(Option):
+    NONE = ("none", "No Rebalancing")
+    MONTHLY = ("1mo", "Monthly")
+    QUARTERLY = ("3mo", "Quarterly")
+    ANNUAL = ("1y", "Annual")
+    THRESHOLD = ("threshold", "Threshold Bands")
+
+
 class ReturnInterval(Option):
     MONTHLY = ("1mo", "Monthly")
     QUARTERLY = ("3mo", "Quarterly")
@@ -324,6 +332,11 @@ class RollingReturnsPresentation(Option):
     DISTRIBUTION = ("dist", "Distribution")
 
 
+class DrawdownPresentation(Option):
+    TIMESERIES = ("timeseries", "Time Series")
+    EPISODES = ("episodes", "Episodes")
+
+
 class DistributionChartType(Option):
     HISTOGRAM = ("hist", "Histogram")
     BOX_PLOT = ("box", "Box Plot")
@@ -342,3 +355,37 @@ class DrawdownType(Option):
 class BootstrapYVar(Option):
     PORTFOLIO_VALUES = ("portfolio_values", "Portfolio Value Quantiles")
     MAX_DRAWDOWN = ("max_drawdown", "Max Dollar Drawdown Quantiles")
+
+
+class SweepParameter(Option):
+    INVESTMENT_AMOUNT = ("investment_amount", "Initial Investment")
+    MONTHLY_INVESTMENT = ("monthly_investment", "Monthly Investment Amount")
+    DCA_DURATION = ("dca_duration", "DCA Duration (Months)")
+    DCA_INTERVAL = ("dca_interval", "DCA Interval (Months)")
+    INITIAL_CAPITAL = ("initial_capital", "Initial Capital")
+    MONTHLY_WITHDRAWAL = ("monthly_withdrawal", "Monthly Withdrawal Amount")
+    WITHDRAWAL_DURATION = ("withdrawal_duration", "Withdrawal Duration (Months)")
+    WITHDRAWAL_INTERVAL = ("withdrawal_interval", "Withdrawal Interval (Months)")
+    COAST_DURATION = ("coast_duration", "Coast Duration (Months)")
+    VARIABLE_TRANSACTION_FEES = (
+        "variable_transaction_fees",
+        "Variable Transaction Fees (%)",
+    )
+    FIXED_TRANSACTION_FEES = ("fixed_transaction_fees", "Fixed Transaction Fees ($)")
+    ANNUALISED_HOLDING_FEES = (
+        "annualised_holding_fees",
+        "Annualised Holding Fees (% p.a.)",
+    )
+    ALLOCATION_WEIGHT = ("allocation_weight", "First Holding Weight (%)")
+
+
+class FrontierRisk(Option):
+    VOLATILITY = ("volatility", "Volatility")
+    MAX_DRAWDOWN = ("max_drawdown", "Max Drawdown")
+
+
+class SweepMetric(Option):
+    SUCCESS_RATE = ("success_rate", "Success Rate")
+    MEDIAN_ENDING_VALUE = ("median_ending_value", "Median Ending Value")
+    WORST_PERCENT_DRAWDOWN = ("worst_percent_drawdown", "Worst Percent Drawdown")
+    WORST_DOLLAR_DRAWDOWN = ("worst_dollar_drawdown", "Worst Dollar Drawdown")
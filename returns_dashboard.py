@@ -1,6 +1,8 @@
+from collections.abc import Callable
 from datetime import datetime
 from decimal import Decimal
 from functools import reduce
+from io import StringIO
 from itertools import cycle
 from typing import TypedDict
 
@@ -13,6 +15,7 @@ from dash import (
     Dash,
     Input,
     Output,
+    Patch,
     State,
     callback,
     clientside_callback,
@@ -29,6 +32,7 @@ from funcs.loaders_pl import (
     get_ft_symbol_info,
     validate_yf_ticker,
 )
+from job_manager import create_job_manager, single_flight
 from layout import app_layout
 from models import (
     BacktestYVar,
@@ -36,8 +40,10 @@ from models import (
     Currency,
     DimensionalFund,
     DistributionChartType,
+    DrawdownPresentation,
     DrawdownType,
     FREDIndex,
+    FrontierRisk,
     FundCompany,
     FundsmithFund,
     GMOFund,
@@ -51,11 +57,14 @@ from models import (
     MSCISize,
     MSCIStyle,
     OthersIndex,
+    Rebalancing,
     ReturnAnnualisation,
     ReturnDuration,
     ReturnInterval,
     RollingReturnsPresentation,
     SGSDuration,
+    SweepMetric,
+    SweepParameter,
     TaxTreatment,
     USTreasuryDuration,
     YVar,
@@ -75,14 +84,24 @@ from schemas import (
     WithdrawalBacktestStrategy,
     WithdrawalBootstrapStrategy,
     YfSecurity,
+    compute_efficient_frontier,
+    simulate_backtest_summaries,
+    sweep_backtest_strategies,
+)
+from update_graph import (
+    GraphParams,
+    PrevLayout,
+    RelayoutData,
+    ScatterTrace,
+    get_scatter_type,
 )
-from update_graph import GraphParams, PrevLayout, RelayoutData
 
 app = Dash(
     serve_locally=False,
     eager_loading=True,
     compress=True,
     external_stylesheets=[dbc.themes.BOOTSTRAP],
+    background_callback_manager=create_job_manager(__name__),
 )
 
 server = app.server
@@ -443,6 +462,7 @@ clientside_callback(
     Output("return-selection", "style"),
     Output("rolling-return-selection-container", "style"),
     Output("calendar-return-selection-container", "style"),
+    Output("drawdown-selection-container", "style"),
     Input("y-var-selection", "value"),
 )
 
@@ -481,6 +501,7 @@ clientside_callback(
 )
 
 
+@single_flight
 def update_holding_graph(
     selected_holdings_strs: list[str],
     selected_holdings_options: dict[str, str],
@@ -496,10 +517,14 @@ def update_holding_graph(
     baseline_trace: str,
     rolling_returns_presentation: RollingReturnsPresentation,
     rolling_returns_distribution_chart_type: DistributionChartType,
+    drawdown_presentation: DrawdownPresentation,
     relayout_data: RelayoutData | None,
     prev_layout: PrevLayout | None,
     interval: Interval,
+    triggered_ids: list[str],
 ):
+    # triggered_ids is unused here but keys the shared result, since the figure and
+    # whether it is only patched depend on which inputs fired the callback
     if not selected_holdings_strs:
         return no_update
     securities_colourmap = dict(
@@ -511,18 +536,6 @@ def update_holding_graph(
     selected_holdings = TypeAdapter(list[Json[Holding]]).validate_python(
         selected_holdings_strs
     )
-    dfs = [
-        selected_security.load_series(
-            interval,
-            currency,
-            adjust_for_inflation,
-        ).rename({"price": selected_security.model_dump_json()})
-        for selected_security in selected_holdings
-    ]
-    df = reduce(
-        lambda left, right: left.join(right, on="date", how="full", coalesce=True), dfs
-    )
-
     uirevision = (
         currency
         + str(adjust_for_inflation)
@@ -535,14 +548,17 @@ def update_holding_graph(
         + baseline_trace
         + rolling_returns_presentation
         + rolling_returns_distribution_chart_type
+        + drawdown_presentation
     )
 
     relayout_data = relayout_data or {"autosize": True}
 
     graph_params: GraphParams = TypeAdapter(GraphParams).validate_python(
         {
-            "df": df,
+            "holdings": [holding.model_dump_json() for holding in selected_holdings],
             "trace_colourmap": securities_colourmap,
+            "currency": currency,
+            "adjust_for_inflation": adjust_for_inflation,
             "y_var": y_var,
             "log_scale": log_scale,
             "percent_scale": percent_scale,
@@ -554,6 +570,7 @@ def update_holding_graph(
             "baseline_trace": baseline_trace,
             "rolling_returns_presentation": rolling_returns_presentation,
             "rolling_returns_distribution_chart_type": rolling_returns_distribution_chart_type,
+            "drawdown_presentation": drawdown_presentation,
             "relayout_data": relayout_data,
             "uirevision": uirevision,
             "prev_layout": prev_layout,
@@ -561,7 +578,11 @@ def update_holding_graph(
     )
 
     data, layout = graph_params.update_graph()
-    return dict(data=data, layout=layout)
+    if graph_params.traces_unchanged:
+        figure_patch = Patch()
+        figure_patch["layout"] = layout
+        return figure_patch
+    return dict(data=data, layout=layout.to_plotly_json())
 
 
 @callback(
@@ -580,6 +601,7 @@ def update_holding_graph(
     Input("baseline-security-selection", "value"),
     Input("rolling-returns-presentation-selection", "value"),
     Input("rolling-returns-distribution-chart-type-selection", "value"),
+    Input("drawdown-presentation-selection", "value"),
     Input("graph", "relayoutData"),
     State("graph-last-layout-state-store", "data"),
     Input("interval-selection", "value"),
@@ -600,6 +622,7 @@ def update_security_graph(
     baseline_security: str,
     rolling_returns_presentation: RollingReturnsPresentation,
     rolling_returns_distribution_chart_type: DistributionChartType,
+    drawdown_presentation: DrawdownPresentation,
     relayout_data: RelayoutData | None,
     prev_layout: PrevLayout | None,
     interval: Interval,
@@ -620,9 +643,11 @@ def update_security_graph(
         baseline_security,
         rolling_returns_presentation,
         rolling_returns_distribution_chart_type,
+        drawdown_presentation,
         relayout_data,
         prev_layout,
         interval,
+        sorted(ctx.triggered_prop_ids.values()),
     )
 
 
@@ -686,6 +711,16 @@ clientside_callback(
 )
 
 
+clientside_callback(
+    ClientsideFunction(
+        namespace="visibility",
+        function_name="updateRebalancingBandVisibility",
+    ),
+    Output("portfolio-rebalancing-band-container", "style"),
+    Input("portfolio-rebalancing", "value"),
+)
+
+
 @callback(
     Output("portfolios", "value"),
     Output("portfolios", "options"),
@@ -695,6 +730,8 @@ clientside_callback(
     State("portfolios", "value"),
     State("portfolios", "options"),
     State("portfolio-allocations", "value"),
+    State("portfolio-rebalancing", "value"),
+    State("portfolio-rebalancing-band", "value"),
     prevent_initial_call=True,
 )
 def add_portfolio(
@@ -702,13 +739,23 @@ def add_portfolio(
     portfolio_strs: list[str],
     portfolio_options: dict[str, str],
     portfolio_allocation_strs: list[str],
+    rebalancing: Rebalancing,
+    rebalancing_band: float | int | None,
 ):
     if not portfolio_allocation_strs:
         return no_update
+    set_props("portfolio-rebalancing-band", {"required": False})
+    if rebalancing == Rebalancing.THRESHOLD and rebalancing_band is None:
+        set_props("portfolio-rebalancing-band", {"required": True})
+        return no_update
     portfolio = Portfolio(
         allocations=TypeAdapter(list[Json[Allocation]]).validate_python(
             portfolio_allocation_strs
-        )
+        ),
+        rebalancing=rebalancing,
+        rebalancing_band=Decimal(rebalancing_band)
+        if rebalancing == Rebalancing.THRESHOLD and rebalancing_band is not None
+        else None,
     )
     if sum([allocation.weight for allocation in portfolio.allocations]) != Decimal(100):
         return no_update
@@ -728,6 +775,7 @@ clientside_callback(
     Output("portfolio-return-selection", "style"),
     Output("portfolio-rolling-return-selection-container", "style"),
     Output("portfolio-calendar-return-selection-container", "style"),
+    Output("portfolio-drawdown-selection-container", "style"),
     Input("portfolio-y-var-selection", "value"),
 )
 
@@ -784,7 +832,9 @@ clientside_callback(
     Input("portfolio-baseline-security-selection", "value"),
     Input("portfolio-rolling-returns-presentation-selection", "value"),
     Input("portfolio-rolling-returns-distribution-chart-type-selection", "value"),
+    Input("portfolio-drawdown-presentation-selection", "value"),
     Input("portfolio-graph", "relayoutData"),
+    Input("portfolio-interval-selection", "value"),
     State("portfolio-graph-last-layout-state-store", "data"),
     prevent_initial_call=True,
 )
@@ -803,10 +853,12 @@ def update_portfolio_graph(
     baseline_portfolio: str,
     rolling_returns_presentation: RollingReturnsPresentation,
     rolling_returns_distribution_chart_type: DistributionChartType,
+    drawdown_presentation: DrawdownPresentation,
     relayout_data: RelayoutData | None,
+    interval: Interval,
     prev_layout: PrevLayout | None,
 ):
-    interval = Interval.MONTHLY
+    interval = Interval.MONTHLY if y_var == YVar.CALENDAR_RETURNS else interval
     return update_holding_graph(
         portfolio_strs,
         portfolio_options,
@@ -822,10 +874,100 @@ def update_portfolio_graph(
         baseline_portfolio,
         rolling_returns_presentation,
         rolling_returns_distribution_chart_type,
+        drawdown_presentation,
         relayout_data,
         prev_layout,
         interval,
+        sorted(ctx.triggered_prop_ids.values()),
+    )
+
+
+@callback(
+    Output("frontier-securities", "options"),
+    Input("selected-securities", "options"),
+)
+def update_frontier_security_options(security_options: dict[str, str]):
+    return security_options
+
+
+@callback(
+    Output("frontier-graph", "figure"),
+    Input("frontier-securities", "value"),
+    Input("frontier-currency-selection", "value"),
+    Input("frontier-risk-selection", "value"),
+    prevent_initial_call=True,
+)
+def update_frontier_graph(
+    security_strs: list[str],
+    currency: Currency,
+    risk: FrontierRisk,
+):
+    if len(security_strs) < 2:
+        return no_update
+    securities = TypeAdapter(list[Json[Security]]).validate_python(security_strs)
+    labels = {
+        security.model_dump_json(): security.label.replace("\n", " ")
+        for security in securities
+    }
+    candidates = compute_efficient_frontier(frozenset(labels), currency)
+    if candidates.is_empty():
+        set_props(
+            "toast-store",
+            {"data": "The selected securities do not share enough history"},
+        )
+        return no_update
+    candidates = candidates.with_columns(
+        pl.col(risk).abs().alias("risk"),
+        pl.concat_str(
+            [
+                pl.format(f"{{}}% {label}", pl.col(column).mul(100).round(2))
+                for column, label in labels.items()
+            ],
+            separator="<br>",
+        ).alias("hovertext"),
+    )
+    frontier = candidates.filter(pl.col(f"{risk}_frontier")).sort("risk")
+    hovertemplate = (
+        f"{FrontierRisk(risk).label}: %{{x:.2%}}<br>"
+        "Annualised Return: %{y:.2%}<br>"
+        "%{hovertext}<extra></extra>"
     )
+    return {
+        "data": [
+            {
+                "type": get_scatter_type(candidates.height),
+                "x": candidates.get_column("risk").to_numpy(),
+                "y": candidates.get_column("annualised_return").to_numpy(),
+                "mode": "markers",
+                "name": "Candidate Portfolios",
+                "marker": {"color": "lightgray", "size": 4},
+                "hovertext": candidates.get_column("hovertext").to_list(),
+                "hovertemplate": hovertemplate,
+            },
+            {
+                "type": "scatter",
+                "x": frontier.get_column("risk").to_numpy(),
+                "y": frontier.get_column("annualised_return").to_numpy(),
+                "mode": "lines+markers",
+                "name": "Efficient Frontier",
+                "marker": {"color": DEFAULT_PLOTLY_COLORS[0], "size": 5},
+                "hovertext": frontier.get_column("hovertext").to_list(),
+                "hovertemplate": hovertemplate,
+            },
+        ],
+        "layout": go.Layout(
+            title=f"Efficient Frontier by {FrontierRisk(risk).label}",
+            hovermode="closest",
+            showlegend=True,
+            legend=go.layout.Legend(x=0, valign="top", bgcolor="rgba(255,255,255,0.5)"),
+            xaxis=go.layout.XAxis(
+                title=FrontierRisk(risk).label, tickformat=".0%", rangemode="tozero"
+            ),
+            yaxis=go.layout.YAxis(title="Annualised Return", tickformat=".0%"),
+            yaxis_side="right",
+            margin=go.layout.Margin(t=90, b=30, l=10, r=90, autoexpand=True),
+        ),
+    }
 
 
 clientside_callback(
@@ -910,6 +1052,38 @@ clientside_callback(
 )
 
 
+clientside_callback(
+    ClientsideFunction(namespace="disabled", function_name="isStrategyInputInvalid"),
+    Output("backtest-withdrawal-solve-withdrawal-button", "disabled"),
+    Input("backtest-withdrawal-strategy-portfolio", "value"),
+    Input("backtest-withdrawal-initial-capital-input", "value"),
+    Input("backtest-withdrawal-coast-duration-input", "value"),
+    Input("backtest-withdrawal-duration-input", "value"),
+    Input("backtest-withdrawal-interval-input", "value"),
+    Input("backtest-withdrawal-variable-transaction-fees-input", "value"),
+    Input("backtest-withdrawal-fixed-transaction-fees-input", "value"),
+    Input("backtest-withdrawal-annualised-holding-fees-input", "value"),
+    Input("backtest-withdrawal-success-rate-input", "value"),
+)
+
+
+clientside_callback(
+    ClientsideFunction(namespace="disabled", function_name="isStrategyInputInvalid"),
+    Output("bootstrap-withdrawal-solve-withdrawal-button", "disabled"),
+    Input("bootstrap-withdrawal-strategy-portfolio", "value"),
+    Input("bootstrap-withdrawal-initial-capital-input", "value"),
+    Input("bootstrap-withdrawal-coast-duration-input", "value"),
+    Input("bootstrap-withdrawal-duration-input", "value"),
+    Input("bootstrap-withdrawal-interval-input", "value"),
+    Input("bootstrap-withdrawal-variable-transaction-fees-input", "value"),
+    Input("bootstrap-withdrawal-fixed-transaction-fees-input", "value"),
+    Input("bootstrap-withdrawal-annualised-holding-fees-input", "value"),
+    Input("bootstrap-withdrawal-num-samples-input", "value"),
+    Input("bootstrap-withdrawal-avg-block-length-input", "value"),
+    Input("bootstrap-withdrawal-success-rate-input", "value"),
+)
+
+
 clientside_callback(
     ClientsideFunction(
         namespace="visibility", function_name="updateStrategyDrawdownTypeVisibility"
@@ -1012,60 +1186,51 @@ def update_backtest_strategy_graph(
             cycle(DEFAULT_PLOTLY_COLORS),
         )
     )
-    dfs: dict[str, pl.DataFrame] = {}
-    for strategy_str in strategy_strs:
-        strategy: BacktestStrategy = TypeAdapter(BacktestStrategy).validate_json(
-            strategy_str
+    if y_var == BacktestYVar.ENDING_VALUES:
+        summary_column = "ending_value"
+    elif y_var == BacktestYVar.MAX_DRAWDOWN:
+        summary_column = (
+            "max_percent_drawdown"
+            if drawdown_type == DrawdownType.PERCENT
+            else "max_dollar_drawdown"
         )
-        portfolio_values = strategy.simulate()
+    else:
+        raise ValueError("Invalid y_var")
+
+    strategies = [
+        TypeAdapter(BacktestStrategy).validate_json(strategy_str)
+        for strategy_str in strategy_strs
+    ]
+    transformed_dfs: list[pl.DataFrame] = []
+    for strategy_str, strategy, summary in zip(
+        strategy_strs, strategies, simulate_backtest_summaries(strategies)
+    ):
         if index_by_start_date:
-            portfolio_values = portfolio_values.with_columns(
+            summary = summary.with_columns(
                 pl.all().exclude("date").shift(-strategy.strategy_horizon)
             )
-        portfolio_values = portfolio_values.filter(
-            pl.any_horizontal(pl.all().exclude("date").is_not_null())
+        transformed_dfs.append(
+            summary.filter(pl.col("ending_value").is_not_null()).select(
+                "date", pl.col(summary_column).alias(strategy_str)
+            )
         )
-        dfs[strategy_str] = portfolio_values
-
-    if y_var == BacktestYVar.ENDING_VALUES:
-        transformed_dfs = [
-            df.select("date", pl.last().alias(name)) for name, df in dfs.items()
-        ]
-    elif y_var == BacktestYVar.MAX_DRAWDOWN:
-        if drawdown_type == DrawdownType.PERCENT:
-            transformed_dfs = [
-                df.drop("date")
-                .transpose()
-                .select((pl.all() / pl.all().cum_max() - 1).min())
-                .transpose(column_names=[name])
-                .insert_column(0, df.get_column("date"))
-                for name, df in dfs.items()
-            ]
-        else:
-            transformed_dfs = [
-                df.drop("date")
-                .transpose()
-                .select((pl.all() - pl.all().cum_max()).min())
-                .transpose(column_names=[name])
-                .insert_column(0, df.get_column("date"))
-                for name, df in dfs.items()
-            ]
-    else:
-        raise ValueError("Invalid y_var")
 
     values = reduce(
         lambda a, b: a.join(b, on="date", how="full", coalesce=True), transformed_dfs
     )
 
+    scatter_type = get_scatter_type(values.height * (values.width - 1))
+    dates = values.get_column("date").to_numpy()
     return {
         "data": [
-            go.Scatter(
-                x=values.get_column("date"),
-                y=values.get_column(strategy),
-                mode="lines",
-                line=go.scatter.Line(color=strategies_colourmap[strategy]),
-                name=strategy_options[strategy].replace("\n", "<br>"),
-            )
+            {
+                "type": scatter_type,
+                "x": dates,
+                "y": values.get_column(strategy).to_numpy(),
+                "mode": "lines",
+                "line": {"color": strategies_colourmap[strategy]},
+                "name": strategy_options[strategy].replace("\n", "<br>"),
+            }
             for strategy in values.drop("date").columns
         ],
         "layout": go.Layout(
@@ -1075,7 +1240,7 @@ def update_backtest_strategy_graph(
             legend=go.layout.Legend(x=0, valign="top", bgcolor="rgba(255,255,255,0.5)"),
             yaxis_side="right",
             margin=go.layout.Margin(t=90, b=30, l=10, r=90, autoexpand=True),
-        ),
+        ).to_plotly_json(),
     }
 
 
@@ -1086,6 +1251,15 @@ def update_backtest_strategy_graph(
     Input("backtest-accumulation-index-by-start-date", "value"),
     Input("backtest-accumulation-y-var-selection", "value"),
     Input("backtest-accumulation-drawdown-type-selection", "value"),
+    background=True,
+    interval=250,
+    running=[
+        (
+            Output("backtest-accumulation-strategy-progress", "style"),
+            {"visibility": "visible"},
+            {"visibility": "hidden"},
+        )
+    ],
     prevent_initial_call=True,
 )
 def update_backtest_accumulation_strategy_graph(
@@ -1124,33 +1298,19 @@ def show_backtest_strategy_modal(
         strategy: BacktestStrategy = TypeAdapter(BacktestStrategy).validate_json(
             strategy_str
         )
-        portfolio_values = strategy.simulate()
-        portfolio_values = portfolio_values.filter(
-            pl.any_horizontal(pl.all().exclude("date").is_not_null())
-        )
         end_date_expr = (
             add_bmonth_end(clicked_date_expr, strategy.strategy_horizon)
             if index_by_start_date
             else clicked_date_expr
         )
-        matching = portfolio_values.filter(pl.col("date") == end_date_expr)
-        if matching.is_empty():
+        path = strategy.simulate_path(pl.select(end_date_expr).item())
+        if path is None:
             continue
 
-        dates = (
-            pl.DataFrame()
-            .with_columns(
-                add_bmonth_end(
-                    end_date_expr, pl.int_range(-strategy.strategy_horizon, 1)
-                ).alias("date")
-            )
-            .get_column("date")
-        )
-
         traces.append(
             go.Scatter(
-                x=dates,
-                y=matching.drop("date").transpose().get_column("column_0"),
+                x=path.get_column("date"),
+                y=path.get_column("portfolio_value"),
                 mode="lines",
                 line=go.scatter.Line(color=strategies_colourmap[strategy_str]),
                 name=strategy_options[strategy_str].replace("\n", "<br>"),
@@ -1291,6 +1451,58 @@ def update_backtest_withdrawal_strategies(
     return strategies, strategy_options
 
 
+@callback(
+    Output("backtest-withdrawal-monthly-amount-input", "value"),
+    Input("backtest-withdrawal-solve-withdrawal-button", "n_clicks"),
+    State("backtest-withdrawal-strategy-portfolio", "value"),
+    State("backtest-withdrawal-strategy-currency-selection", "value"),
+    State("backtest-withdrawal-initial-capital-input", "value"),
+    State("backtest-withdrawal-coast-duration-input", "value"),
+    State("backtest-withdrawal-monthly-inflation-adjustment-switch", "value"),
+    State("backtest-withdrawal-duration-input", "value"),
+    State("backtest-withdrawal-interval-input", "value"),
+    State("backtest-withdrawal-variable-transaction-fees-input", "value"),
+    State("backtest-withdrawal-fixed-transaction-fees-input", "value"),
+    State("backtest-withdrawal-annualised-holding-fees-input", "value"),
+    State("backtest-withdrawal-success-rate-input", "value"),
+    prevent_initial_call=True,
+)
+def solve_backtest_monthly_withdrawal(
+    _,
+    strategy_portfolio: str,
+    currency: Currency,
+    initial_capital: int | float,
+    coast_duration: int,
+    adjust_withdrawals_for_inflation: bool,
+    withdrawal_duration: int,
+    withdrawal_interval: int,
+    variable_transaction_fees: int | float,
+    fixed_transaction_fees: int | float,
+    annualised_holding_fees: int | float,
+    success_rate: int | float,
+):
+    strategy = WithdrawalBacktestStrategy(
+        strategy_portfolio=Portfolio.model_validate_json(strategy_portfolio),
+        currency=currency,
+        initial_capital=initial_capital,
+        coast_duration=coast_duration,
+        monthly_withdrawal=0,
+        adjust_withdrawals_for_inflation=adjust_withdrawals_for_inflation,
+        withdrawal_duration=withdrawal_duration,
+        withdrawal_interval=withdrawal_interval,
+        variable_transaction_fees=variable_transaction_fees,
+        fixed_transaction_fees=fixed_transaction_fees,
+        annualised_holding_fees=annualised_holding_fees,
+    )
+    try:
+        monthly_withdrawal = strategy.safe_monthly_withdrawal(success_rate / 100)
+    except ValueError as e:
+        set_props("toast-store", {"data": str(e)})
+        return no_update
+    # Round down so the filled-in amount still meets the success rate
+    return np.floor(monthly_withdrawal * 100) / 100
+
+
 @callback(
     Output("backtest-withdrawal-strategy-graph", "figure"),
     Input("backtest-withdrawal-strategies", "value"),
@@ -1298,6 +1510,15 @@ def update_backtest_withdrawal_strategies(
     Input("backtest-withdrawal-index-by-start-date", "value"),
     Input("backtest-withdrawal-y-var-selection", "value"),
     Input("backtest-withdrawal-drawdown-type-selection", "value"),
+    background=True,
+    interval=250,
+    running=[
+        (
+            Output("backtest-withdrawal-strategy-progress", "style"),
+            {"visibility": "visible"},
+            {"visibility": "hidden"},
+        )
+    ],
     prevent_initial_call=True,
 )
 def update_backtest_withdrawal_strategy_graph(
@@ -1367,32 +1588,35 @@ def _build_quantile_fan_traces(
     quantiles: dict[float, np.ndarray],
     color: str,
     strategy_name: str,
-) -> list[go.Scatter]:
-    traces = []
+) -> list[ScatterTrace]:
+    traces: list[ScatterTrace] = []
     for lo, hi, opacity in BANDS:
         traces.append(
-            go.Scatter(
-                x=months,
-                y=quantiles[lo],
-                mode="lines",
-                line=dict(width=0),
-                legendgroup=strategy_name,
-                showlegend=False,
-                hoverinfo="skip",
-            )
+            {
+                "type": "scatter",
+                "x": months,
+                "y": quantiles[lo],
+                "mode": "lines",
+                "line": {"width": 0},
+                "legendgroup": strategy_name,
+                "showlegend": False,
+                "hoverinfo": "skip",
+            }
         )
         traces.append(
-            go.Scatter(
-                x=months,
-                y=quantiles[hi],
-                mode="lines",
-                line=dict(width=0),
-                fill="tonexty",
-                fillcolor=color.replace("rgb(", "rgba(").rstrip(")") + f", {opacity})",
-                legendgroup=strategy_name,
-                showlegend=False,
-                hoverinfo="skip",
-            )
+            {
+                "type": "scatter",
+                "x": months,
+                "y": quantiles[hi],
+                "mode": "lines",
+                "line": {"width": 0},
+                "fill": "tonexty",
+                "fillcolor": color.replace("rgb(", "rgba(").rstrip(")")
+                + f", {opacity})",
+                "legendgroup": strategy_name,
+                "showlegend": False,
+                "hoverinfo": "skip",
+            }
         )
     customdata = np.column_stack(
         [
@@ -1406,15 +1630,16 @@ def _build_quantile_fan_traces(
         ]
     )
     traces.append(
-        go.Scatter(
-            x=months,
-            y=quantiles[0.50],
-            mode="lines",
-            line=dict(color=color, width=2),
-            name=strategy_name.replace("\n", "<br>"),
-            legendgroup=strategy_name,
-            customdata=customdata,
-            hovertemplate=(
+        {
+            "type": "scatter",
+            "x": months,
+            "y": quantiles[0.50],
+            "mode": "lines",
+            "line": {"color": color, "width": 2},
+            "name": strategy_name.replace("\n", "<br>"),
+            "legendgroup": strategy_name,
+            "customdata": customdata,
+            "hovertemplate": (
                 "p99: %{customdata[0]:$,.0f}<br>"
                 "p95: %{customdata[1]:$,.0f}<br>"
                 "p75: %{customdata[2]:$,.0f}<br>"
@@ -1423,8 +1648,8 @@ def _build_quantile_fan_traces(
                 "p5: %{customdata[5]:$,.0f}<br>"
                 "p1: %{customdata[6]:$,.0f}"
             ),
-            showlegend=True,
-        )
+            "showlegend": True,
+        }
     )
     return traces
 
@@ -1502,6 +1727,7 @@ def update_bootstrap_accumulation_strategies(
 
 
 def update_bootstrap_strategy_graph(
+    set_progress: Callable[[tuple[int, int]], None],
     strategy_strs: list[str],
     strategy_options: dict[str, str],
     y_var: BootstrapYVar,
@@ -1518,7 +1744,8 @@ def update_bootstrap_strategy_graph(
         zip(strategy_options.keys(), cycle(DEFAULT_PLOTLY_COLORS))
     )
     all_traces = []
-    for strategy_str in strategy_strs:
+    set_progress((0, len(strategy_strs)))
+    for num_simulated, strategy_str in enumerate(strategy_strs, 1):
         strategy: BootstrapStrategy = TypeAdapter(BootstrapStrategy).validate_json(
             strategy_str
         )
@@ -1537,6 +1764,7 @@ def update_bootstrap_strategy_graph(
                 strategy_options[strategy_str],
             )
         )
+        set_progress((num_simulated, len(strategy_strs)))
 
     return {
         "data": all_traces,
@@ -1552,7 +1780,7 @@ def update_bootstrap_strategy_graph(
             yaxis_side="right",
             yaxis_type="log" if log_scale else "linear",
             margin=go.layout.Margin(t=90, b=30, l=10, r=90, autoexpand=True),
-        ),
+        ).to_plotly_json(),
     }
 
 
@@ -1562,16 +1790,30 @@ def update_bootstrap_strategy_graph(
     State("bootstrap-accumulation-strategies", "options"),
     Input("bootstrap-accumulation-y-var-selection", "value"),
     Input("bootstrap-accumulation-log-scale-switch", "value"),
+    background=True,
+    interval=250,
+    progress=[
+        Output("bootstrap-accumulation-progress", "value"),
+        Output("bootstrap-accumulation-progress", "max"),
+    ],
+    running=[
+        (
+            Output("bootstrap-accumulation-progress", "style"),
+            {"visibility": "visible"},
+            {"visibility": "hidden"},
+        )
+    ],
     prevent_initial_call=True,
 )
 def update_bootstrap_accumulation_graph(
+    set_progress: Callable[[tuple[int, int]], None],
     strategy_strs: list[str],
     strategy_options: dict[str, str],
     y_var: BootstrapYVar,
     log_scale: bool,
 ):
     return update_bootstrap_strategy_graph(
-        strategy_strs, strategy_options, y_var, log_scale
+        set_progress, strategy_strs, strategy_options, y_var, log_scale
     )
 
 
@@ -1643,21 +1885,93 @@ def update_bootstrap_withdrawal_strategies(
     return strategies, strategy_options
 
 
+@callback(
+    Output("bootstrap-withdrawal-monthly-amount-input", "value"),
+    Input("bootstrap-withdrawal-solve-withdrawal-button", "n_clicks"),
+    State("bootstrap-withdrawal-strategy-portfolio", "value"),
+    State("bootstrap-withdrawal-strategy-currency-selection", "value"),
+    State("bootstrap-withdrawal-initial-capital-input", "value"),
+    State("bootstrap-withdrawal-coast-duration-input", "value"),
+    State("bootstrap-withdrawal-monthly-inflation-adjustment-switch", "value"),
+    State("bootstrap-withdrawal-duration-input", "value"),
+    State("bootstrap-withdrawal-interval-input", "value"),
+    State("bootstrap-withdrawal-variable-transaction-fees-input", "value"),
+    State("bootstrap-withdrawal-fixed-transaction-fees-input", "value"),
+    State("bootstrap-withdrawal-annualised-holding-fees-input", "value"),
+    State("bootstrap-withdrawal-num-samples-input", "value"),
+    State("bootstrap-withdrawal-avg-block-length-input", "value"),
+    State("bootstrap-withdrawal-success-rate-input", "value"),
+    prevent_initial_call=True,
+)
+def solve_bootstrap_monthly_withdrawal(
+    _,
+    strategy_portfolio: str,
+    currency: Currency,
+    initial_capital: int | float,
+    coast_duration: int,
+    adjust_withdrawals_for_inflation: bool,
+    withdrawal_duration: int,
+    withdrawal_interval: int,
+    variable_transaction_fees: int | float,
+    fixed_transaction_fees: int | float,
+    annualised_holding_fees: int | float,
+    num_samples: int,
+    avg_block_len: int | float,
+    success_rate: int | float,
+):
+    strategy = WithdrawalBootstrapStrategy(
+        strategy_portfolio=Portfolio.model_validate_json(strategy_portfolio),
+        currency=currency,
+        initial_capital=initial_capital,
+        coast_duration=coast_duration,
+        monthly_withdrawal=0,
+        adjust_withdrawals_for_inflation=adjust_withdrawals_for_inflation,
+        withdrawal_duration=withdrawal_duration,
+        withdrawal_interval=withdrawal_interval,
+        variable_transaction_fees=variable_transaction_fees,
+        fixed_transaction_fees=fixed_transaction_fees,
+        annualised_holding_fees=annualised_holding_fees,
+        num_bootstrap_samples=num_samples,
+        avg_block_length=avg_block_len,
+    )
+    try:
+        monthly_withdrawal = strategy.safe_monthly_withdrawal(success_rate / 100)
+    except ValueError as e:
+        set_props("toast-store", {"data": str(e)})
+        return no_update
+    return np.floor(monthly_withdrawal * 100) / 100
+
+
 @callback(
     Output("bootstrap-withdrawal-graph", "figure"),
     Input("bootstrap-withdrawal-strategies", "value"),
     State("bootstrap-withdrawal-strategies", "options"),
     Input("bootstrap-withdrawal-y-var-selection", "value"),
     Input("bootstrap-withdrawal-log-scale-switch", "value"),
+    background=True,
+    interval=250,
+    progress=[
+        Output("bootstrap-withdrawal-progress", "value"),
+        Output("bootstrap-withdrawal-progress", "max"),
+    ],
+    running=[
+        (
+            Output("bootstrap-withdrawal-progress", "style"),
+            {"visibility": "visible"},
+            {"visibility": "hidden"},
+        )
+    ],
     prevent_initial_call=True,
 )
 def update_bootstrap_withdrawal_graph(
+    set_progress: Callable[[tuple[int, int]], None],
     strategy_strs: list[str],
     strategy_options: dict[str, str],
     y_var: BootstrapYVar,
     log_scale: bool,
 ):
     return update_bootstrap_strategy_graph(
+        set_progress,
         strategy_strs,
         strategy_options,
         y_var,
@@ -1665,5 +1979,144 @@ def update_bootstrap_withdrawal_graph(
     )
 
 
+@callback(
+    Output("sweep-base-strategy", "options"),
+    Input("backtest-accumulation-strategies", "options"),
+    Input("backtest-withdrawal-strategies", "options"),
+    prevent_initial_call=True,
+)
+def update_sweep_base_strategies(
+    accumulation_strategy_options: dict[str, str],
+    withdrawal_strategy_options: dict[str, str],
+):
+    return {**accumulation_strategy_options, **withdrawal_strategy_options}
+
+
+@callback(
+    Output("sweep-x-parameter-selection", "options"),
+    Output("sweep-y-parameter-selection", "options"),
+    Input("sweep-base-strategy", "value"),
+    prevent_initial_call=True,
+)
+def update_sweep_parameter_options(strategy_str: str):
+    strategy: BacktestStrategy = TypeAdapter(BacktestStrategy).validate_json(
+        strategy_str
+    )
+    parameter_options = {
+        parameter.value: parameter.label
+        for parameter in SweepParameter
+        if parameter.value in type(strategy).model_fields
+    }
+    if len(strategy.strategy_portfolio.allocations) > 1:
+        parameter_options[SweepParameter.ALLOCATION_WEIGHT.value] = (
+            SweepParameter.ALLOCATION_WEIGHT.label
+        )
+    return parameter_options, parameter_options
+
+
+def _parse_sweep_values(parameter: SweepParameter, values: str) -> list[int | float]:
+    # The strategy validates each value as it would a form input
+    parsed_values = [float(value) for value in values.split(",") if value.strip()]
+    if not parsed_values:
+        raise ValueError(f"Invalid values for {parameter.label}: {values}")
+    if all(value.is_integer() for value in parsed_values):
+        return [int(value) for value in parsed_values]
+    return parsed_values
+
+
+@callback(
+    Output("sweep-results-store", "data"),
+    Input("sweep-run-button", "n_clicks"),
+    State("sweep-base-strategy", "value"),
+    State("sweep-x-parameter-selection", "value"),
+    State("sweep-x-values-input", "value"),
+    State("sweep-y-parameter-selection", "value"),
+    State("sweep-y-values-input", "value"),
+    State("sweep-success-threshold-input", "value"),
+    prevent_initial_call=True,
+)
+def run_strategy_sweep(
+    _,
+    strategy_str: str | None,
+    x_parameter: SweepParameter | None,
+    x_values: str | None,
+    y_parameter: SweepParameter | None,
+    y_values: str | None,
+    success_threshold: int | float | None,
+):
+    if (
+        not strategy_str
+        or not x_parameter
+        or not y_parameter
+        or x_parameter == y_parameter
+        or not x_values
+        or not y_values
+    ):
+        return no_update
+    strategy: BacktestStrategy = TypeAdapter(BacktestStrategy).validate_json(
+        strategy_str
+    )
+    try:
+        parameter_grid: dict[str, list[int | float]] = {
+            x_parameter: _parse_sweep_values(SweepParameter(x_parameter), x_values),
+            y_parameter: _parse_sweep_values(SweepParameter(y_parameter), y_values),
+        }
+        results = sweep_backtest_strategies(
+            strategy, parameter_grid, success_threshold or 0
+        )
+    except ValueError:
+        return no_update
+    return results.write_json()
+
+
+@callback(
+    Output("sweep-graph", "figure"),
+    Input("sweep-results-store", "data"),
+    Input("sweep-metric-selection", "value"),
+    prevent_initial_call=True,
+)
+def update_sweep_graph(results_json: str | None, metric: SweepMetric):
+    if not results_json:
+        return no_update
+    results = pl.read_json(StringIO(results_json))
+    x_parameter, y_parameter = results.columns[:2]
+    value_format = (
+        ".1%"
+        if metric
+        in (
+            SweepMetric.SUCCESS_RATE,
+            SweepMetric.WORST_PERCENT_DRAWDOWN,
+        )
+        else ",.0f"
+    )
+    return {
+        "data": [
+            go.Heatmap(
+                x=results.get_column(x_parameter),
+                y=results.get_column(y_parameter),
+                z=results.get_column(metric),
+                colorscale="RdYlGn",
+                texttemplate=f"%{{z:{value_format}}}",
+                hovertemplate=(
+                    f"{SweepParameter(x_parameter).label}: %{{x}}<br>"
+                    f"{SweepParameter(y_parameter).label}: %{{y}}<br>"
+                    f"{SweepMetric(metric).label}: %{{z:{value_format}}}"
+                    "<extra></extra>"
+                ),
+            )
+        ],
+        "layout": go.Layout(
+            title="Strategy Sweep",
+            xaxis=go.layout.XAxis(
+                title=SweepParameter(x_parameter).label, type="category"
+            ),
+            yaxis=go.layout.YAxis(
+                title=SweepParameter(y_parameter).label, type="category"
+            ),
+            margin=go.layout.Margin(t=90, b=30, l=10, r=90, autoexpand=True),
+        ),
+    }
+
+
 if __name__ == "__main__":
     app.run()
@@ -1,7 +1,9 @@
 import asyncio
+from datetime import date
 from decimal import ROUND_HALF_UP, Decimal
 from functools import lru_cache, reduce
 from glob import glob
+from itertools import product
 from typing import Annotated, Generic, Literal, TypeVar
 
 import numpy as np
@@ -11,6 +13,7 @@ from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
+    PlainSerializer,
     TypeAdapter,
     computed_field,
     field_serializer,
@@ -19,11 +22,19 @@ from pydantic import (
 )
 
 from funcs.calcs_numpy import (
+    calculate_dca_portfolio_value_path,
     calculate_dca_portfolio_value_with_fees_and_interest_vector,
+    calculate_rebalanced_portfolio_value_path,
+    calculate_rebalanced_portfolio_value_paths,
+    calculate_withdrawal_portfolio_value_path,
     calculate_withdrawal_portfolio_value_with_fees_vector,
     generate_bootstrap_indices,
     simulate_bootstrap_accumulation,
     simulate_bootstrap_withdrawal,
+    solve_bootstrap_max_monthly_withdrawal,
+    solve_withdrawal_max_monthly_withdrawal_vector,
+    summarise_dca_portfolio_value_batch,
+    summarise_withdrawal_portfolio_value_batch,
 )
 from funcs.loaders_pl import (
     FtSymbolInfo,
@@ -61,6 +72,7 @@ from models import (
     MSCISize,
     MSCIStyle,
     OthersIndex,
+    Rebalancing,
     SGSDuration,
     TaxTreatment,
     USTreasuryDuration,
@@ -520,15 +532,87 @@ class Allocation(BaseModel):
         return f"{self.weight}% {self.security.label}"
 
 
+def load_aligned_returns(
+    securities: list[Security],
+    interval: Interval,
+    currency: Currency,
+    adjust_for_inflation: bool,
+) -> pl.DataFrame:
+    """Returns of each security over each period in which they all have prices, with
+    the first date as the start. Prices missing within that range are carried
+    forward."""
+    columns = [security.model_dump_json() for security in securities]
+    df = (
+        reduce(
+            lambda left, right: left.join(right, on="date", how="full", coalesce=True),
+            [
+                security.load_series(interval, currency, adjust_for_inflation).rename(
+                    {"price": column}
+                )
+                for security, column in zip(securities, columns)
+            ],
+        )
+        .sort("date")
+        .filter(
+            pl.col("date").is_between(
+                pl.max_horizontal(
+                    pl.col("date").filter(pl.col(column).is_not_null()).first()
+                    for column in columns
+                ),
+                pl.min_horizontal(
+                    pl.col("date").filter(pl.col(column).is_not_null()).last()
+                    for column in columns
+                ),
+            )
+        )
+    )
+    return df.select(
+        "date",
+        pl.col(columns).forward_fill().pct_change().fill_null(0),
+    )
+
+
 class Portfolio(BaseModel):
     model_config = ConfigDict(validate_assignment=True)
 
     holding_type: Literal["Portfolio"] = "Portfolio"
     allocations: list[Allocation]
+    rebalancing: Rebalancing = Rebalancing.MONTHLY
+    rebalancing_band: Decimal | None = Field(
+        default=None, ge=Decimal("0.01"), le=Decimal("100")
+    )
+
+    @field_validator("rebalancing_band", mode="after")
+    @classmethod
+    def parse_rebalancing_band(cls, v: Decimal | None) -> Decimal | None:
+        return (
+            None if v is None else v.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        )
+
+    @field_serializer("rebalancing_band")
+    def serialize_rebalancing_band(self, v: Decimal | None) -> float | None:
+        return None if v is None else float(v)
+
+    @model_validator(mode="after")
+    def check_rebalancing_band(self):
+        if (self.rebalancing == Rebalancing.THRESHOLD) != (
+            self.rebalancing_band is not None
+        ):
+            raise ValueError(
+                "A rebalancing band is required for, and only for, threshold rebalancing"
+            )
+        return self
 
     @property
     def label(self) -> str:
-        return ",\n".join(allocation.label for allocation in self.allocations)
+        label = ",\n".join(allocation.label for allocation in self.allocations)
+        if self.rebalancing == Rebalancing.NONE:
+            return f"{label}\n{self.rebalancing.label}"
+        if self.rebalancing == Rebalancing.THRESHOLD:
+            return f"{label}\nRebalanced at {self.rebalancing_band}% Drift"
+        if self.rebalancing != Rebalancing.MONTHLY:
+            return f"{label}\n{self.rebalancing.label} Rebalancing"
+        return label
 
     def add_allocation(self, new_allocation: Allocation):
         for allocation in self.allocations:
@@ -538,6 +622,34 @@ class Portfolio(BaseModel):
         else:
             self.allocations.append(new_allocation)
 
+    def with_first_weight(self, weight: Decimal) -> "Portfolio":
+        """Copy of the portfolio with the first holding at the given weight and the
+        rest sharing the remainder in proportion to their current weights."""
+        if len(self.allocations) < 2 or not 0 < weight < 100:
+            raise ValueError(f"Cannot give the first holding a weight of {weight}%")
+        first, *others = self.allocations
+        other_total = sum(allocation.weight for allocation in others)
+        remainder = 100 - weight
+        other_weights = [
+            (remainder * allocation.weight / other_total).quantize(
+                Decimal("0.01"), rounding=ROUND_HALF_UP
+            )
+            for allocation in others[:-1]
+        ]
+        # The last holding takes what rounding leaves so the weights still sum to 100
+        other_weights.append(remainder - sum(other_weights))
+        return self.model_copy(
+            update={
+                "allocations": [
+                    Allocation(security=first.security, weight=weight),
+                    *(
+                        Allocation(security=allocation.security, weight=other_weight)
+                        for allocation, other_weight in zip(others, other_weights)
+                    ),
+                ]
+            }
+        )
+
     def to_plotly_options(self) -> tuple[list[str], dict[str, str]]:
         d = {
             allocation.model_dump_json(exclude_none=True): allocation.label
@@ -548,42 +660,31 @@ class Portfolio(BaseModel):
     def load_series(
         self, interval: Interval, currency: Currency, adjust_for_inflation: bool
     ) -> pl.DataFrame:
-        dfs = [
-            allocation.security.load_series(
-                Interval.MONTHLY, currency, adjust_for_inflation
-            ).rename({"price": allocation.security.model_dump_json()})
-            for allocation in self.allocations
-        ]
-        portfolio_df = reduce(
-            lambda left, right: left.join(right, on="date", how="full", coalesce=True),
-            dfs,
-        )
-        portfolio_series = (
-            portfolio_df.with_columns(
-                pl.col(allocation.security.model_dump_json())
-                .pct_change()
-                .mul(allocation.weight)
-                .truediv(100)
-                for allocation in self.allocations
-            )
-            .select(
-                "date",
-                price=pl.sum_horizontal(pl.all().exclude("date"), ignore_nulls=False)
-                .add(1)
-                .cum_prod(),
-            )
-            .select(
-                "date",
-                price=pl.when(
-                    pl.int_range(pl.len())
-                    == pl.arg_where(pl.col("price").is_not_null()).first().sub(1)
+        returns_df = load_aligned_returns(
+            [allocation.security for allocation in self.allocations],
+            interval,
+            currency,
+            adjust_for_inflation,
+        )
+        if self.rebalancing in (Rebalancing.NONE, Rebalancing.THRESHOLD):
+            rebalance = pl.repeat(False, pl.len())
+        else:
+            period = pl.col("date").dt.truncate(self.rebalancing)
+            rebalance = period.ne(period.shift(-1)).fill_null(True)
+        weights = np.array(
+            [float(allocation.weight) / 100 for allocation in self.allocations]
+        )
+        return returns_df.select(
+            "date",
+            price=pl.Series(
+                calculate_rebalanced_portfolio_value_path(
+                    returns_df.drop("date").to_numpy(),
+                    weights,
+                    returns_df.select(rebalance).to_series().to_numpy(),
+                    float(self.rebalancing_band or 0) / 100,
                 )
-                .then(1)
-                .otherwise(pl.col("price")),
-            )
-            .drop_nulls()
+            ),
         )
-        return portfolio_series
 
 
 class NoneHolding(BaseModel):
@@ -604,10 +705,25 @@ type Holding = Annotated[
 ]
 
 
+BACKTEST_SUMMARY_COLUMNS = [
+    "ending_value",
+    "max_percent_drawdown",
+    "max_dollar_drawdown",
+    "months_to_depletion",
+    "min_value",
+]
+
+
 def convert_percent_to_decimal(v: float) -> float:
     return v / 100
 
 
+def convert_decimal_to_percent(v: float) -> float:
+    # Serialised strategies are validated again, so fees go back out as percents.
+    # Rounding drops the float error of dividing by 100 and multiplying back.
+    return round(v * 100, 10)
+
+
 class BaseAccumulationStrategy(BaseModel):
     strategy_phase: Literal["Accumulation"] = "Accumulation"
     strategy_portfolio: Portfolio
@@ -620,11 +736,15 @@ class BaseAccumulationStrategy(BaseModel):
     dca_interval: int = Field(default=1, ge=1)
     adjust_portfolio_value_for_inflation: bool = False
     variable_transaction_fees: Annotated[
-        float, AfterValidator(convert_percent_to_decimal)
+        float,
+        AfterValidator(convert_percent_to_decimal),
+        PlainSerializer(convert_decimal_to_percent),
     ] = Field(default=0, ge=0)
     fixed_transaction_fees: float = Field(default=0, ge=0)
     annualised_holding_fees: Annotated[
-        float, AfterValidator(convert_percent_to_decimal)
+        float,
+        AfterValidator(convert_percent_to_decimal),
+        PlainSerializer(convert_decimal_to_percent),
     ] = Field(default=0, ge=0)
 
     @computed_field
@@ -648,7 +768,7 @@ class BaseAccumulationStrategy(BaseModel):
 
 
 class AccumulationBacktestStrategy(BaseAccumulationStrategy):
-    def simulate(self) -> pl.DataFrame:
+    def load_inputs(self) -> pl.DataFrame:
         strategy_series = self.strategy_portfolio.load_series(
             Interval.MONTHLY,
             self.currency,
@@ -661,7 +781,7 @@ class AccumulationBacktestStrategy(BaseAccumulationStrategy):
         ).pipe(resample_bme)
         cpi = load_cpi(self.currency)
 
-        df = (
+        return (
             strategy_series.rename({"price": "strategy"})
             .join(
                 cash_returns.rename({"price": "cash"}),
@@ -672,22 +792,29 @@ class AccumulationBacktestStrategy(BaseAccumulationStrategy):
             .join(cpi, on="date", coalesce=True, maintain_order="left")
         )
 
+    def kernel_args(self, df: pl.DataFrame) -> tuple:
+        return (
+            df.get_column("strategy").pct_change().to_numpy(),
+            self.dca_duration,
+            self.dca_interval,
+            self.strategy_horizon,
+            self.investment_amount,
+            self.monthly_investment,
+            self.adjust_monthly_investment_for_inflation,
+            self.variable_transaction_fees,
+            self.fixed_transaction_fees,
+            self.annualised_holding_fees,
+            self.adjust_portfolio_value_for_inflation,
+            df.get_column("cpi").to_numpy(writable=True),
+            df.get_column("cash").pct_change().to_numpy(writable=True),
+        )
+
+    def simulate(self) -> pl.DataFrame:
+        df = self.load_inputs()
         portfolio_values = (
             pl.from_numpy(
                 calculate_dca_portfolio_value_with_fees_and_interest_vector(
-                    df.get_column("strategy").pct_change().to_numpy(),
-                    self.dca_duration,
-                    self.dca_interval,
-                    self.strategy_horizon,
-                    self.investment_amount,
-                    self.monthly_investment,
-                    self.adjust_monthly_investment_for_inflation,
-                    self.variable_transaction_fees,
-                    self.fixed_transaction_fees,
-                    self.annualised_holding_fees,
-                    self.adjust_portfolio_value_for_inflation,
-                    df.get_column("cpi").to_numpy(),
-                    df.get_column("cash").pct_change().to_numpy(writable=True),
+                    *self.kernel_args(df)
                 ),
                 schema=[str(i) for i in range(self.strategy_horizon + 1)],
             )
@@ -696,6 +823,73 @@ class AccumulationBacktestStrategy(BaseAccumulationStrategy):
         )
         return portfolio_values
 
+    @classmethod
+    def simulate_summary_batch(
+        cls, strategies: list["AccumulationBacktestStrategy"]
+    ) -> list[pl.DataFrame]:
+        df = strategies[0].load_inputs()
+        summaries = summarise_dca_portfolio_value_batch(
+            df.get_column("strategy").pct_change().to_numpy(),
+            df.get_column("cpi").to_numpy(writable=True),
+            df.get_column("cash").pct_change().to_numpy(writable=True),
+            np.array([strategy.dca_duration for strategy in strategies]),
+            np.array([strategy.dca_interval for strategy in strategies]),
+            np.array([strategy.strategy_horizon for strategy in strategies]),
+            np.array(
+                [strategy.investment_amount for strategy in strategies], dtype=float
+            ),
+            np.array(
+                [strategy.monthly_investment for strategy in strategies], dtype=float
+            ),
+            np.array(
+                [
+                    strategy.adjust_monthly_investment_for_inflation
+                    for strategy in strategies
+                ]
+            ),
+            np.array(
+                [strategy.variable_transaction_fees for strategy in strategies],
+                dtype=float,
+            ),
+            np.array(
+                [strategy.fixed_transaction_fees for strategy in strategies],
+                dtype=float,
+            ),
+            np.array(
+                [strategy.annualised_holding_fees for strategy in strategies],
+                dtype=float,
+            ),
+            np.array(
+                [
+                    strategy.adjust_portfolio_value_for_inflation
+                    for strategy in strategies
+                ]
+            ),
+        )
+        return [
+            pl.from_numpy(summary, schema=BACKTEST_SUMMARY_COLUMNS)
+            .fill_nan(None)
+            .insert_column(0, df.get_column("date"))
+            for summary in summaries
+        ]
+
+    def simulate_path(self, end_date: date) -> pl.DataFrame | None:
+        df = self.load_inputs()
+        end_index = df.get_column("date").index_of(end_date)
+        if end_index is None or end_index < self.strategy_horizon:
+            return None
+        start_index = end_index - self.strategy_horizon
+        return pl.DataFrame(
+            {
+                "date": df.get_column("date").slice(
+                    start_index, self.strategy_horizon + 1
+                ),
+                "portfolio_value": calculate_dca_portfolio_value_path(
+                    start_index, *self.kernel_args(df)
+                ),
+            }
+        )
+
 
 class AccumulationBootstrapStrategy(BaseAccumulationStrategy):
     num_bootstrap_samples: int = Field(default=1000, ge=100)
@@ -762,6 +956,20 @@ class AccumulationBootstrapStrategy(BaseAccumulationStrategy):
         return portfolio_values
 
 
+def _safe_monthly_withdrawal(max_withdrawals: np.ndarray, success_rate: float) -> float:
+    # A withdrawal succeeds in a window exactly when it is at most that window's
+    # maximum, so the safe withdrawal is a quantile of the per-window maxima. Taking
+    # the lower order statistic keeps the success rate from falling below the target.
+    if not 0 < success_rate <= 1:
+        raise ValueError("The success rate must be above 0% and at most 100%")
+    max_withdrawals = max_withdrawals[~np.isnan(max_withdrawals)]
+    if len(max_withdrawals) == 0:
+        raise ValueError("Not enough data to cover the strategy horizon")
+    if np.isinf(max_withdrawals).any():
+        raise ValueError("The strategy makes no withdrawals within its horizon")
+    return float(np.quantile(max_withdrawals, 1 - success_rate, method="lower"))
+
+
 class BaseWithdrawalStrategy(BaseModel):
     strategy_phase: Literal["Withdrawal"] = "Withdrawal"
     strategy_portfolio: Portfolio
@@ -774,11 +982,15 @@ class BaseWithdrawalStrategy(BaseModel):
     withdrawal_duration: int = Field(ge=0)
     withdrawal_interval: int = Field(default=1, ge=1)
     variable_transaction_fees: Annotated[
-        float, AfterValidator(convert_percent_to_decimal)
+        float,
+        AfterValidator(convert_percent_to_decimal),
+        PlainSerializer(convert_decimal_to_percent),
     ] = Field(default=0, ge=0)
     fixed_transaction_fees: float = Field(default=0, ge=0)
     annualised_holding_fees: Annotated[
-        float, AfterValidator(convert_percent_to_decimal)
+        float,
+        AfterValidator(convert_percent_to_decimal),
+        PlainSerializer(convert_decimal_to_percent),
     ] = Field(default=0, ge=0)
 
     @computed_field
@@ -802,7 +1014,7 @@ class BaseWithdrawalStrategy(BaseModel):
 
 
 class WithdrawalBacktestStrategy(BaseWithdrawalStrategy):
-    def simulate(self) -> pl.DataFrame:
+    def load_inputs(self) -> pl.DataFrame:
         strategy_series = self.strategy_portfolio.load_series(
             Interval.MONTHLY,
             self.currency,
@@ -810,32 +1022,132 @@ class WithdrawalBacktestStrategy(BaseWithdrawalStrategy):
         )
         cpi = load_cpi(self.currency)
 
-        df = strategy_series.rename({"price": "strategy"}).join(
+        return strategy_series.rename({"price": "strategy"}).join(
             cpi, on="date", coalesce=True, maintain_order="left"
         )
 
+    def kernel_args(self, df: pl.DataFrame) -> tuple:
+        return (
+            df.get_column("strategy").pct_change().to_numpy(),
+            self.coast_duration,
+            self.strategy_horizon,
+            self.withdrawal_interval,
+            self.initial_capital,
+            self.monthly_withdrawal,
+            df.get_column("cpi").to_numpy(writable=True),
+            self.variable_transaction_fees,
+            self.fixed_transaction_fees,
+            self.annualised_holding_fees,
+            self.adjust_withdrawals_for_inflation,
+            self.adjust_portfolio_value_for_inflation,
+        )
+
+    def simulate(self) -> pl.DataFrame:
+        df = self.load_inputs()
         portfolio_values = (
             pl.from_numpy(
                 calculate_withdrawal_portfolio_value_with_fees_vector(
-                    df.get_column("strategy").pct_change().to_numpy(),
+                    *self.kernel_args(df)
+                ),
+                schema=[str(i) for i in range(self.strategy_horizon + 1)],
+            )
+            .fill_nan(None)
+            .insert_column(0, df.get_column("date"))
+        )
+        return portfolio_values
+
+    @classmethod
+    def simulate_summary_batch(
+        cls, strategies: list["WithdrawalBacktestStrategy"]
+    ) -> list[pl.DataFrame]:
+        df = strategies[0].load_inputs()
+        summaries = summarise_withdrawal_portfolio_value_batch(
+            df.get_column("strategy").pct_change().to_numpy(),
+            df.get_column("cpi").to_numpy(writable=True),
+            np.array([strategy.coast_duration for strategy in strategies]),
+            np.array([strategy.strategy_horizon for strategy in strategies]),
+            np.array([strategy.withdrawal_interval for strategy in strategies]),
+            np.array(
+                [strategy.initial_capital for strategy in strategies], dtype=float
+            ),
+            np.array(
+                [strategy.monthly_withdrawal for strategy in strategies], dtype=float
+            ),
+            np.array(
+                [strategy.variable_transaction_fees for strategy in strategies],
+                dtype=float,
+            ),
+            np.array(
+                [strategy.fixed_transaction_fees for strategy in strategies],
+                dtype=float,
+            ),
+            np.array(
+                [strategy.annualised_holding_fees for strategy in strategies],
+                dtype=float,
+            ),
+            np.array(
+                [strategy.adjust_withdrawals_for_inflation for strategy in strategies]
+            ),
+            np.array(
+                [
+                    strategy.adjust_portfolio_value_for_inflation
+                    for strategy in strategies
+                ]
+            ),
+        )
+        return [
+            pl.from_numpy(summary, schema=BACKTEST_SUMMARY_COLUMNS)
+            .fill_nan(None)
+            .insert_column(0, df.get_column("date"))
+            for summary in summaries
+        ]
+
+    def simulate_path(self, end_date: date) -> pl.DataFrame | None:
+        df = self.load_inputs()
+        end_index = df.get_column("date").index_of(end_date)
+        if end_index is None or end_index < self.strategy_horizon:
+            return None
+        start_index = end_index - self.strategy_horizon
+        return pl.DataFrame(
+            {
+                "date": df.get_column("date").slice(
+                    start_index, self.strategy_horizon + 1
+                ),
+                "portfolio_value": calculate_withdrawal_portfolio_value_path(
+                    start_index, *self.kernel_args(df)
+                ),
+            }
+        )
+
+    def solve_max_monthly_withdrawal(self, tolerance: float = 0.01) -> pl.DataFrame:
+        df = self.load_inputs()
+        return pl.DataFrame(
+            {
+                "date": df.get_column("date"),
+                "max_monthly_withdrawal": solve_withdrawal_max_monthly_withdrawal_vector(
+                    df.get_column("strategy").pct_change().to_numpy(writable=True),
                     self.coast_duration,
                     self.strategy_horizon,
                     self.withdrawal_interval,
                     self.initial_capital,
-                    self.monthly_withdrawal,
-                    df.get_column("cpi").to_numpy(),
+                    df.get_column("cpi").to_numpy(writable=True),
                     self.variable_transaction_fees,
                     self.fixed_transaction_fees,
                     self.annualised_holding_fees,
                     self.adjust_withdrawals_for_inflation,
-                    self.adjust_portfolio_value_for_inflation,
+                    tolerance,
                 ),
-                schema=[str(i) for i in range(self.strategy_horizon + 1)],
-            )
-            .fill_nan(None)
-            .insert_column(0, df.get_column("date"))
+            }
+        ).fill_nan(None)
+
+    def safe_monthly_withdrawal(self, success_rate: float) -> float:
+        return _safe_monthly_withdrawal(
+            self.solve_max_monthly_withdrawal()
+            .get_column("max_monthly_withdrawal")
+            .drop_nulls()
+            .to_numpy(),
+            success_rate,
         )
-        return portfolio_values
 
 
 class WithdrawalBootstrapStrategy(BaseWithdrawalStrategy):
@@ -849,7 +1161,7 @@ class WithdrawalBootstrapStrategy(BaseWithdrawalStrategy):
             f"{self.num_bootstrap_samples} samples, {self.avg_block_length:.0f}mo avg block"
         )
 
-    def simulate(self) -> np.ndarray:
+    def load_inputs(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
         strategy_series = self.strategy_portfolio.load_series(
             Interval.MONTHLY,
             self.currency,
@@ -872,6 +1184,10 @@ class WithdrawalBootstrapStrategy(BaseWithdrawalStrategy):
             n_data,
             self.avg_block_length,
         )
+        return monthly_returns, cpi, indices
+
+    def simulate(self) -> np.ndarray:
+        monthly_returns, cpi, indices = self.load_inputs()
         portfolio_values = simulate_bootstrap_withdrawal(
             monthly_returns,
             cpi,
@@ -889,6 +1205,28 @@ class WithdrawalBootstrapStrategy(BaseWithdrawalStrategy):
         )
         return portfolio_values
 
+    def solve_max_monthly_withdrawal(self, tolerance: float = 0.01) -> np.ndarray:
+        monthly_returns, cpi, indices = self.load_inputs()
+        return solve_bootstrap_max_monthly_withdrawal(
+            monthly_returns,
+            cpi,
+            indices,
+            self.coast_duration,
+            self.strategy_horizon,
+            self.withdrawal_interval,
+            self.initial_capital,
+            self.variable_transaction_fees,
+            self.fixed_transaction_fees,
+            self.annualised_holding_fees,
+            self.adjust_withdrawals_for_inflation,
+            tolerance,
+        )
+
+    def safe_monthly_withdrawal(self, success_rate: float) -> float:
+        return _safe_monthly_withdrawal(
+            self.solve_max_monthly_withdrawal(), success_rate
+        )
+
 
 type BacktestStrategy = Annotated[
     AccumulationBacktestStrategy | WithdrawalBacktestStrategy,
@@ -899,3 +1237,147 @@ type BootstrapStrategy = Annotated[
     AccumulationBootstrapStrategy | WithdrawalBootstrapStrategy,
     Field(discriminator="strategy_phase"),
 ]
+
+
+def simulate_backtest_summaries(
+    strategies: list[BacktestStrategy],
+) -> list[pl.DataFrame]:
+    groups: dict[tuple[str, str, Currency], list[int]] = {}
+    for i, strategy in enumerate(strategies):
+        groups.setdefault(
+            (
+                strategy.strategy_phase,
+                strategy.strategy_portfolio.model_dump_json(),
+                strategy.currency,
+            ),
+            [],
+        ).append(i)
+
+    summaries: dict[int, pl.DataFrame] = {}
+    for indices in groups.values():
+        group = [strategies[i] for i in indices]
+        if isinstance(group[0], AccumulationBacktestStrategy):
+            batch = AccumulationBacktestStrategy.simulate_summary_batch(
+                [s for s in group if isinstance(s, AccumulationBacktestStrategy)]
+            )
+        else:
+            batch = WithdrawalBacktestStrategy.simulate_summary_batch(
+                [s for s in group if isinstance(s, WithdrawalBacktestStrategy)]
+            )
+        summaries.update(zip(indices, batch))
+    return [summaries[i] for i in range(len(strategies))]
+
+
+def sweep_backtest_strategies(
+    base_strategy: BacktestStrategy,
+    parameter_grid: dict[str, list],
+    success_threshold: float = 0,
+) -> pl.DataFrame:
+    parameter_names = list(parameter_grid)
+    combinations = list(product(*parameter_grid.values()))
+    strategies: list[BacktestStrategy] = []
+    for combination in combinations:
+        update = dict(zip(parameter_names, combination))
+        if "allocation_weight" in update:
+            update["strategy_portfolio"] = (
+                base_strategy.strategy_portfolio.with_first_weight(
+                    Decimal(str(update.pop("allocation_weight")))
+                )
+            )
+        strategies.append(
+            type(base_strategy).model_validate({**base_strategy.model_dump(), **update})
+        )
+    metrics = pl.concat(
+        [
+            summary.filter(pl.col("ending_value").is_not_null()).select(
+                success_rate=(pl.col("ending_value") > success_threshold).mean(),
+                median_ending_value=pl.col("ending_value").median(),
+                worst_percent_drawdown=pl.col("max_percent_drawdown").min(),
+                worst_dollar_drawdown=pl.col("max_dollar_drawdown").min(),
+                num_windows=pl.len(),
+            )
+            for summary in simulate_backtest_summaries(strategies)
+        ]
+    )
+    parameters = pl.DataFrame(combinations, schema=parameter_names, orient="row")
+    return pl.concat([parameters, metrics], how="horizontal")
+
+
+FRONTIER_CANDIDATES = 5000
+
+
+def _on_frontier(risks: np.ndarray, returns: np.ndarray) -> np.ndarray:
+    # Among candidates as risky, the highest return comes first so it alone is kept
+    order = np.lexsort((-returns, risks))
+    sorted_returns = returns[order]
+    best_returns = np.maximum.accumulate(sorted_returns)
+    on_frontier = np.empty(len(returns), dtype=np.bool_)
+    on_frontier[order] = sorted_returns > np.concatenate(([-np.inf], best_returns[:-1]))
+    return on_frontier
+
+
+@lru_cache
+def compute_efficient_frontier(
+    securities_json: frozenset[str], currency: Currency
+) -> pl.DataFrame:
+    """Weights, annualised return and risk of random monthly rebalanced portfolios
+    of the securities, and whether no other candidate has a higher return for as
+    little volatility or drawdown."""
+    securities = [
+        TypeAdapter(Security).validate_json(security_json)
+        for security_json in sorted(securities_json)
+    ]
+    returns_df = load_aligned_returns(securities, Interval.MONTHLY, currency, False)
+    weight_columns = returns_df.drop("date").columns
+    # Volatility needs at least two monthly returns after the start date
+    if returns_df.height < 3:
+        return pl.DataFrame(
+            schema={
+                **{column: pl.Float64 for column in weight_columns},
+                "annualised_return": pl.Float64,
+                "volatility": pl.Float64,
+                "max_drawdown": pl.Float64,
+                "volatility_frontier": pl.Boolean,
+                "max_drawdown_frontier": pl.Boolean,
+            }
+        )
+    asset_returns = returns_df.drop("date").to_numpy()
+    num_periods, num_assets = asset_returns.shape
+    weights = np.vstack(
+        [
+            np.eye(num_assets),
+            np.random.default_rng(0).dirichlet(
+                np.ones(num_assets), FRONTIER_CANDIDATES - num_assets
+            ),
+        ]
+    )
+
+    # One row of values per candidate, rebalanced at the end of every month
+    portfolio_values = calculate_rebalanced_portfolio_value_paths(
+        asset_returns, weights, np.ones(num_periods, dtype=np.bool_), 0.0
+    )
+    annualised_returns = portfolio_values[:, -1] ** (12 / (num_periods - 1)) - 1
+    annualised_cov = np.atleast_2d(np.cov(asset_returns[1:], rowvar=False)) * 12
+    volatilities = np.sqrt(np.einsum("ij,jk,ik->i", weights, annualised_cov, weights))
+    running_max = np.maximum.accumulate(portfolio_values, axis=1)
+    max_drawdowns = (portfolio_values / running_max - 1).min(axis=1)
+
+    return pl.concat(
+        [
+            pl.DataFrame(weights, schema=weight_columns),
+            pl.DataFrame(
+                {
+                    "annualised_return": annualised_returns,
+                    "volatility": volatilities,
+                    "max_drawdown": max_drawdowns,
+                    "volatility_frontier": _on_frontier(
+                        volatilities, annualised_returns
+                    ),
+                    "max_drawdown_frontier": _on_frontier(
+                        -max_drawdowns, annualised_returns
+                    ),
+                }
+            ),
+        ],
+        how="horizontal",
+    )
@@ -0,0 +1,354 @@
+import numpy as np
+import pytest
+
+from funcs.calcs_numpy import (
+    calculate_dca_portfolio_value_path,
+    calculate_dca_portfolio_value_with_fees_and_interest_vector,
+    calculate_rebalanced_portfolio_value_path,
+    calculate_rebalanced_portfolio_value_paths,
+    calculate_withdrawal_portfolio_value_path,
+    calculate_withdrawal_portfolio_value_with_fees_vector,
+    solve_withdrawal_max_monthly_withdrawal_vector,
+    summarise_dca_portfolio_value_batch,
+    summarise_dca_portfolio_value_with_fees_and_interest_vector,
+    summarise_withdrawal_portfolio_value_batch,
+    summarise_withdrawal_portfolio_value_with_fees_vector,
+)
+
+HORIZON = 12
+NUM_MONTHS = 240
+
+
+def make_inputs(seed: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    monthly_returns = rng.normal(0.005, 0.05, NUM_MONTHS)
+    monthly_returns[0] = np.nan
+    cpi = 100 * np.cumprod(1 + rng.normal(0.002, 0.003, NUM_MONTHS))
+    cash_returns = np.abs(rng.normal(0.002, 0.001, NUM_MONTHS))
+    cash_returns[0] = np.nan
+    return monthly_returns, cpi, cash_returns
+
+
+def dca_args(monthly_returns, cpi, cash_returns, dca_duration, coast_duration):
+    return (
+        monthly_returns,
+        dca_duration,
+        3,
+        dca_duration + coast_duration,
+        1000.0,
+        100.0,
+        True,
+        0.001,
+        1.0,
+        0.002,
+        True,
+        cpi,
+        cash_returns,
+    )
+
+
+def withdrawal_args(monthly_returns, cpi, coast_duration, withdrawal_duration):
+    # Large enough withdrawals that some windows run out of money
+    return (
+        monthly_returns,
+        coast_duration,
+        coast_duration + withdrawal_duration,
+        2,
+        10000.0,
+        100.0,
+        cpi,
+        0.001,
+        1.0,
+        0.002,
+        True,
+        False,
+    )
+
+
+def summarise_paths_reference(paths: np.ndarray) -> np.ndarray:
+    summaries = np.full((len(paths), 5), np.nan)
+    for i, path in enumerate(paths):
+        if np.isnan(path).any():
+            continue
+        running_max = np.maximum.accumulate(path)
+        percent_drawdowns = np.divide(
+            path,
+            running_max,
+            out=np.ones_like(path),
+            where=running_max > 0,
+        )
+        depleted = np.flatnonzero((path[1:] <= 0) & (path[:-1] > 0))
+        summaries[i] = (
+            path[-1],
+            percent_drawdowns.min() - 1,
+            (path - running_max).min(),
+            depleted[0] + 1 if depleted.size else np.nan,
+            path.min(),
+        )
+    return summaries
+
+
+def solve_flat(
+    coast_duration: int = 0,
+    withdrawal_interval: int = 1,
+    initial_capital: float = 1200.0,
+) -> np.ndarray:
+    return solve_withdrawal_max_monthly_withdrawal_vector(
+        np.zeros(HORIZON + 3),
+        coast_duration,
+        HORIZON,
+        withdrawal_interval,
+        initial_capital,
+        np.full(HORIZON + 3, 100.0),
+        0.0,
+        0.0,
+        0.0,
+        False,
+        0.01,
+    )
+
+
+def test_max_withdrawal_needs_a_full_horizon():
+    max_withdrawals = solve_flat()
+    assert np.isnan(max_withdrawals[:HORIZON]).all()
+    assert not np.isnan(max_withdrawals[HORIZON:]).any()
+
+
+@pytest.mark.parametrize("withdrawal_interval", [1, 3])
+def test_max_withdrawal_spends_the_capital(withdrawal_interval):
+    # Without returns or fees, 1200 lasts 12 months at just under 100 a month
+    max_withdrawals = solve_flat(withdrawal_interval=withdrawal_interval)[HORIZON:]
+    assert ((max_withdrawals > 99.98) & (max_withdrawals < 100)).all()
+
+
+def test_max_withdrawal_is_unbounded_without_withdrawals():
+    assert np.isposinf(solve_flat(coast_duration=HORIZON)[HORIZON:]).all()
+
+
+def test_max_withdrawal_of_no_capital_is_zero():
+    assert (solve_flat(initial_capital=0.0)[HORIZON:] == 0).all()
+
+
+def test_max_withdrawal_is_the_largest_that_lasts():
+    rng = np.random.default_rng(0)
+    returns = rng.normal(0.005, 0.04, 120)
+    cpi = 100 * np.cumprod(np.full(120, 1.002))
+    strategy = (6, 60, 1, 10000.0)
+    fees = (0.001, 1.0, 0.002, True)
+    tolerance = 0.01
+    max_withdrawals = solve_withdrawal_max_monthly_withdrawal_vector(
+        returns, *strategy, cpi, *fees, tolerance
+    )
+    for i in range(60, 120):
+        ending_values = [
+            calculate_withdrawal_portfolio_value_with_fees_vector(
+                returns, *strategy, withdrawal, cpi, *fees, False
+            )[i, -1]
+            for withdrawal in (max_withdrawals[i], max_withdrawals[i] + tolerance)
+        ]
+        assert ending_values[0] > 0
+        assert not ending_values[1] > 0
+
+
+@pytest.mark.parametrize(
+    ("dca_duration", "coast_duration"), [(1, 0), (12, 0), (24, 36)]
+)
+def test_dca_summaries_match_full_paths(dca_duration, coast_duration):
+    args = dca_args(*make_inputs(4), dca_duration, coast_duration)
+    np.testing.assert_allclose(
+        summarise_dca_portfolio_value_with_fees_and_interest_vector(*args),
+        summarise_paths_reference(
+            calculate_dca_portfolio_value_with_fees_and_interest_vector(*args)
+        ),
+        rtol=1e-12,
+    )
+
+
+@pytest.mark.parametrize(
+    ("coast_duration", "withdrawal_duration"), [(0, 1), (0, 120), (24, 96)]
+)
+def test_withdrawal_summaries_match_full_paths(coast_duration, withdrawal_duration):
+    monthly_returns, cpi, _ = make_inputs(5)
+    args = withdrawal_args(monthly_returns, cpi, coast_duration, withdrawal_duration)
+    summaries = summarise_withdrawal_portfolio_value_with_fees_vector(*args)
+    np.testing.assert_allclose(
+        summaries,
+        summarise_paths_reference(
+            calculate_withdrawal_portfolio_value_with_fees_vector(*args)
+        ),
+        rtol=1e-12,
+    )
+    if withdrawal_duration == 120:
+        assert 0 < np.isfinite(summaries[:, 3]).sum() < NUM_MONTHS - withdrawal_duration
+
+
+def test_dca_batch_matches_single_strategies():
+    monthly_returns, cpi, cash_returns = make_inputs(8)
+    strategies = [
+        dca_args(monthly_returns, cpi, cash_returns, dca_duration, coast_duration)
+        for dca_duration, coast_duration in [(12, 0), (120, 60), (1, 0), (36, 12)]
+    ]
+    # The batch takes each per-strategy argument as an array over strategies
+    batch = summarise_dca_portfolio_value_batch(
+        monthly_returns,
+        cpi,
+        cash_returns,
+        *(np.array(column) for column in list(zip(*strategies))[1:11]),
+    )
+    for summary, args in zip(batch, strategies):
+        np.testing.assert_array_equal(
+            summary, summarise_dca_portfolio_value_with_fees_and_interest_vector(*args)
+        )
+
+
+def test_withdrawal_batch_matches_single_strategies():
+    monthly_returns, cpi, _ = make_inputs(9)
+    strategies = [
+        withdrawal_args(monthly_returns, cpi, coast_duration, withdrawal_duration)
+        for coast_duration, withdrawal_duration in [(0, 120), (60, 12), (0, 1)]
+    ]
+    columns = list(zip(*strategies))
+    # The batch takes each per-strategy argument as an array over strategies
+    batch = summarise_withdrawal_portfolio_value_batch(
+        monthly_returns,
+        cpi,
+        *(np.array(column) for column in columns[1:6] + columns[7:]),
+    )
+    for summary, args in zip(batch, strategies):
+        np.testing.assert_array_equal(
+            summary, summarise_withdrawal_portfolio_value_with_fees_vector(*args)
+        )
+
+
+def test_dca_path_matches_full_matrix():
+    args = dca_args(*make_inputs(6), 24, 36)
+    paths = calculate_dca_portfolio_value_with_fees_and_interest_vector(*args)
+    last_start = NUM_MONTHS - 60 - 1
+    for start_index in (0, 1, 100, last_start):
+        np.testing.assert_array_equal(
+            calculate_dca_portfolio_value_path(start_index, *args),
+            paths[start_index + 60],
+        )
+
+
+def test_withdrawal_path_matches_full_matrix():
+    monthly_returns, cpi, _ = make_inputs(7)
+    args = withdrawal_args(monthly_returns, cpi, 24, 96)
+    paths = calculate_withdrawal_portfolio_value_with_fees_vector(*args)
+    last_start = NUM_MONTHS - 120 - 1
+    for start_index in (0, 1, 60, last_start):
+        np.testing.assert_array_equal(
+            calculate_withdrawal_portfolio_value_path(start_index, *args),
+            paths[start_index + 120],
+        )
+
+
+def rebalanced_portfolio_value_path_reference(
+    asset_returns: np.ndarray,
+    weights: np.ndarray,
+    rebalance: np.ndarray,
+    rebalancing_band: float,
+) -> list[float]:
+    holdings = list(weights)
+    values = [1.0]
+    for t in range(1, len(asset_returns)):
+        holdings = [h * (1 + r) for h, r in zip(holdings, asset_returns[t])]
+        value = sum(holdings)
+        values.append(value)
+        drifted = value > 0 and any(
+            abs(h / value - w) > rebalancing_band for h, w in zip(holdings, weights)
+        )
+        if rebalance[t] or (rebalancing_band > 0 and drifted):
+            holdings = [value * w for w in weights]
+    return values
+
+
+REBALANCING_MODES = {
+    "none": (False, 0.0),
+    "periodic": (True, 0.0),
+    "threshold": (False, 0.05),
+    "periodic_and_threshold": (True, 0.05),
+}
+
+
+@pytest.mark.parametrize("mode", REBALANCING_MODES)
+def test_rebalanced_portfolio_matches_reference(mode):
+    periodic, rebalancing_band = REBALANCING_MODES[mode]
+    rng = np.random.default_rng(1)
+    asset_returns = rng.normal(0.01, 0.05, (120, 3))
+    asset_returns[0] = 0
+    weights = np.array([0.5, 0.3, 0.2])
+    rebalance = (np.arange(120) % 12 == 11) & periodic
+    np.testing.assert_allclose(
+        calculate_rebalanced_portfolio_value_path(
+            asset_returns, weights, rebalance, rebalancing_band
+        ),
+        rebalanced_portfolio_value_path_reference(
+            asset_returns, weights, rebalance, rebalancing_band
+        ),
+        rtol=1e-12,
+    )
+
+
+@pytest.mark.parametrize("mode", REBALANCING_MODES)
+def test_rebalanced_portfolio_that_loses_everything(mode):
+    periodic, rebalancing_band = REBALANCING_MODES[mode]
+    asset_returns = np.full((12, 2), 0.01)
+    asset_returns[0] = 0
+    asset_returns[5] = -1
+    weights = np.array([0.6, 0.4])
+    rebalance = (np.arange(12) % 3 == 2) & periodic
+    values = calculate_rebalanced_portfolio_value_path(
+        asset_returns, weights, rebalance, rebalancing_band
+    )
+    np.testing.assert_allclose(
+        values,
+        rebalanced_portfolio_value_path_reference(
+            asset_returns, weights, rebalance, rebalancing_band
+        ),
+    )
+    assert (values[5:] == 0).all()
+
+
+def test_portfolio_without_rebalancing_buys_and_holds():
+    rng = np.random.default_rng(2)
+    asset_returns = rng.normal(0.01, 0.05, (60, 2))
+    asset_returns[0] = 0
+    weights = np.array([0.7, 0.3])
+    np.testing.assert_allclose(
+        calculate_rebalanced_portfolio_value_path(
+            asset_returns, weights, np.zeros(60, dtype=np.bool_), 0.0
+        ),
+        np.cumprod(1 + asset_returns, axis=0) @ weights,
+        rtol=1e-12,
+    )
+
+
+def test_rebalanced_portfolio_paths_match_single_paths():
+    rng = np.random.default_rng(3)
+    asset_returns = rng.normal(0.01, 0.05, (60, 3))
+    asset_returns[0] = 0
+    weights = rng.dirichlet(np.ones(3), 8)
+    rebalance = np.arange(60) % 3 == 2
+    paths = calculate_rebalanced_portfolio_value_paths(
+        asset_returns, weights, rebalance, 0.05
+    )
+    for k in range(len(weights)):
+        np.testing.assert_array_equal(
+            paths[k],
+            calculate_rebalanced_portfolio_value_path(
+                asset_returns, weights[k], rebalance, 0.05
+            ),
+        )
+
+
+def test_rebalanced_portfolio_without_periods():
+    asset_returns = np.empty((0, 2))
+    weights = np.array([0.5, 0.5])
+    rebalance = np.empty(0, dtype=np.bool_)
+    assert calculate_rebalanced_portfolio_value_path(
+        asset_returns, weights, rebalance, 0.05
+    ).shape == (0,)
+    assert calculate_rebalanced_portfolio_value_paths(
+        asset_returns, weights[None], rebalance, 0.05
+    ).shape == (1, 0)
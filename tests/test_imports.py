@@ -0,0 +1,42 @@
+import subprocess
+import sys
+from pathlib import Path
+
+# numba imports the top-level scipy package itself to check its version, which
+# is cheap, so only the submodule the loaders use is kept lazy
+LAZY_MODULES = ["yfinance", "pandas", "bs4", "curl_cffi", "scipy.interpolate"]
+
+
+def test_dashboard_imports_loader_dependencies_lazily():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, returns_dashboard; "
+            f"print(*[module for module in {LAZY_MODULES} if module in sys.modules])",
+        ],
+        cwd=Path(__file__).parent.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.split() == []
+
+
+def test_gunicorn_master_does_not_import_polars():
+    # The workers fork from the master after on_starting, and a process forked
+    # after importing polars hangs at exit
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import runpy, sys; "
+            "runpy.run_path('gunicorn.conf.py')['on_starting'](None); "
+            "print('polars' in sys.modules)",
+        ],
+        cwd=Path(__file__).parent.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.split() == ["False"]
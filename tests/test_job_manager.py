@@ -0,0 +1,69 @@
+import threading
+import time
+
+import diskcache
+import pytest
+
+import job_manager
+from job_manager import single_flight
+
+
+@pytest.fixture(autouse=True)
+def job_cache(tmp_path, monkeypatch):
+    cache = diskcache.Cache(tmp_path)
+    monkeypatch.setattr(job_manager, "job_cache", cache)
+    yield cache
+    cache.close()
+
+
+def test_lone_call_stores_nothing(job_cache):
+    @single_flight
+    def double(x):
+        return 2 * x
+
+    assert double(21) == 42
+    assert len(job_cache) == 0
+
+
+def test_concurrent_calls_share_one_computation(job_cache):
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    @single_flight
+    def slow_double(x):
+        calls.append(x)
+        started.set()
+        release.wait(5)
+        return 2 * x
+
+    results = []
+    claimer = threading.Thread(target=lambda: results.append(slow_double(21)))
+    claimer.start()
+    assert started.wait(5)
+    waiters = [
+        threading.Thread(target=lambda: results.append(slow_double(21)))
+        for _ in range(3)
+    ]
+    for waiter in waiters:
+        waiter.start()
+    # Let every waiter count itself on the claim before the result is ready
+    deadline = time.monotonic() + 5
+    while job_cache.get(next(iter(job_cache))) != 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    release.set()
+    for thread in [claimer, *waiters]:
+        thread.join(5)
+
+    assert calls == [21]
+    assert results == [42] * 4
+
+
+def test_failed_computation_releases_claim(job_cache):
+    @single_flight
+    def fail():
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        fail()
+    assert len(job_cache) == 0
@@ -0,0 +1,332 @@
+from datetime import date
+from decimal import Decimal
+
+import numpy as np
+import polars as pl
+import pytest
+
+import schemas
+from funcs.calcs_numpy import (
+    summarise_dca_portfolio_value_with_fees_and_interest_vector,
+    summarise_withdrawal_portfolio_value_with_fees_vector,
+)
+from models import Currency, USTreasuryDuration
+from schemas import (
+    AccumulationBacktestStrategy,
+    Allocation,
+    FredFfrSecurity,
+    FredTreasurySecurity,
+    MasSoraSecurity,
+    Portfolio,
+    WithdrawalBacktestStrategy,
+    _on_frontier,
+    _safe_monthly_withdrawal,
+    simulate_backtest_summaries,
+    sweep_backtest_strategies,
+)
+
+FFR = Portfolio(
+    allocations=[Allocation(security=FredFfrSecurity(), weight=Decimal(100))]
+)
+SORA = Portfolio(
+    allocations=[Allocation(security=MasSoraSecurity(), weight=Decimal(100))]
+)
+THREE_FUNDS = Portfolio(
+    allocations=[
+        Allocation(security=FredFfrSecurity(), weight=Decimal("33.33")),
+        Allocation(security=MasSoraSecurity(), weight=Decimal("33.33")),
+        Allocation(
+            security=FredTreasurySecurity(
+                us_treasury_duration=USTreasuryDuration.DURATION_1Y
+            ),
+            weight=Decimal("33.34"),
+        ),
+    ]
+)
+
+
+@pytest.fixture
+def fake_backtest_inputs(monkeypatch):
+    """Random but fixed monthly inputs for each portfolio and currency, so that
+    backtests run without loading data."""
+    inputs: dict[tuple[str, Currency], pl.DataFrame] = {}
+
+    def load_inputs(self) -> pl.DataFrame:
+        key = (self.strategy_portfolio.model_dump_json(), self.currency)
+        if key not in inputs:
+            rng = np.random.default_rng(len(inputs))
+            inputs[key] = pl.DataFrame(
+                {
+                    "date": pl.date_range(
+                        date(2000, 1, 1), date(2019, 12, 1), "1mo", eager=True
+                    ),
+                    "strategy": 100 * np.cumprod(1 + rng.normal(0.005, 0.05, 240)),
+                    "cash": np.cumprod(1 + np.abs(rng.normal(0.002, 0.001, 240))),
+                    "cpi": 100 * np.cumprod(1 + rng.normal(0.002, 0.003, 240)),
+                }
+            )
+        return inputs[key]
+
+    monkeypatch.setattr(AccumulationBacktestStrategy, "load_inputs", load_inputs)
+    monkeypatch.setattr(WithdrawalBacktestStrategy, "load_inputs", load_inputs)
+
+
+@pytest.mark.parametrize("success_rate", [-0.5, 0, 1.01])
+def test_safe_withdrawal_rejects_success_rates_outside_0_to_1(success_rate):
+    with pytest.raises(ValueError):
+        _safe_monthly_withdrawal(np.array([1.0, 2.0]), success_rate)
+
+
+def test_safe_withdrawal_skips_windows_without_a_full_horizon():
+    max_withdrawals = np.array([np.nan, np.nan, 3.0, 1.0, 2.0])
+    assert _safe_monthly_withdrawal(max_withdrawals, 1) == 1.0
+
+
+@pytest.mark.parametrize("max_withdrawals", [np.array([]), np.array([np.nan, np.nan])])
+def test_safe_withdrawal_needs_a_full_horizon(max_withdrawals):
+    with pytest.raises(ValueError):
+        _safe_monthly_withdrawal(max_withdrawals, 0.95)
+
+
+def test_safe_withdrawal_needs_withdrawals():
+    with pytest.raises(ValueError):
+        _safe_monthly_withdrawal(np.array([np.nan, np.inf, np.inf]), 0.95)
+
+
+@pytest.mark.parametrize("success_rate", [0.01, 0.5, 0.9, 0.95, 0.999, 1])
+@pytest.mark.parametrize("size", [1, 7, 100, 1001])
+def test_safe_withdrawal_meets_the_success_rate(success_rate, size):
+    max_withdrawals = np.random.default_rng(size).lognormal(size=size)
+    withdrawal = _safe_monthly_withdrawal(max_withdrawals, success_rate)
+    assert withdrawal in max_withdrawals
+    assert np.mean(max_withdrawals >= withdrawal) >= success_rate
+
+
+def on_frontier_reference(risks: np.ndarray, returns: np.ndarray) -> list[bool]:
+    # Of identical candidates, only the first is on the frontier
+    return [
+        not any(
+            risks[j] <= risks[i]
+            and returns[j] >= returns[i]
+            and (risks[j] < risks[i] or returns[j] > returns[i] or j < i)
+            for j in range(len(risks))
+            if j != i
+        )
+        for i in range(len(risks))
+    ]
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("distinct_values", [3, 10, None])
+def test_on_frontier_matches_brute_force(seed, distinct_values):
+    rng = np.random.default_rng(seed)
+    risks, returns = rng.random((2, 200))
+    if distinct_values is not None:
+        # Coarse values make candidates tie on risk, return or both
+        risks = np.floor(risks * distinct_values)
+        returns = np.floor(returns * distinct_values)
+    assert _on_frontier(risks, returns).tolist() == on_frontier_reference(
+        risks, returns
+    )
+
+
+def accumulation_strategy(
+    portfolio: Portfolio, currency: Currency, dca_duration: int, coast_duration: int
+) -> AccumulationBacktestStrategy:
+    return AccumulationBacktestStrategy(
+        strategy_portfolio=portfolio,
+        currency=currency,
+        investment_amount=1000,
+        monthly_investment=100,
+        coast_duration=coast_duration,
+        dca_duration=dca_duration,
+        dca_interval=3,
+        variable_transaction_fees=0.1,
+        fixed_transaction_fees=1,
+        annualised_holding_fees=0.2,
+    )
+
+
+def withdrawal_strategy(
+    portfolio: Portfolio,
+    currency: Currency,
+    coast_duration: int,
+    withdrawal_duration: int,
+) -> WithdrawalBacktestStrategy:
+    return WithdrawalBacktestStrategy(
+        strategy_portfolio=portfolio,
+        currency=currency,
+        initial_capital=10000,
+        coast_duration=coast_duration,
+        monthly_withdrawal=100,
+        adjust_withdrawals_for_inflation=True,
+        withdrawal_duration=withdrawal_duration,
+        withdrawal_interval=2,
+        variable_transaction_fees=0.1,
+        fixed_transaction_fees=1,
+        annualised_holding_fees=0.2,
+    )
+
+
+def test_backtest_summaries_match_single_strategies(fake_backtest_inputs):
+    # Strategies sharing a phase, portfolio and currency are batched together, so
+    # the batches run in a different order from the strategies
+    strategies = [
+        accumulation_strategy(FFR, Currency.USD, 12, 12),
+        withdrawal_strategy(SORA, Currency.SGD, 0, 60),
+        accumulation_strategy(SORA, Currency.SGD, 36, 0),
+        withdrawal_strategy(FFR, Currency.USD, 12, 120),
+        accumulation_strategy(FFR, Currency.USD, 60, 0),
+        accumulation_strategy(FFR, Currency.SGD, 60, 0),
+        withdrawal_strategy(SORA, Currency.SGD, 0, 12),
+    ]
+    summaries = simulate_backtest_summaries(strategies)
+    assert len(summaries) == len(strategies)
+    for strategy, summary in zip(strategies, summaries):
+        df = strategy.load_inputs()
+        if isinstance(strategy, AccumulationBacktestStrategy):
+            expected = summarise_dca_portfolio_value_with_fees_and_interest_vector(
+                *strategy.kernel_args(df)
+            )
+        else:
+            expected = summarise_withdrawal_portfolio_value_with_fees_vector(
+                *strategy.kernel_args(df)
+            )
+        assert summary.get_column("date").equals(df.get_column("date"))
+        np.testing.assert_array_equal(summary.drop("date").to_numpy(), expected)
+
+
+@pytest.mark.parametrize("fees", [0.23, 0.41, 1.1, 2.5])
+def test_strategy_fees_survive_serialisation(fees):
+    strategy = withdrawal_strategy(FFR, Currency.USD, 0, 12).model_copy(
+        update={"variable_transaction_fees": fees / 100}
+    )
+    assert strategy.model_dump()["variable_transaction_fees"] == fees
+    assert (
+        WithdrawalBacktestStrategy.model_validate_json(strategy.model_dump_json())
+        == strategy
+    )
+
+
+@pytest.fixture
+def swept_strategies(monkeypatch, fake_backtest_inputs):
+    strategies = []
+
+    def record_summaries(sweep_strategies):
+        strategies.extend(sweep_strategies)
+        return simulate_backtest_summaries(sweep_strategies)
+
+    monkeypatch.setattr(schemas, "simulate_backtest_summaries", record_summaries)
+    return strategies
+
+
+def test_sweep_builds_every_combination(swept_strategies):
+    base_strategy = accumulation_strategy(FFR, Currency.USD, 12, 12)
+    results = sweep_backtest_strategies(
+        base_strategy,
+        {"dca_duration": [12, 24], "variable_transaction_fees": [0, 0.5, 1]},
+    )
+    assert results.select("dca_duration", "variable_transaction_fees").rows() == [
+        (12, 0),
+        (12, 0.5),
+        (12, 1),
+        (24, 0),
+        (24, 0.5),
+        (24, 1),
+    ]
+    assert results.get_column("num_windows").to_list() == [216] * 3 + [204] * 3
+    # Swept fees are percents like form inputs, and the base strategy's other
+    # fees are kept as they are
+    assert swept_strategies == [
+        AccumulationBacktestStrategy.model_validate(
+            {
+                **base_strategy.model_dump(),
+                "dca_duration": dca_duration,
+                "variable_transaction_fees": variable_transaction_fees,
+            }
+        )
+        for dca_duration, variable_transaction_fees in results.select(
+            "dca_duration", "variable_transaction_fees"
+        ).rows()
+    ]
+    assert swept_strategies[-1].variable_transaction_fees == 0.01
+    assert all(
+        strategy.annualised_holding_fees == base_strategy.annualised_holding_fees
+        for strategy in swept_strategies
+    )
+
+
+def test_sweep_allocation_weight(swept_strategies):
+    base_strategy = withdrawal_strategy(THREE_FUNDS, Currency.USD, 0, 60)
+    results = sweep_backtest_strategies(
+        base_strategy, {"allocation_weight": [10, 50], "coast_duration": [0]}
+    )
+    assert results.get_column("allocation_weight").to_list() == [10, 50]
+    assert [
+        [allocation.weight for allocation in strategy.strategy_portfolio.allocations]
+        for strategy in swept_strategies
+    ] == [
+        [Decimal("10"), Decimal("44.99"), Decimal("45.01")],
+        [Decimal("50"), Decimal("25.00"), Decimal("25.00")],
+    ]
+
+
+@pytest.mark.parametrize(
+    "parameter_grid",
+    [
+        {"dca_duration": [-5]},
+        {"dca_interval": [0]},
+        {"dca_duration": [12.5]},
+        {"variable_transaction_fees": [-1]},
+        {"allocation_weight": [100]},
+    ],
+)
+def test_sweep_rejects_invalid_values(swept_strategies, parameter_grid):
+    with pytest.raises(ValueError):
+        sweep_backtest_strategies(
+            accumulation_strategy(THREE_FUNDS, Currency.USD, 12, 12), parameter_grid
+        )
+    assert not swept_strategies
+
+
+def test_with_first_weight_shares_the_remainder_by_weight():
+    portfolio = Portfolio(
+        allocations=[
+            Allocation(security=FredFfrSecurity(), weight=Decimal(50)),
+            Allocation(security=MasSoraSecurity(), weight=Decimal(30)),
+            Allocation(
+                security=FredTreasurySecurity(
+                    us_treasury_duration=USTreasuryDuration.DURATION_1Y
+                ),
+                weight=Decimal(20),
+            ),
+        ]
+    )
+    reweighted = portfolio.with_first_weight(Decimal(40))
+    assert [allocation.weight for allocation in reweighted.allocations] == [
+        Decimal(40),
+        Decimal(36),
+        Decimal(24),
+    ]
+    assert [allocation.security for allocation in reweighted.allocations] == [
+        allocation.security for allocation in portfolio.allocations
+    ]
+    assert portfolio.allocations[0].weight == 50
+
+
+@pytest.mark.parametrize("weight", ["0.01", "12.34", "66.67", "99.98"])
+def test_with_first_weight_sums_to_100(weight):
+    reweighted = THREE_FUNDS.with_first_weight(Decimal(weight))
+    weights = [allocation.weight for allocation in reweighted.allocations]
+    assert weights[0] == Decimal(weight)
+    assert sum(weights) == 100
+    assert all(weight == weight.quantize(Decimal("0.01")) for weight in weights)
+
+
+@pytest.mark.parametrize(
+    ("portfolio", "weight"),
+    [(FFR, 50), (THREE_FUNDS, 0), (THREE_FUNDS, 100), (THREE_FUNDS, "99.99")],
+)
+def test_with_first_weight_rejects_invalid_weights(portfolio, weight):
+    with pytest.raises(ValueError):
+        portfolio.with_first_weight(Decimal(weight))
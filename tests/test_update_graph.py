@@ -0,0 +1,392 @@
+import calendar
+from datetime import datetime, timedelta
+
+import numpy as np
+import polars as pl
+import pytest
+
+import update_graph
+from models import Currency, Interval, ReturnAnnualisation, ReturnDuration
+from update_graph import (
+    HISTOGRAM_MAX_BINS,
+    RETURN_DURATION_MONTHS,
+    SeriesIndex,
+    _get_scaling_factor,
+    downsample_min_max,
+    get_box_statistics,
+    get_histogram_bin_edges,
+    get_visible_range,
+)
+
+
+def make_series(values: np.ndarray) -> pl.DataFrame:
+    dates = np.datetime64("2000-01-01") + np.arange(values.size)
+    return pl.DataFrame({"date": dates, "price": values})
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 8, 37, 64])
+def test_range_min_max_matches_brute_force(size):
+    values = np.random.default_rng(size).normal(size=size)
+    index = SeriesIndex(make_series(values))
+    for start in range(size):
+        for stop in range(start + 1, size + 1):
+            window = values[start:stop]
+            assert index.range_min_max(slice(start, stop)) == (
+                window.min(),
+                window.max(),
+            )
+
+
+def test_range_min_max_of_empty_window():
+    index = SeriesIndex(make_series(np.arange(5.0)))
+    assert index.range_min_max(slice(2, 2)) is None
+    assert index.range_min_max(slice(5, 5)) is None
+
+
+# Series over different spans, with weekends missing from the second one
+VIEW_SERIES = {
+    "first": ("2000-01-01", "2000-03-01", 1),
+    "second": ("2000-02-01", "2000-06-01", 1),
+    "third": ("2000-01-15", "2000-04-15", 7),
+}
+VIEW_RANGES = [
+    ("1999-06-01", "1999-12-31"),
+    ("2000-07-01", "2001-01-01"),
+    ("1999-12-01", "2000-08-01"),
+    ("2000-02-10", "2000-02-20"),
+    ("2000-02-14", "2000-02-14"),
+    ("2000-02-13", "2000-02-13"),
+    ("2000-01-01", "2000-01-01"),
+    ("2000-06-01", "2000-06-01"),
+    ("2000-02-29", "2000-03-20"),
+]
+
+
+def make_view_series() -> dict[str, tuple[np.ndarray, np.ndarray]]:
+    rng = np.random.default_rng(7)
+    series = {}
+    for column, (start, end, step) in VIEW_SERIES.items():
+        dates = np.arange(start, end, step, dtype="datetime64[D]")
+        if column == "second":
+            dates = dates[np.is_busday(dates)]
+        values = 100 * np.cumprod(1 + rng.normal(0, 0.02, dates.size))
+        series[column] = (dates.astype("datetime64[ms]"), values)
+    return series
+
+
+def make_series_indexes(
+    series: dict[str, tuple[np.ndarray, np.ndarray]],
+) -> dict[str, SeriesIndex]:
+    return {
+        column: SeriesIndex(pl.DataFrame({"date": dates, "price": values}))
+        for column, (dates, values) in series.items()
+    }
+
+
+def in_view(dates: np.ndarray, start_date: str, end_date: str) -> np.ndarray:
+    return (dates >= np.datetime64(start_date)) & (dates <= np.datetime64(end_date))
+
+
+@pytest.mark.parametrize(("start_date", "end_date"), VIEW_RANGES)
+@pytest.mark.parametrize(
+    ("percent_scale", "log_scale"), [(False, False), (True, False), (True, True)]
+)
+def test_visible_range_matches_linear_scan(
+    start_date, end_date, percent_scale, log_scale
+):
+    series = make_view_series()
+    range_mins = []
+    range_maxs = []
+    for dates, values in series.values():
+        visible_values = values[in_view(dates, start_date, end_date)]
+        if visible_values.size == 0:
+            continue
+        if percent_scale:
+            visible_values = visible_values / visible_values[0] - (not log_scale)
+        range_mins.append(visible_values.min())
+        range_maxs.append(visible_values.max())
+    expected = (min(range_mins), max(range_maxs)) if range_mins else (np.nan, np.nan)
+    np.testing.assert_allclose(
+        get_visible_range(
+            make_series_indexes(series), start_date, end_date, percent_scale, log_scale
+        ),
+        expected,
+        rtol=1e-15,
+    )
+
+
+def scaling_factor_reference(
+    series: dict[str, tuple[np.ndarray, np.ndarray]],
+    prev_start_date: str,
+    start_date: str,
+    end_date: str,
+    yaxis_min: float,
+    yaxis_max: float,
+    log_scale: bool,
+) -> float:
+    def rebase(values: np.ndarray, base: float) -> np.ndarray:
+        return np.log10(values / base) if log_scale else values / base - 1
+
+    def zoom_basis(candidates: dict[str, np.ndarray]) -> str | None:
+        scores = {
+            column: (values.max() - values.min()) * values.size
+            for column, values in candidates.items()
+            if values.size
+        }
+        return max(scores, key=scores.__getitem__) if scores else None
+
+    bases = {
+        column: values[dates >= np.datetime64(prev_start_date)][0]
+        for column, (dates, values) in series.items()
+        if (dates >= np.datetime64(prev_start_date)).any()
+    }
+    windows = {
+        column: rebase(values[in_view(dates, start_date, end_date)], bases[column])
+        for column, (dates, values) in series.items()
+        if column in bases
+    }
+    basis = (
+        zoom_basis(
+            {
+                column: values[(values >= yaxis_min) & (values <= yaxis_max)]
+                for column, values in windows.items()
+            }
+        )
+        or zoom_basis(windows)
+        or zoom_basis(
+            {column: rebase(series[column][1], base) for column, base in bases.items()}
+        )
+        or next(iter(series))
+    )
+    dates, values = series[basis]
+    later_values = values[dates >= np.datetime64(start_date)]
+    if basis not in bases or later_values.size == 0:
+        return np.nan
+    return rebase(later_values[0], bases[basis]).item()
+
+
+@pytest.mark.parametrize(("start_date", "end_date"), VIEW_RANGES)
+@pytest.mark.parametrize("prev_start_date", ["1999-01-01", "2000-02-14", "2000-05-01"])
+@pytest.mark.parametrize(("yaxis_min", "yaxis_max"), [(-0.05, 0.05), (5.0, 6.0)])
+@pytest.mark.parametrize("log_scale", [False, True])
+def test_scaling_factor_matches_linear_scan(
+    start_date, end_date, prev_start_date, yaxis_min, yaxis_max, log_scale
+):
+    series = make_view_series()
+    args = (prev_start_date, start_date, end_date, yaxis_min, yaxis_max, log_scale)
+    np.testing.assert_allclose(
+        _get_scaling_factor(make_series_indexes(series), *args),
+        scaling_factor_reference(series, *args),
+        rtol=1e-15,
+    )
+
+
+def downsample_min_max_reference(
+    df: pl.DataFrame, start_date: str, end_date: str, num_buckets: int
+) -> pl.DataFrame:
+    df = df.drop_nulls()
+    days = df.get_column("date").to_numpy().astype("datetime64[D]").astype(int)
+    start_day, end_day = np.array([start_date, end_date], dtype="datetime64[D]")
+    start_day, end_day = int(start_day.astype(int)), int(end_day.astype(int))
+    buckets: dict[int, list[int]] = {}
+    for row, day in enumerate(days):
+        if start_day <= day <= end_day:
+            bucket = (day - start_day) * num_buckets // max(end_day - start_day, 1)
+        else:
+            bucket = (
+                num_buckets
+                + 1
+                + (day - days.min()) * num_buckets // max(days.max() - days.min(), 1)
+            )
+        buckets.setdefault(bucket, []).append(row)
+    values = df.get_column("price").to_numpy()
+    kept_rows = {0, df.height - 1}
+    for rows in buckets.values():
+        kept_rows.add(rows[np.argmin(values[rows])])
+        kept_rows.add(rows[np.argmax(values[rows])])
+    return df[sorted(kept_rows)]
+
+
+@pytest.mark.parametrize(
+    ("start_date", "end_date"),
+    [
+        ("2003-01-01", "2003-06-30"),
+        ("1990-01-01", "2030-01-01"),
+        ("2010-01-01", "2010-12-31"),
+        ("2005-05-05", "2005-05-05"),
+    ],
+)
+def test_downsample_min_max_matches_brute_force(start_date, end_date):
+    values = np.random.default_rng(8).normal(size=5000)
+    values[[10, 2000, 4999]] = np.nan
+    df = make_series(100 + np.cumsum(values)).with_columns(
+        pl.col("date").cast(pl.Datetime("ms")), pl.col("price").fill_nan(None)
+    )
+    downsampled = downsample_min_max(df, "price", start_date, end_date, 100)
+    assert downsampled.equals(
+        downsample_min_max_reference(df, start_date, end_date, 100)
+    )
+    non_null = df.drop_nulls()
+    assert downsampled.row(0) == non_null.row(0)
+    assert downsampled.row(-1) == non_null.row(-1)
+    assert downsampled.height < df.height // 10
+
+
+@pytest.mark.parametrize("size", [1, 50, 200])
+def test_downsample_min_max_keeps_short_series(size):
+    values = np.arange(size, dtype=float)
+    values[0] = np.nan
+    df = make_series(values).with_columns(pl.col("price").fill_nan(None))
+    assert downsample_min_max(df, "price", "2000-01-01", "2000-01-10", 100).equals(df)
+
+
+def make_returns(seed: int) -> pl.DataFrame:
+    rng = np.random.default_rng(seed)
+    first = rng.normal(0.05, 0.1, 1000)
+    first[:20] = np.nan
+    return pl.DataFrame(
+        {"first": first, "second": rng.standard_t(3, 1000) * 0.2}
+    ).fill_nan(None)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_histogram_bins_count_every_return(seed):
+    df = make_returns(seed)
+    bin_edges = get_histogram_bin_edges(df)
+    all_values = df.unpivot().get_column("value").drop_nulls().to_numpy()
+    np.testing.assert_array_equal(
+        bin_edges, np.histogram_bin_edges(all_values, bins="auto")
+    )
+    for column in df.columns:
+        values = df.get_column(column).drop_nulls().to_numpy()
+        # Bins are half open, except the last which also holds the largest edge
+        counts = [
+            ((values >= lower) & (values < upper)).sum()
+            for lower, upper in zip(bin_edges[:-1], bin_edges[1:])
+        ]
+        counts[-1] += (values == bin_edges[-1]).sum()
+        np.testing.assert_array_equal(np.histogram(values, bins=bin_edges)[0], counts)
+        assert sum(counts) == values.size
+
+
+def test_histogram_bins_are_capped():
+    values = np.random.default_rng(9).normal(size=100_000)
+    values[0] = 1000
+    bin_edges = get_histogram_bin_edges(pl.DataFrame({"first": values}))
+    assert bin_edges.size == HISTOGRAM_MAX_BINS + 1
+    assert (bin_edges[0], bin_edges[-1]) == (values.min(), values.max())
+
+
+def test_histogram_bins_of_no_returns():
+    df = pl.DataFrame({"first": [None, None]}, schema={"first": pl.Float64})
+    np.testing.assert_array_equal(get_histogram_bin_edges(df), [-0.5, 0.5])
+
+
+@pytest.mark.parametrize("seed", range(3))
+@pytest.mark.parametrize("column", ["first", "second"])
+def test_box_statistics_match_numpy(seed, column):
+    series = make_returns(seed).get_column(column)
+    values = series.drop_nulls().to_numpy()
+    q1, median, q3 = np.quantile(values, [0.25, 0.5, 0.75])
+    is_outlier = (values < q1 - 1.5 * (q3 - q1)) | (values > q3 + 1.5 * (q3 - q1))
+    statistics = get_box_statistics(series)
+    assert statistics["q1"] == [q1]
+    assert statistics["median"] == [np.median(values)]
+    assert statistics["q3"] == [q3]
+    assert statistics["lowerfence"] == [values[~is_outlier].min()]
+    assert statistics["upperfence"] == [values[~is_outlier].max()]
+    assert statistics["x"] == [values[is_outlier].tolist()]
+    if column == "second":
+        assert statistics["x"][0]
+
+
+def test_box_statistics_of_no_returns():
+    assert get_box_statistics(pl.Series([None], dtype=pl.Float64)) == {"x": [None]}
+
+
+def test_drawdown_episodes(monkeypatch):
+    prices = np.array([100, 110, 99, 88, 110, 121, 115, 121, 130, 117], dtype=float)
+    series = make_series(prices).rename({"price": "holding"})
+    monkeypatch.setattr(update_graph, "load_holding_series", lambda *args: series)
+    update_graph.get_drawdowns.cache_clear()
+    update_graph.get_drawdown_episodes.cache_clear()
+    episodes = update_graph.get_drawdown_episodes(
+        "holding", Interval.DAILY, Currency.USD, False
+    )
+    update_graph.get_drawdowns.cache_clear()
+    update_graph.get_drawdown_episodes.cache_clear()
+
+    dates = series["date"]
+    assert episodes["peak_date"].to_list() == [dates[1], dates[8], dates[5]]
+    assert episodes["trough_date"].to_list() == [dates[3], dates[9], dates[6]]
+    assert episodes["recovery_date"].to_list() == [dates[4], None, dates[7]]
+    np.testing.assert_allclose(episodes["depth"], [-0.2, -0.1, 115 / 121 - 1])
+    # The drawdown that has not recovered lasts until the latest price
+    assert episodes["duration"].to_list() == [3, 1, 2]
+    assert episodes["recovery_time"].to_list() == [1, 0, 1]
+
+
+def months_before(day: datetime, months: int) -> datetime:
+    year, month = divmod(day.year * 12 + day.month - 1 - months, 12)
+    last_day = calendar.monthrange(year, month + 1)[1]
+    return day.replace(year=year, month=month + 1, day=min(day.day, last_day))
+
+
+@pytest.mark.parametrize(
+    "return_duration",
+    [
+        ReturnDuration.DURATION_1MO,
+        ReturnDuration.DURATION_3MO,
+        ReturnDuration.DURATION_1Y,
+    ],
+)
+def test_daily_rolling_returns_match_brute_force(monkeypatch, return_duration):
+    days = np.arange("2000-01-03", "2003-01-01", dtype="datetime64[D]")
+    days = days[
+        np.is_busday(days)
+        # A holiday, and a gap of more than a week in the data
+        & (days != np.datetime64("2001-01-15"))
+        & ((days < np.datetime64("2001-06-01")) | (days > np.datetime64("2001-06-20")))
+    ]
+    prices = 100 * np.cumprod(1 + np.random.default_rng(0).normal(0, 0.01, days.size))
+    series = pl.DataFrame({"date": days.astype("datetime64[ms]"), "holding": prices})
+    monkeypatch.setattr(update_graph, "load_holding_series", lambda *args: series)
+    update_graph.get_rolling_returns.cache_clear()
+    rolling_returns = update_graph.get_rolling_returns(
+        "holding",
+        Interval.DAILY,
+        Currency.USD,
+        False,
+        return_duration,
+        ReturnAnnualisation.CUMULATIVE,
+    )
+    update_graph.get_rolling_returns.cache_clear()
+
+    months = RETURN_DURATION_MONTHS[return_duration]
+    dates = series.get_column("date").to_list()
+    expected = []
+    for day, price in zip(dates, prices):
+        lookup_date = months_before(day, months)
+        # The last price on or before the lookback date, at most a week before it
+        base = next(
+            (
+                base_price
+                for base_day, base_price in zip(dates[::-1], prices[::-1])
+                if lookup_date - timedelta(weeks=1) <= base_day <= lookup_date
+            ),
+            None,
+        )
+        if base is not None:
+            expected.append((day, price / base - 1))
+    assert rolling_returns.get_column("date").to_list() == [day for day, _ in expected]
+    np.testing.assert_allclose(
+        rolling_returns.get_column("holding"), [value for _, value in expected]
+    )
+    # Lookback dates more than a week into the gap have no base price
+    in_gap = [
+        day
+        for day in dates
+        if datetime(2001, 6, 8) <= months_before(day, months) <= datetime(2001, 6, 20)
+    ]
+    assert in_gap
+    assert not set(in_gap) & set(rolling_returns.get_column("date").to_list())
@@ -1,5 +1,5 @@
 import math
-from functools import cached_property
+from functools import cached_property, lru_cache, reduce
 from typing import Annotated, Generic, Literal, NotRequired, TypedDict, TypeVar
 
 import numpy as np
@@ -10,7 +10,9 @@ from pydantic import BaseModel, ConfigDict, Field, Json, TypeAdapter, computed_f
 
 from funcs.loaders_pl import add_bmonth_end
 from models import (
+    Currency,
     DistributionChartType,
+    DrawdownPresentation,
     Interval,
     ReturnAnnualisation,
     ReturnDuration,
@@ -64,54 +66,445 @@ def filter_end_date(end_date: str | None):
     )
 
 
-def _get_scaling_factor(
-    prev_zoom_df: pl.DataFrame,
-    start_date: str | None,
-    end_date: str | None,
-    yaxis_min: float,
-    yaxis_max: float,
-) -> float:
-    start_date_filter = filter_start_date(start_date)
-    end_date_filter = filter_end_date(end_date)
+@lru_cache
+def load_holding_series(
+    holding_json: str,
+    interval: Interval,
+    currency: Currency,
+    adjust_for_inflation: bool,
+) -> pl.DataFrame:
+    holding: Holding = TypeAdapter(Holding).validate_json(holding_json)
+    return (
+        holding.load_series(interval, currency, adjust_for_inflation)
+        .rename({"price": holding_json})
+        .drop_nulls()
+    )
+
+
+def join_series(dfs: list[pl.DataFrame]) -> pl.DataFrame:
+    return reduce(
+        lambda left, right: left.join(right, on="date", how="full", coalesce=True), dfs
+    ).sort("date")
+
+
+RETURN_DURATION_MONTHS = {
+    "1mo": 1,
+    "3mo": 3,
+    "6mo": 6,
+    "1y": 12,
+    "2y": 24,
+    "3y": 36,
+    "5y": 60,
+    "10y": 120,
+    "15y": 180,
+    "20y": 240,
+    "25y": 300,
+    "30y": 360,
+}
+
+
+def parse_datetime(date_str: str) -> np.datetime64:
+    return np.datetime64(date_str, "ms")
+
+
+class SeriesIndex:
+    """Sorted dates and prices of a loaded series, so the points in a date range are
+    found by binary search instead of filtering the frame.
+
+    Sparse tables hold the min and max of every run of 2**k points, so the min and
+    max of any range are those of the two runs covering it.
+    """
+
+    def __init__(self, df: pl.DataFrame):
+        self.dates = df.get_column("date").to_numpy()
+        self.values = df.drop("date").to_series().to_numpy()
+        self.range_mins = [self.values]
+        self.range_maxs = [self.values]
+        width = 1
+        while 2 * width <= self.values.size:
+            self.range_mins.append(
+                np.minimum(self.range_mins[-1][:-width], self.range_mins[-1][width:])
+            )
+            self.range_maxs.append(
+                np.maximum(self.range_maxs[-1][:-width], self.range_maxs[-1][width:])
+            )
+            width *= 2
+
+    def window(self, start_date: np.datetime64, end_date: np.datetime64) -> slice:
+        return slice(
+            np.searchsorted(self.dates, start_date, side="left"),
+            np.searchsorted(self.dates, end_date, side="right"),
+        )
+
+    def first_value_from(self, date: np.datetime64) -> float | None:
+        start = np.searchsorted(self.dates, date, side="left")
+        return self.values[start] if start < self.values.size else None
+
+    def range_min_max(self, window: slice) -> tuple[float, float] | None:
+        if window.stop <= window.start:
+            return None
+        level = int(window.stop - window.start).bit_length() - 1
+        last_run_start = window.stop - 2**level
+        return (
+            float(
+                min(
+                    self.range_mins[level][window.start],
+                    self.range_mins[level][last_run_start],
+                )
+            ),
+            float(
+                max(
+                    self.range_maxs[level][window.start],
+                    self.range_maxs[level][last_run_start],
+                )
+            ),
+        )
+
+
+def get_visible_range(
+    series_indexes: dict[str, SeriesIndex],
+    start_date: str,
+    end_date: str,
+    percent_scale: bool,
+    log_scale: bool,
+) -> tuple[float, float]:
+    window_start = parse_datetime(start_date)
+    window_end = parse_datetime(end_date)
+    range_mins = []
+    range_maxs = []
+    for index in series_indexes.values():
+        window = index.window(window_start, window_end)
+        range_min_max = index.range_min_max(window)
+        if range_min_max is None:
+            continue
+        range_min, range_max = range_min_max
+        if percent_scale:
+            # Rebasing is increasing, so it maps the range's min and max to those of
+            # the rebased series
+            base = index.values[window.start]
+            offset = 0 if log_scale else 1
+            range_min = range_min / base - offset
+            range_max = range_max / base - offset
+        range_mins.append(range_min)
+        range_maxs.append(range_max)
+    if not range_mins:
+        return np.nan, np.nan
+    return min(range_mins), max(range_maxs)
+
+
+@lru_cache
+def get_series_index(
+    holding_json: str,
+    interval: Interval,
+    currency: Currency,
+    adjust_for_inflation: bool,
+) -> SeriesIndex:
+    return SeriesIndex(
+        load_holding_series(holding_json, interval, currency, adjust_for_inflation)
+    )
+
+
+@lru_cache
+def get_rolling_returns(
+    holding_json: str,
+    interval: Interval,
+    currency: Currency,
+    adjust_for_inflation: bool,
+    return_duration: ReturnDuration,
+    return_annualisation: ReturnAnnualisation,
+) -> pl.DataFrame:
+    df = load_holding_series(holding_json, interval, currency, adjust_for_inflation)
+    months = RETURN_DURATION_MONTHS[return_duration]
+    if interval == Interval.MONTHLY:
+        df = df.with_columns(pl.col(holding_json).pct_change(months))
+    elif interval == Interval.DAILY:
+        # Holidays have no price, so take the last price on or before the lookback
+        # date, but do not reach across gaps in the data
+        df = (
+            df.with_columns(lookup_date=pl.col("date").dt.offset_by(f"-{months}mo"))
+            .join_asof(
+                df,
+                left_on="lookup_date",
+                right_on="date",
+                strategy="backward",
+                tolerance="1w",
+                check_sortedness=False,
+            )
+            .select(
+                "date",
+                pl.col(holding_json) / pl.col(f"{holding_json}_right") - 1,
+            )
+        )
+    else:
+        raise ValueError("Invalid interval")
+    if return_annualisation == ReturnAnnualisation.ANNUALISED:
+        df = df.with_columns(pl.col(holding_json).add(1).pow(12 / months).sub(1))
+    return df.drop_nulls()
+
 
-    masked_df = (
-        prev_zoom_df.filter(start_date_filter & end_date_filter)
-        .drop("date")
+@lru_cache
+def get_calendar_returns(
+    holding_json: str,
+    interval: Interval,
+    currency: Currency,
+    adjust_for_inflation: bool,
+    return_interval: ReturnInterval,
+) -> pl.DataFrame:
+    """Returns and "As of" hover text of each period, for periods ending before the
+    last price in them"""
+    return (
+        load_holding_series(holding_json, interval, currency, adjust_for_inflation)
+        .group_by_dynamic("date", every=return_interval, label="right")
+        .agg(pl.col(holding_json).last(), pl.col("date").last().alias("as_of"))
         .with_columns(
-            pl.when(pl.all().ge(yaxis_min) & pl.all().le(yaxis_max))
-            .then(pl.all())
+            pl.col("date").pipe(add_bmonth_end, -1),
+            pl.col(holding_json).pct_change(),
+        )
+        .select(
+            "date",
+            holding_json,
+            pl.when(pl.col("as_of").ne(pl.col("date")))
+            .then(pl.lit("As of ") + pl.col("as_of").dt.strftime("%d %b %Y"))
             .otherwise(pl.lit(None))
+            .alias(f"{holding_json} hovertext"),
         )
+        .drop_nulls(holding_json)
     )
-    basis_scores = (masked_df.max() - masked_df.min()) * masked_df.count()
 
-    if basis_scores.select(pl.all_horizontal(pl.all().is_null())).item():
-        masked_df = prev_zoom_df.filter(start_date_filter & end_date_filter).drop(
-            "date"
+
+@lru_cache
+def get_drawdowns(
+    holding_json: str,
+    interval: Interval,
+    currency: Currency,
+    adjust_for_inflation: bool,
+) -> pl.DataFrame:
+    return load_holding_series(
+        holding_json, interval, currency, adjust_for_inflation
+    ).with_columns(pl.col(holding_json).truediv(pl.col(holding_json).cum_max()).sub(1))
+
+
+@lru_cache
+def get_drawdown_episodes(
+    holding_json: str,
+    interval: Interval,
+    currency: Currency,
+    adjust_for_inflation: bool,
+) -> pl.DataFrame:
+    """Peak, trough and recovery of each drawdown, deepest first. Drawdowns that have
+    not recovered have no recovery date and last until the latest price."""
+    df = get_drawdowns(holding_json, interval, currency, adjust_for_inflation)
+    # Every new high starts a run, so each run is a peak followed by its drawdown
+    # and the next run starts on the recovery date
+    episodes = (
+        df.with_columns(episode=pl.col(holding_json).eq(0).cum_sum())
+        .group_by("episode", maintain_order=True)
+        .agg(
+            peak_date=pl.col("date").first(),
+            trough_date=pl.col("date").get(pl.col(holding_json).arg_min()),
+            depth=pl.col(holding_json).min(),
         )
-        basis_scores = (masked_df.max() - masked_df.min()) * masked_df.count()
-    if basis_scores.select(pl.all_horizontal(pl.all().is_null())).item():
-        masked_df = prev_zoom_df.drop("date")
-        basis_scores = (masked_df.max() - masked_df.min()) * masked_df.count()
-    if basis_scores.select(pl.all_horizontal(pl.all().is_null())).item():
-        zoom_basis = prev_zoom_df.drop("date").columns[0]
-    else:
-        zoom_basis = (
-            basis_scores.transpose(include_header=True)
-            .filter(pl.col("column_0").eq(pl.col("column_0").max()))["column"]
-            .head(1)
-            .item()
+        .with_columns(recovery_date=pl.col("peak_date").shift(-1))
+        .filter(pl.col("depth") < 0)
+    )
+    end_date = pl.coalesce("recovery_date", pl.lit(df["date"].last()))
+    return episodes.select(
+        "peak_date",
+        "trough_date",
+        "recovery_date",
+        "depth",
+        duration=(end_date - pl.col("peak_date")).dt.total_days(),
+        recovery_time=(end_date - pl.col("trough_date")).dt.total_days(),
+    ).sort("depth")
+
+
+DOWNSAMPLE_BUCKETS = 1000
+SCATTERGL_THRESHOLD = 10_000
+
+SCALE_TRIGGERS = [
+    "log-scale-switch",
+    "auto-scale-switch",
+    "portfolio-log-scale-switch",
+    "portfolio-auto-scale-switch",
+]
+RELAYOUT_TRIGGERS = ["graph", "portfolio-graph"]
+
+
+def triggered_only_by(triggers: list[str]) -> bool:
+    # Several inputs can fire one callback, and ctx.triggered_id only names the first
+    triggered_ids = set(ctx.triggered_prop_ids.values())
+    return bool(triggered_ids) and triggered_ids.issubset(triggers)
+
+
+HISTOGRAM_MAX_BINS = 500
+
+DRAWDOWN_EPISODES_SHOWN = 10
+DAYS_PER_MONTH = 365.25 / 12
+
+
+class ScatterLine(TypedDict):
+    color: NotRequired[str]
+    dash: NotRequired[str | None]
+    width: NotRequired[int]
+
+
+class ScatterTrace(TypedDict):
+    """Scatter trace built straight from NumPy buffers, which plotly's orjson engine
+    serialises without validating or cleaning it first."""
+
+    type: Literal["scatter", "scattergl"]
+    x: np.ndarray
+    y: np.ndarray
+    name: NotRequired[str]
+    mode: NotRequired[str]
+    line: NotRequired[ScatterLine]
+    fill: NotRequired[str]
+    fillcolor: NotRequired[str]
+    legendgroup: NotRequired[str]
+    showlegend: NotRequired[bool]
+    hoverinfo: NotRequired[str]
+    customdata: NotRequired[np.ndarray | None]
+    hovertemplate: NotRequired[str | None]
+
+
+def get_scatter_type(num_points: int) -> Literal["scatter", "scattergl"]:
+    # SVG rendering slows down well before WebGL does, so large figures switch over
+    return "scattergl" if num_points > SCATTERGL_THRESHOLD else "scatter"
+
+
+def downsample_min_max(
+    df: pl.DataFrame,
+    column: str,
+    start_date: str,
+    end_date: str,
+    num_buckets: int = DOWNSAMPLE_BUCKETS,
+) -> pl.DataFrame:
+    series_df = df.select("date", column)
+    if series_df.height <= 2 * num_buckets:
+        return series_df
+    series_df = series_df.drop_nulls()
+
+    # Fine buckets across the visible range and coarse buckets elsewhere, so the
+    # visible detail stays constant and panning still shows the rest of the series
+    day = pl.col("date").dt.epoch("d")
+    start_day = pl.lit(start_date).str.to_datetime().dt.epoch("d")
+    end_day = pl.lit(end_date).str.to_datetime().dt.epoch("d")
+    bucket = (
+        pl.when(day.is_between(start_day, end_day))
+        .then(
+            (day - start_day) * num_buckets // pl.max_horizontal(end_day - start_day, 1)
+        )
+        .otherwise(
+            num_buckets
+            + 1
+            + (day - day.min())
+            * num_buckets
+            // pl.max_horizontal(day.max() - day.min(), 1)
+        )
+    )
+    row_in_bucket = pl.int_range(pl.len()).over(bucket)
+    row = pl.int_range(pl.len())
+    # The first and last points are kept so the line still spans the whole series
+    return series_df.filter(
+        (row_in_bucket == pl.col(column).arg_min().over(bucket))
+        | (row_in_bucket == pl.col(column).arg_max().over(bucket))
+        | (row == 0)
+        | (row == pl.len() - 1)
+    )
+
+
+def get_histogram_bin_edges(df: pl.DataFrame) -> np.ndarray:
+    values = df.unpivot().get_column("value").drop_nulls().to_numpy()
+    if values.size == 0:
+        return np.array([-0.5, 0.5])
+    bin_edges = np.histogram_bin_edges(values, bins="auto")
+    if bin_edges.size > HISTOGRAM_MAX_BINS + 1:
+        bin_edges = np.histogram_bin_edges(values, bins=HISTOGRAM_MAX_BINS)
+    return bin_edges
+
+
+def get_box_statistics(series: pl.Series) -> dict[str, list]:
+    values = series.drop_nulls().to_numpy()
+    if values.size == 0:
+        return {"x": [None]}
+    q1, median, q3 = np.quantile(values, [0.25, 0.5, 0.75])
+    is_inlier = (values >= q1 - 1.5 * (q3 - q1)) & (values <= q3 + 1.5 * (q3 - q1))
+    return {
+        "x": [values[~is_inlier].tolist()],
+        "q1": [q1],
+        "median": [median],
+        "q3": [q3],
+        "lowerfence": [values[is_inlier].min()],
+        "upperfence": [values[is_inlier].max()],
+    }
+
+
+def _rebase(values: np.ndarray, base: float, log_scale: bool) -> np.ndarray:
+    return np.log10(values / base) if log_scale else values / base - 1
+
+
+def _get_zoom_basis(candidates: dict[str, np.ndarray]) -> str | None:
+    basis_scores = {
+        column: (values.max() - values.min()) * values.size
+        for column, values in candidates.items()
+        if values.size
+    }
+    return max(basis_scores, key=basis_scores.__getitem__) if basis_scores else None
+
+
+def _get_scaling_factor(
+    series_indexes: dict[str, SeriesIndex],
+    prev_start_date: str,
+    start_date: str,
+    end_date: str,
+    yaxis_min: float,
+    yaxis_max: float,
+    log_scale: bool,
+) -> float:
+    prev_window_start = parse_datetime(prev_start_date)
+    window_start = parse_datetime(start_date)
+    window_end = parse_datetime(end_date)
+    # Series as displayed in the previous view, rebased to its start date
+    bases = {
+        column: base
+        for column, index in series_indexes.items()
+        if (base := index.first_value_from(prev_window_start)) is not None
+    }
+    windows = {
+        column: _rebase(
+            series_indexes[column].values[
+                series_indexes[column].window(window_start, window_end)
+            ],
+            base,
+            log_scale,
+        )
+        for column, base in bases.items()
+    }
+    zoom_basis = (
+        _get_zoom_basis(
+            {
+                column: values[(values >= yaxis_min) & (values <= yaxis_max)]
+                for column, values in windows.items()
+            }
         )
-    scaling_factor = (
-        prev_zoom_df.filter(start_date_filter)
-        .select(pl.col(zoom_basis).first(ignore_nulls=True))
-        .item()
+        or _get_zoom_basis(windows)
+        or _get_zoom_basis(
+            {
+                column: _rebase(series_indexes[column].values, base, log_scale)
+                for column, base in bases.items()
+            }
+        )
+        or next(iter(series_indexes))
     )
-    return scaling_factor
+    start_value = series_indexes[zoom_basis].first_value_from(window_start)
+    if zoom_basis not in bases or start_value is None:
+        return np.nan
+    return _rebase(np.array(start_value), bases[zoom_basis], log_scale).item()
 
 
 def update_price_graph(
     df: pl.DataFrame,
+    series_indexes: dict[str, SeriesIndex],
     trace_colourmap: dict[str, str],
     trace_options: dict[str, str],
     log_scale: bool,
@@ -144,8 +537,6 @@ def update_price_graph(
 
     layout.update(xaxis_range=[start_date, end_date])
 
-    prev_zoom_df = df
-
     if percent_scale:
         layout.update(title="% Change")
         layout.update(yaxis_tickformat="+.2~%")
@@ -163,14 +554,10 @@ def update_price_graph(
 
         if log_scale:
             df = df.with_columns(pl.all().exclude("date").add(1))
-            max_val = (
-                df.filter(filter_start_date(start_date) & filter_end_date(end_date))
-                .drop("date")
-                .max()
-                .max_horizontal()
-                .item()
+            _, max_val = get_visible_range(
+                series_indexes, start_date, end_date, percent_scale, log_scale
             )
-            if max_val < 3:
+            if np.isnan(max_val) or max_val < 3:
                 ytickvals = [n / 10 for n in range(0, 20)] + [2, 2.2, 2.5, 3]
             else:
                 ytickvals = [0.1, 0.5, 0.8, 1, 1.2, 1.5, 2] + [
@@ -181,18 +568,28 @@ def update_price_graph(
             yticktexts = [f"{tick - 1:+.0%}" for tick in ytickvals]
             layout.update(yaxis_tickvals=ytickvals, yaxis_ticktext=yticktexts)
 
-    data = [
-        go.Scatter(
-            x=df["date"],
-            y=df[column],
-            name=trace_options[column],
-            line=go.scatter.Line(color=trace_colourmap[column]),
-            customdata=(df[column] - 1).round(4)
+    series_dfs = {
+        column: downsample_min_max(df, column, start_date, end_date)
+        for column in df.drop("date").columns
+    }
+    scatter_type = get_scatter_type(
+        sum(series_df.height for series_df in series_dfs.values())
+    )
+    data: list[ScatterTrace] = [
+        {
+            "type": scatter_type,
+            "x": series_df.get_column("date").to_numpy(),
+            "y": series_df.get_column(column).to_numpy(),
+            "name": trace_options[column],
+            "line": {"color": trace_colourmap[column]},
+            "customdata": (series_df.get_column(column) - 1).round(4).to_numpy()
             if log_scale and percent_scale
             else None,
-            hovertemplate="%{customdata:+.2%}" if log_scale and percent_scale else None,
-        )
-        for column in df.drop("date").columns
+            "hovertemplate": "%{customdata:+.2%}"
+            if log_scale and percent_scale
+            else None,
+        }
+        for column, series_df in series_dfs.items()
     ]
 
     if (
@@ -207,12 +604,9 @@ def update_price_graph(
             "portfolio-graph",
         ]
     ):
-        filtered = df.filter(
-            filter_start_date(start_date) & filter_end_date(end_date)
-        ).drop("date")
-
-        min_val = filtered.min().min_horizontal().item()
-        max_val = filtered.max().max_horizontal().item()
+        min_val, max_val = get_visible_range(
+            series_indexes, start_date, end_date, percent_scale, log_scale
+        )
         if log_scale:
             min_val = np.log10(min_val)
             max_val = np.log10(max_val)
@@ -231,26 +625,14 @@ def update_price_graph(
         layout.update(yaxis_range=[yaxis_min, yaxis_max])
         return data, layout
 
-    prev_start_date = pl.lit(prev_layout["xaxis"]["range"][0]).str.to_datetime()
-
-    prev_zoom_df = prev_zoom_df.with_columns(
-        pl.all()
-        .exclude("date")
-        .pipe(
-            lambda col: col.truediv(
-                col.filter(pl.col("date") >= prev_start_date).first(ignore_nulls=True)
-            )
-        )
-        .sub(1)
-    )
-
-    if log_scale:
-        prev_zoom_df = prev_zoom_df.with_columns(
-            pl.all().exclude("date").add(1).log10()
-        )
-
     scaling_factor = _get_scaling_factor(
-        prev_zoom_df, start_date, end_date, yaxis_min, yaxis_max
+        series_indexes,
+        prev_layout["xaxis"]["range"][0],
+        start_date,
+        end_date,
+        yaxis_min,
+        yaxis_max,
+        log_scale,
     )
 
     if not log_scale:
@@ -272,25 +654,91 @@ def update_drawdown_graph(
     df: pl.DataFrame,
     trace_colourmap: dict[str, str],
     trace_options: dict[str, str],
+    relayout_data: RelayoutData,
     layout: go.Layout,
 ):
-    df = df.with_columns(
-        pl.all().exclude("date").pipe(lambda col: col.truediv(col.cum_max()).sub(1))
-    )
+    start_date = str(df["date"].min())
+    end_date = str(df["date"].max())
+    if "xaxis.autorange" not in relayout_data:
+        start_date = relayout_data.get("xaxis.range[0]", start_date)
+        end_date = relayout_data.get("xaxis.range[1]", end_date)
 
     layout.update(
         title="Drawdown",
         yaxis_tickformat=".2%",
     )
 
+    series_dfs = {
+        column: downsample_min_max(df, column, start_date, end_date)
+        for column in df.drop("date").columns
+    }
+    scatter_type = get_scatter_type(
+        sum(series_df.height for series_df in series_dfs.values())
+    )
+    data: list[ScatterTrace] = [
+        {
+            "type": scatter_type,
+            "x": series_df.get_column("date").to_numpy(),
+            "y": series_df.get_column(column).to_numpy(),
+            "name": trace_options[column],
+            "line": {"color": trace_colourmap[column]},
+        }
+        for column, series_df in series_dfs.items()
+    ]
+
+    return data, layout
+
+
+def update_drawdown_episodes_table(
+    episodes: dict[str, pl.DataFrame],
+    trace_colourmap: dict[str, str],
+    trace_options: dict[str, str],
+    layout: go.Layout,
+):
+    df = pl.concat(
+        [
+            episodes_df.head(DRAWDOWN_EPISODES_SHOWN).select(
+                pl.lit(holding).alias("holding"), pl.all()
+            )
+            for holding, episodes_df in episodes.items()
+        ]
+    )
+
+    layout.update(
+        title=f"Deepest {DRAWDOWN_EPISODES_SHOWN} Drawdowns",
+        margin=go.layout.Margin(t=90, b=30, l=10, r=10, autoexpand=True),
+    )
+
+    cell_colours = [trace_colourmap[holding] for holding in df["holding"]]
     data = [
-        go.Scatter(
-            x=df["date"],
-            y=df[column],
-            name=trace_options[column],
-            line=go.scatter.Line(color=trace_colourmap[column]),
+        go.Table(
+            header=go.table.Header(
+                values=[
+                    "Holding",
+                    "Peak",
+                    "Trough",
+                    "Recovery",
+                    "Depth",
+                    "Duration (Months)",
+                    "Recovery Time (Months)",
+                ],
+                align="left",
+            ),
+            cells=go.table.Cells(
+                values=[
+                    [trace_options[holding] for holding in df["holding"]],
+                    df["peak_date"].dt.strftime("%d %b %Y"),
+                    df["trough_date"].dt.strftime("%d %b %Y"),
+                    df["recovery_date"].dt.strftime("%d %b %Y").fill_null("Ongoing"),
+                    df["depth"],
+                    df["duration"] / DAYS_PER_MONTH,
+                    df["recovery_time"] / DAYS_PER_MONTH,
+                ],
+                format=[None, None, None, None, ".2%", ".1f", ".1f"],
+                align="left",
+                line=go.table.cells.Line(color=[cell_colours]),
+            ),
         )
-        for column in df.drop("date").columns
     ]
 
     return data, layout
@@ -300,7 +748,6 @@ def update_rolling_returns_graph(
     df: pl.DataFrame,
     trace_colourmap: dict[str, str],
     trace_options: dict[str, str],
-    interval: Interval,
     return_duration: ReturnDuration,
     return_annualisation: ReturnAnnualisation,
     baseline_trace: str,
@@ -308,56 +755,6 @@ def update_rolling_returns_graph(
     rolling_returns_distribution_chart_type: DistributionChartType,
     layout: go.Layout,
 ):
-    return_durations = {
-        "1mo": 1,
-        "3mo": 3,
-        "6mo": 6,
-        "1y": 12,
-        "2y": 24,
-        "3y": 36,
-        "5y": 60,
-        "10y": 120,
-        "15y": 180,
-        "20y": 240,
-        "25y": 300,
-        "30y": 360,
-    }
-    if interval == Interval.MONTHLY:
-        df = df.with_columns(
-            pl.all().exclude("date").pct_change(return_durations[return_duration])
-        )
-    elif interval == Interval.DAILY:
-        series_names = df.drop("date").columns
-        df = (
-            df.with_columns(
-                lookup_date=pl.col("date")
-                .dt.offset_by(f"-{return_durations[return_duration]}mo")
-                .dt.add_business_days(0, roll="backward")
-            )
-            .join(
-                df,
-                left_on="lookup_date",
-                right_on="date",
-                how="left",
-                maintain_order="left",
-            )
-            .select(
-                "date",
-                *(pl.col(col) / pl.col(f"{col}_right") - 1 for col in series_names),
-            )
-        )
-    else:
-        raise ValueError("Invalid interval")
-    if return_annualisation == ReturnAnnualisation.ANNUALISED:
-        df = df.with_columns(
-            pl.all()
-            .exclude("date")
-            .add(1)
-            .pow(12 / return_durations[return_duration])
-            .sub(1)
-        )
-    df = df.filter(pl.any_horizontal(pl.all().exclude("date").is_not_null()))
-
     layout.update(yaxis_tickformat=".2%")
 
     title = f"{return_duration.label} {return_annualisation.label} Rolling Returns"
@@ -373,16 +770,19 @@ def update_rolling_returns_graph(
     )
 
     if rolling_returns_presentation == RollingReturnsPresentation.TIMESERIES:
-        data = [
-            go.Scatter(
-                x=df["date"],
-                y=df[column],
-                name=trace_options[column],
-                line=go.scatter.Line(
-                    color=trace_colourmap[column],
-                    dash=("dash" if column == baseline_trace else None),
-                ),
-            )
+        scatter_type = get_scatter_type(df.height * (df.width - 1))
+        dates = df.get_column("date").to_numpy()
+        data: list[ScatterTrace] | list[go.Bar] | list[go.Box] = [
+            {
+                "type": scatter_type,
+                "x": dates,
+                "y": df.get_column(column).to_numpy(),
+                "name": trace_options[column],
+                "line": {
+                    "color": trace_colourmap[column],
+                    "dash": "dash" if column == baseline_trace else None,
+                },
+            }
             for column in df.drop("date").columns
         ]
 
@@ -410,31 +810,41 @@ def update_rolling_returns_graph(
             )
             layout.update(
                 barmode="overlay",
+                bargap=0,
                 shapes=[vertical_line],
             )
+
+            # Bin on the server with edges shared by every trace, so only the bin
+            # probabilities are sent instead of every rolling return
+            bin_edges = get_histogram_bin_edges(
+                df.drop("date", baseline_trace, strict=False)
+            )
+            bin_ranges = np.column_stack([bin_edges[:-1], bin_edges[1:]])
             data = [
-                go.Histogram(
-                    x=df[column],
+                go.Bar(
+                    x=(bin_edges[:-1] + bin_edges[1:]) / 2,
+                    y=np.histogram(values, bins=bin_edges)[0] / max(values.size, 1),
+                    width=np.diff(bin_edges),
+                    customdata=bin_ranges,
+                    hovertemplate="%{customdata[0]:+.2%} to %{customdata[1]:+.2%}: %{y:.2%}",
                     name=trace_options[column],
-                    marker=go.histogram.Marker(color=trace_colourmap[column]),
-                    histnorm="probability",
+                    marker=go.bar.Marker(color=trace_colourmap[column]),
                     opacity=0.7,
                     showlegend=True,
                 )
                 for column in df.drop("date").columns
                 if column != baseline_trace
+                for values in [df.get_column(column).drop_nulls().to_numpy()]
             ]
 
             if baseline_trace != "None":
                 data.insert(
                     0,
-                    go.Histogram(
+                    go.Bar(
                         x=[None],
+                        y=[None],
                         name=trace_options[baseline_trace],
-                        marker=go.histogram.Marker(
-                            color=trace_colourmap[baseline_trace]
-                        ),
-                        histnorm="probability",
+                        marker=go.bar.Marker(color=trace_colourmap[baseline_trace]),
                         opacity=0.7,
                         showlegend=True,
                     ),
@@ -445,9 +855,12 @@ def update_rolling_returns_graph(
                 yaxis_autorange="reversed",
             )
 
+            # Quartiles and fences are precomputed, so only the outliers are sent
             data = [
                 go.Box(
-                    x=df[column],
+                    **get_box_statistics(df.get_column(column)),
+                    y=[trace_options[column]],
+                    orientation="h",
                     name=trace_options[column],
                     marker=go.box.Marker(color=trace_colourmap[column]),
                     boxpoints="outliers",
@@ -484,35 +897,15 @@ def update_calendar_returns_graph(
     baseline_trace: str,
     layout: go.Layout,
 ):
-    data_df = (
-        df.sort("date")
-        .group_by_dynamic("date", every=return_interval, label="right")
-        .agg(
-            pl.all().exclude("date").last(ignore_nulls=True),
-        )
-        .with_columns(
-            pl.col("date").pipe(add_bmonth_end, -1),
-            pl.all().exclude("date").pct_change(),
-        )
-        .filter(pl.any_horizontal(pl.all().exclude("date").is_not_null()))
-    )
-    hovertext_df = (
-        df.sort("date")
-        .group_by_dynamic("date", every=return_interval, label="right")
-        .agg(
-            pl.col("date").filter(pl.col(c).is_not_null()).last().alias(c)
-            for c in df.drop("date").columns
-        )
-        .with_columns(pl.col("date").pipe(add_bmonth_end, -1))
-        .with_columns(
-            pl.when(pl.all().exclude("date").ne(pl.col("date")))
-            .then(
-                (
-                    pl.lit("As of ") + pl.all().exclude("date").dt.strftime("%d %b %Y")
-                ).name.keep()
-            )
-            .otherwise(pl.lit(None))
-        )
+    series_columns = [
+        column
+        for column in df.drop("date").columns
+        if not column.endswith(" hovertext")
+    ]
+    data_df = df.select("date", *series_columns)
+    hovertext_df = df.select(
+        "date",
+        *(pl.col(f"{column} hovertext").alias(column) for column in series_columns),
     )
 
     layout.update(
@@ -569,17 +962,31 @@ GraphTypeT = TypeVar("GraphTypeT", bound=YVar)
 class BaseGraphParam(BaseModel, Generic[GraphTypeT]):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    df: pl.DataFrame
+    holdings: list[str]
     trace_colourmap: dict[str, str]
+    interval: Interval
+    currency: Currency
+    adjust_for_inflation: bool
     uirevision: str
 
     y_var: GraphTypeT
 
     @cached_property
-    def trace_options(self) -> dict[str, str]:
-        holdings = TypeAdapter(list[Json[Holding]]).validate_python(
-            self.df.drop("date").columns
+    def df(self) -> pl.DataFrame:
+        # Series are loaded and cached one by one, so a newly selected holding only
+        # costs its own load and the join
+        return join_series(
+            [
+                load_holding_series(
+                    holding, self.interval, self.currency, self.adjust_for_inflation
+                )
+                for holding in self.holdings
+            ]
         )
+
+    @cached_property
+    def trace_options(self) -> dict[str, str]:
+        holdings = TypeAdapter(list[Json[Holding]]).validate_python(self.holdings)
         return {
             holding.model_dump_json(): holding.label.replace("\n", "<br>")
             for holding in holdings
@@ -600,6 +1007,10 @@ class BaseGraphParam(BaseModel, Generic[GraphTypeT]):
             margin=go.layout.Margin(t=90, b=30, l=10, r=90, autoexpand=True),
         )
 
+    @property
+    def traces_unchanged(self) -> bool:
+        return triggered_only_by(RELAYOUT_TRIGGERS)
+
 
 class PriceGraphParams(BaseGraphParam[Literal[YVar.PRICE]]):
     log_scale: bool
@@ -608,9 +1019,32 @@ class PriceGraphParams(BaseGraphParam[Literal[YVar.PRICE]]):
     relayout_data: RelayoutData
     prev_layout: PrevLayout | None
 
-    def update_graph(self) -> tuple[list[go.Scatter], go.Layout]:
+    @cached_property
+    def series_indexes(self) -> dict[str, SeriesIndex]:
+        return {
+            holding: get_series_index(
+                holding, self.interval, self.currency, self.adjust_for_inflation
+            )
+            for holding in self.holdings
+        }
+
+    @property
+    def traces_unchanged(self) -> bool:
+        # Percent scale rebases the traces to the visible range and daily series are
+        # downsampled to it, so only the axes of the other figures change
+        if self.prev_layout is None or self.percent_scale:
+            return False
+        if triggered_only_by(SCALE_TRIGGERS):
+            return True
+        return (
+            triggered_only_by(SCALE_TRIGGERS + RELAYOUT_TRIGGERS)
+            and self.df.height <= 2 * DOWNSAMPLE_BUCKETS
+        )
+
+    def update_graph(self) -> tuple[list[ScatterTrace], go.Layout]:
         return update_price_graph(
             self.df,
+            self.series_indexes,
             self.trace_colourmap,
             self.trace_options,
             self.log_scale,
@@ -623,14 +1057,57 @@ class PriceGraphParams(BaseGraphParam[Literal[YVar.PRICE]]):
 
 
 class DrawdownGraphParams(BaseGraphParam[Literal[YVar.DRAWDOWN]]):
-    def update_graph(self) -> tuple[list[go.Scatter], go.Layout]:
+    drawdown_presentation: DrawdownPresentation
+    relayout_data: RelayoutData
+
+    @cached_property
+    def df(self) -> pl.DataFrame:
+        return join_series(
+            [
+                get_drawdowns(
+                    holding, self.interval, self.currency, self.adjust_for_inflation
+                )
+                for holding in self.holdings
+            ]
+        )
+
+    @property
+    def traces_unchanged(self) -> bool:
+        if not triggered_only_by(RELAYOUT_TRIGGERS):
+            return False
+        return (
+            self.drawdown_presentation == DrawdownPresentation.EPISODES
+            or self.df.height <= 2 * DOWNSAMPLE_BUCKETS
+        )
+
+    def update_graph(
+        self,
+    ) -> tuple[list[ScatterTrace] | list[go.Table], go.Layout]:
+        if self.drawdown_presentation == DrawdownPresentation.EPISODES:
+            return update_drawdown_episodes_table(
+                {
+                    holding: get_drawdown_episodes(
+                        holding,
+                        self.interval,
+                        self.currency,
+                        self.adjust_for_inflation,
+                    )
+                    for holding in self.holdings
+                },
+                self.trace_colourmap,
+                self.trace_options,
+                self.layout,
+            )
         return update_drawdown_graph(
-            self.df, self.trace_colourmap, self.trace_options, self.layout
+            self.df,
+            self.trace_colourmap,
+            self.trace_options,
+            self.relayout_data,
+            self.layout,
         )
 
 
 class RollingReturnsGraphParams(BaseGraphParam[Literal[YVar.ROLLING_RETURNS]]):
-    interval: Interval
     return_duration: ReturnDuration
     return_annualisation: ReturnAnnualisation
     baseline_trace: str
@@ -639,12 +1116,27 @@ class RollingReturnsGraphParams(BaseGraphParam[Literal[YVar.ROLLING_RETURNS]]):
 
     def update_graph(
         self,
-    ) -> tuple[list[go.Scatter] | list[go.Histogram] | list[go.Box], go.Layout]:
+    ) -> tuple[
+        list[ScatterTrace] | list[go.Bar] | list[go.Box],
+        go.Layout,
+    ]:
+        df = join_series(
+            [
+                get_rolling_returns(
+                    holding,
+                    self.interval,
+                    self.currency,
+                    self.adjust_for_inflation,
+                    self.return_duration,
+                    self.return_annualisation,
+                )
+                for holding in self.holdings
+            ]
+        )
         return update_rolling_returns_graph(
-            self.df,
+            df,
             self.trace_colourmap,
             self.trace_options,
-            self.interval,
             self.return_duration,
             self.return_annualisation,
             self.baseline_trace,
@@ -661,8 +1153,20 @@ class CalendarReturnsGraphParams(BaseGraphParam[Literal[YVar.CALENDAR_RETURNS]])
     def update_graph(
         self,
     ) -> tuple[list[go.Bar], go.Layout]:
+        df = join_series(
+            [
+                get_calendar_returns(
+                    holding,
+                    self.interval,
+                    self.currency,
+                    self.adjust_for_inflation,
+                    self.return_interval,
+                )
+                for holding in self.holdings
+            ]
+        )
         return update_calendar_returns_graph(
-            self.df,
+            df,
             self.trace_colourmap,
             self.trace_options,
             self.return_interval,
@@ -0,0 +1,188 @@
+import os
+import time
+
+import numpy as np
+from pydantic import TypeAdapter
+
+from funcs.calcs_numpy import (
+    calculate_dca_portfolio_value_path,
+    calculate_dca_portfolio_value_with_fees_and_interest_vector,
+    calculate_rebalanced_portfolio_value_path,
+    calculate_rebalanced_portfolio_value_paths,
+    calculate_withdrawal_portfolio_value_path,
+    calculate_withdrawal_portfolio_value_with_fees_vector,
+    compute_bootstrap_max_drawdown,
+    generate_bootstrap_indices,
+    simulate_bootstrap_accumulation,
+    simulate_bootstrap_withdrawal,
+    solve_bootstrap_max_monthly_withdrawal,
+    solve_withdrawal_max_monthly_withdrawal_vector,
+    summarise_dca_portfolio_value_batch,
+    summarise_dca_portfolio_value_with_fees_and_interest_vector,
+    summarise_withdrawal_portfolio_value_batch,
+    summarise_withdrawal_portfolio_value_with_fees_vector,
+)
+from models import (
+    Currency,
+    Interval,
+    MSCIRegionalIndex,
+    MSCISize,
+    MSCIStyle,
+    OthersIndex,
+    TaxTreatment,
+)
+from schemas import MsciSecurity, Security, SpxSecurity
+
+DEFAULT_WARMUP_SECURITIES: list[Security] = [
+    MsciSecurity(
+        msci_base_index=MSCIRegionalIndex.WORLD,
+        msci_size=MSCISize.STANDARD,
+        msci_style=MSCIStyle.BLEND,
+        msci_tax_treatment=TaxTreatment.NET,
+    ),
+    SpxSecurity(others_index=OthersIndex.SPX, others_tax_treatment=TaxTreatment.NET),
+]
+WARMUP_CURRENCIES = [Currency.USD, Currency.SGD]
+WARMUP_INTERVALS = [Interval.MONTHLY, Interval.DAILY]
+
+
+def get_warmup_securities() -> list[Security]:
+    securities_json = os.environ.get("DASHBOARD_WARMUP_SECURITIES")
+    if securities_json is None:
+        return DEFAULT_WARMUP_SECURITIES
+    return TypeAdapter(list[Security]).validate_json(securities_json)
+
+
+def preload_securities(securities: list[Security]):
+    for security in securities:
+        for currency in WARMUP_CURRENCIES:
+            for interval in WARMUP_INTERVALS:
+                security.load_series(interval, currency, False)
+
+
+def run_kernels():
+    num_months = 25
+    horizon = 12
+    monthly_returns = np.full(num_months, 0.01)
+    cpi = np.linspace(100.0, 102.0, num_months)
+    cash_returns = np.zeros(num_months)
+    dca_args = (6, 1, horizon, 1000.0, 100.0, True, 0.001, 1.0, 0.002, True)
+    withdrawal_args = (0, horizon, 1, 1000.0, 10.0, cpi, 0.001, 1.0, 0.002, True, True)
+
+    calculate_dca_portfolio_value_with_fees_and_interest_vector(
+        monthly_returns, *dca_args, cpi, cash_returns
+    )
+    calculate_dca_portfolio_value_path(0, monthly_returns, *dca_args, cpi, cash_returns)
+    summarise_dca_portfolio_value_with_fees_and_interest_vector(
+        monthly_returns, *dca_args, cpi, cash_returns
+    )
+    summarise_dca_portfolio_value_batch(
+        monthly_returns,
+        cpi,
+        cash_returns,
+        np.array([6]),
+        np.array([1]),
+        np.array([horizon]),
+        np.array([1000.0]),
+        np.array([100.0]),
+        np.array([True]),
+        np.array([0.001]),
+        np.array([1.0]),
+        np.array([0.002]),
+        np.array([True]),
+    )
+
+    calculate_withdrawal_portfolio_value_with_fees_vector(
+        monthly_returns, *withdrawal_args
+    )
+    calculate_withdrawal_portfolio_value_path(0, monthly_returns, *withdrawal_args)
+    summarise_withdrawal_portfolio_value_with_fees_vector(
+        monthly_returns, *withdrawal_args
+    )
+    summarise_withdrawal_portfolio_value_batch(
+        monthly_returns,
+        cpi,
+        np.array([0]),
+        np.array([horizon]),
+        np.array([1]),
+        np.array([1000.0]),
+        np.array([10.0]),
+        np.array([0.001]),
+        np.array([1.0]),
+        np.array([0.002]),
+        np.array([True]),
+        np.array([True]),
+    )
+    solve_withdrawal_max_monthly_withdrawal_vector(
+        monthly_returns, 0, horizon, 1, 1000.0, cpi, 0.001, 1.0, 0.002, True, 0.01
+    )
+
+    indices = generate_bootstrap_indices(4, horizon + 1, num_months, 6.0)
+    cpi_returns = np.full(num_months, 0.001)
+    simulate_bootstrap_accumulation(
+        monthly_returns,
+        cpi_returns,
+        cash_returns,
+        indices,
+        6,
+        1,
+        horizon,
+        1000.0,
+        100.0,
+        True,
+        0.001,
+        1.0,
+        0.002,
+        True,
+    )
+    bootstrap_values = simulate_bootstrap_withdrawal(
+        monthly_returns,
+        cpi_returns,
+        indices,
+        0,
+        horizon,
+        1,
+        1000.0,
+        10.0,
+        0.001,
+        1.0,
+        0.002,
+        True,
+        True,
+    )
+    solve_bootstrap_max_monthly_withdrawal(
+        monthly_returns,
+        cpi_returns,
+        indices,
+        0,
+        horizon,
+        1,
+        1000.0,
+        0.001,
+        1.0,
+        0.002,
+        True,
+        0.01,
+    )
+    compute_bootstrap_max_drawdown(bootstrap_values)
+
+    asset_returns = np.full((num_months, 2), 0.01)
+    rebalance = np.ones(num_months, dtype=np.bool_)
+    calculate_rebalanced_portfolio_value_path(
+        asset_returns, np.array([0.6, 0.4]), rebalance, 0.05
+    )
+    calculate_rebalanced_portfolio_value_paths(
+        asset_returns, np.array([[0.6, 0.4]]), rebalance, 0.05
+    )
+
+
+def warm_up() -> float:
+    start = time.perf_counter()
+    if os.environ.get("DASHBOARD_WARMUP", "1") != "0":
+        preload_securities(get_warmup_securities())
+        run_kernels()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    print(f"Warm-up finished in {warm_up():.2f}s")